@@ -21,6 +21,7 @@ from __future__ import annotations
 import argparse
 import sys
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 from urllib.parse import urljoin, urlparse, urlunparse
@@ -90,11 +91,13 @@ def read_input_urls(input_path: Path) -> List[str]:
     return urls
 
 
+@lru_cache(maxsize=4096)
 def normalize_url(u: str, keep_trailing_slash: bool = False) -> str:
     """Canonicalize a URL: lowercase host, drop query/fragment.
 
     By default, also trim trailing slash (except for root path). When
     keep_trailing_slash=True, preserve the path exactly as provided.
+    Cached: discovered and expanded candidates repeat across input URLs.
     """
     try:
         p = urlparse(u)
@@ -157,6 +160,7 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--aggressive-static", action="store_true", help="Enable static++ heuristics (Smart mode enables this by default)")
     parser.add_argument("--max-pages-per-domain", type=int, default=10, help="Limit number of candidate pages per domain (default 10)")
     parser.add_argument("--consolidate-per-person", action="store_true", help="Produce consolidated per-person exports (1 row per person)")
+    parser.add_argument("--consolidate-workers", type=int, default=1, help="Processes for per-person consolidation of large runs (default 1 = in-process)")
     parser.add_argument("--exact-input-only", action="store_true", help="Process only URLs from --input; disable discovery and include_paths expansion")
     # Decision-only flags (do not change default behavior)
     parser.add_argument("--decision-only", action="store_true", help="Write decision-only people artifacts (filtered by --min-level) without affecting base outputs")
@@ -424,7 +428,7 @@ def main(argv: list[str] | None = None) -> int:
     # Always produce per-person consolidation exports in Smart mode (in addition to base exports)
     try:
         deduped = dedupe_contacts_for_export(contacts_for_export)
-        consolidated = consolidate_per_person(deduped)
+        consolidated = consolidate_per_person(deduped, workers=args.consolidate_workers)
         people_csv = exporter.to_people_csv(consolidated)
         people_json = exporter.to_people_json(consolidated)
         print(f"👤 People CSV: {people_csv}")
@@ -438,10 +442,10 @@ def main(argv: list[str] | None = None) -> int:
         from src.pipeline.roles import DecisionLevel
         from src.pipeline.export import consolidate_per_person_with_evidence
         # Build unfiltered decision rows to compute baseline count M
-        dm_all_rows = consolidate_per_person_with_evidence(deduped, min_level=None)
+        dm_all_rows = consolidate_per_person_with_evidence(deduped, min_level=None, workers=args.consolidate_workers)
         # Apply threshold only when flag is on
         level = DecisionLevel.from_str(args.min_level)
-        dm_rows = consolidate_per_person_with_evidence(deduped, min_level=(level if args.decision_only else None))
+        dm_rows = consolidate_per_person_with_evidence(deduped, min_level=(level if args.decision_only else None), workers=args.consolidate_workers)
         if args.decision_only and dm_rows:
             # Write artifacts
             dm_csv = exporter.to_decision_people_csv(dm_rows)
@@ -49,7 +49,16 @@ _LEVEL_ORDER = {
 }
 
 
-GENERIC_INBOX_RE = re.compile(r"^(info|contact|office|support|help|hr|jobs|careers|sales|billing|hello|team)@", re.I)
+# Shared-inbox local parts; checked with one hashed lookup on the part before '@'
+GENERIC_INBOX_LOCALPARTS = frozenset({
+    "info", "contact", "office", "support", "help", "hr",
+    "jobs", "careers", "sales", "billing", "hello", "team",
+})
+
+
+def is_generic_inbox(email: str) -> bool:
+    local, at, _ = email.partition("@")
+    return bool(at) and local.lower() in GENERIC_INBOX_LOCALPARTS
 
 # Title patterns
 _POS_C_SUITE = [
@@ -166,7 +175,7 @@ def classify(record: Dict[str, Any]) -> Tuple[DecisionLevel, List[str]]:
     email = record.get("email")
     if isinstance(email, str):
         em = normalize_email(email)
-        if GENERIC_INBOX_RE.match(em):
+        if is_generic_inbox(em):
             reasons.append("email:generic")
 
     title = _extract_title(record)
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Export JSON Schema files from Pydantic models for EGC PoC.
+Export JSON Schema files from Pydantic models (and export dataclasses) for EGC PoC.
 - Draft: 2020-12
 - Sources: src/schemas.py (Contact, Evidence, ContactExport)
 - Outputs: schemas/*.schema.json
@@ -78,7 +78,12 @@ def contact_export_example() -> dict:
 
 
 def save_schema(model, path: Path, title: str, description: str, example: dict):
-    schema = model.model_json_schema()  # pydantic v2
+    if hasattr(model, "model_json_schema"):
+        schema = model.model_json_schema()  # pydantic v2
+    else:
+        # Plain dataclasses (e.g. ContactExport) go through a TypeAdapter
+        from pydantic import TypeAdapter
+        schema = TypeAdapter(model).json_schema()
     schema = add_common_headers(schema, title, description, example)
     path.write_text(json.dumps(schema, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
     print(f"Wrote {path.relative_to(ROOT)}")
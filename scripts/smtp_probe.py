@@ -13,12 +13,20 @@ from __future__ import annotations
 
 import re
 import time
-import smtplib
-from dataclasses import dataclass, asdict
+import threading
+from dataclasses import dataclass
 from typing import Optional, Dict, Any, List, Tuple
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # Fallback to stdlib json
+
 EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
+# How long an empty MX answer is trusted before the domain is resolved again
+NEGATIVE_MX_TTL_SECONDS = 3600
+
 # A small set is sufficient for PoC; can be extended later
 FREE_DOMAINS = {
     "gmail.com",
@@ -49,7 +57,7 @@ def should_skip_domain(domain: str) -> bool:
     return domain.lower() in FREE_DOMAINS
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProbeResult:
     email: str
     domain: str
@@ -61,7 +69,8 @@ class ProbeResult:
     rtt_ms: Optional[int]
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Flat scalars only: skip asdict()'s recursive deep copy
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 def _classify(code: Optional[int], exc: Optional[BaseException] = None) -> str:
@@ -105,9 +114,77 @@ def resolve_mx(domain: str) -> List[str]:
         return []
 
 
-def probe_rcpt(mx_host: str, email: str, timeout: int = 10) -> Dict[str, Any]:
+def _greet(smtp) -> None:
+    """EHLO, upgrading to TLS when the server offers STARTTLS."""
+    smtp.ehlo()
+    # STARTTLS if available
+    try:
+        if hasattr(smtp, "has_extn") and smtp.has_extn("starttls"):
+            smtp.starttls()
+            smtp.ehlo()
+    except Exception:
+        # If STARTTLS fails, continue without it in PoC
+        pass
+
+
+class SmtpSession:
+    """Open SMTP connections reused across probes, one per MX host.
+
+    Each probe runs MAIL/RCPT on the host's open connection and then resets
+    the envelope (RSET), so further addresses skip the TCP/EHLO/STARTTLS
+    handshake. Not thread-safe: every domain worker owns its own session.
+    """
+
+    def __init__(self) -> None:
+        self._conns: Dict[str, Any] = {}
+
+    def rcpt(self, mx_host: str, domain: str, email: str, timeout: int):
+        """Return (code, message) of RCPT TO for ``email`` via ``mx_host``."""
+        smtp = self._conns.pop(mx_host, None)
+        if smtp is not None:
+            try:
+                return self._envelope(mx_host, smtp, domain, email)
+            except Exception:
+                # Server dropped the idle connection: retry once on a fresh one
+                self._quit(smtp)
+        import smtplib
+        smtp = smtplib.SMTP(mx_host, 25, timeout=timeout)
+        try:
+            _greet(smtp)
+            return self._envelope(mx_host, smtp, domain, email)
+        except Exception:
+            self._quit(smtp)
+            raise
+
+    def _envelope(self, mx_host: str, smtp, domain: str, email: str):
+        smtp.mail("<probe@%s>" % domain)
+        reply = smtp.rcpt(f"<{email}>")
+        try:
+            smtp.rset()
+            self._conns[mx_host] = smtp
+        except Exception:
+            self._quit(smtp)
+        return reply
+
+    @staticmethod
+    def _quit(smtp) -> None:
+        try:
+            smtp.quit()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        for smtp in self._conns.values():
+            self._quit(smtp)
+        self._conns.clear()
+
+
+def probe_rcpt(mx_host: str, email: str, timeout: int = 10, session: Optional[SmtpSession] = None) -> Dict[str, Any]:
     """Probe an SMTP MX for RCPT acceptance without sending DATA.
 
+    With ``session`` the connection to ``mx_host`` is taken from and kept in
+    that session; otherwise a connection is opened for this probe only.
+
     Returns a dict compatible with tests with keys:
     - accepts_rcpt: bool
     - smtp_code: int|None
@@ -115,6 +192,10 @@ def probe_rcpt(mx_host: str, email: str, timeout: int = 10) -> Dict[str, Any]:
     - mx_used: str|None
     - rtt_ms: int|None
     """
+    # Imported on first probe: smtplib pulls in email/ssl/socket, which runs
+    # served entirely from cache or policy never need
+    import smtplib
+
     domain = parse_domain(email)
 
     start_ts = time.time()
@@ -124,24 +205,17 @@ def probe_rcpt(mx_host: str, email: str, timeout: int = 10) -> Dict[str, Any]:
     category: Optional[str] = None
 
     try:
-        with smtplib.SMTP(mx_host, 25, timeout=timeout) as smtp:
-            # Greet
-            code, _ = smtp.ehlo()
-            # STARTTLS if available
-            try:
-                if hasattr(smtp, "has_extn") and smtp.has_extn("starttls"):
-                    smtp.starttls()
-                    smtp.ehlo()
-            except Exception:
-                # If STARTTLS fails, continue without it in PoC
-                pass
-
-            # Envelope without DATA
-            smtp.mail("<probe@%s>" % domain)
-            smtp_code, msg = smtp.rcpt(f"<{email}>")
-            smtp_msg = msg.decode("utf-8", errors="ignore") if isinstance(msg, (bytes, bytearray)) else str(msg)
-            accepts = 200 <= (smtp_code or 0) < 300
-            category = _classify(smtp_code)
+        if session is not None:
+            smtp_code, msg = session.rcpt(mx_host, domain, email, timeout)
+        else:
+            with smtplib.SMTP(mx_host, 25, timeout=timeout) as smtp:
+                _greet(smtp)
+                # Envelope without DATA
+                smtp.mail("<probe@%s>" % domain)
+                smtp_code, msg = smtp.rcpt(f"<{email}>")
+        smtp_msg = msg.decode("utf-8", errors="ignore") if isinstance(msg, (bytes, bytearray)) else str(msg)
+        accepts = 200 <= (smtp_code or 0) < 300
+        category = _classify(smtp_code)
     except Exception as e:  # network errors/timeouts
         category = _classify(None, e)
 
@@ -175,6 +249,7 @@ def _parse_args(argv=None):
     env_timeout = int(os.getenv("SMTP_TIMEOUT", "10"))
     env_ttl = int(os.getenv("SMTP_MX_TTL_DAYS", "7"))
     env_skip_free = _env_bool("EGC_SKIP_FREE", True)
+    env_workers = int(os.getenv("SMTP_WORKERS", "8"))
 
     ap = argparse.ArgumentParser(description="SMTP RCPT probe (PoC CLI)")
     g = ap.add_mutually_exclusive_group(required=False)
@@ -186,6 +261,7 @@ def _parse_args(argv=None):
     ap.add_argument("--timeout", type=int, default=env_timeout, help=f"timeout seconds (env SMTP_TIMEOUT, default {env_timeout})")
     ap.add_argument("--mx-ttl-days", type=int, default=env_ttl, help=f"Cache TTL in days for MX and email results (env SMTP_MX_TTL_DAYS, default {env_ttl})")
     ap.add_argument("--max-per-domain", type=int, default=5, help="max RCPT probes per domain in a single run")
+    ap.add_argument("--workers", type=int, default=env_workers, help=f"domains probed concurrently (env SMTP_WORKERS, default {env_workers})")
     ap.add_argument("--skip-free", dest="skip_free", action="store_true", default=env_skip_free, help="skip free email domains (env EGC_SKIP_FREE=1)")
     ap.add_argument("--no-skip-free", dest="skip_free", action="store_false", help="do not skip free domains")
     ap.add_argument("--verbose", action="store_true")
@@ -226,10 +302,18 @@ def _read_emails(path: str | None, single: str | None) -> list[str]:
     return unique
 
 
+def _dumps(rows: list[dict]) -> bytes:
+    """Compact UTF-8 JSON for the result rows (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(rows)
+    import json
+    return json.dumps(rows, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
 def _write_output(rows: list[dict], out_path: Optional[str]):
-    import sys, json, csv
+    import sys, csv
     if not out_path:
-        print(json.dumps(rows, ensure_ascii=False))
+        print(_dumps(rows).decode("utf-8"))
         return
     if out_path.lower().endswith(".csv"):
         # flatten headers
@@ -240,8 +324,8 @@ def _write_output(rows: list[dict], out_path: Optional[str]):
             for r in rows:
                 w.writerow(r)
     else:
-        with open(out_path, "w", encoding="utf-8") as f:
-            json.dump(rows, f, ensure_ascii=False)
+        with open(out_path, "wb") as f:
+            f.write(_dumps(rows))
 
 
 # --- Simple SQLite cache for MX and (future) email results ---
@@ -252,42 +336,58 @@ def _cache_path() -> str:
     return str((Path(__file__).resolve().parents[1] / ".egc_cache.db"))
 
 
-def _init_cache(db_path: str):
+# (thread id, db path) -> connection; closed together by _close_connections()
+_conns: Dict[Tuple[int, str], Any] = {}
+_conns_lock = threading.Lock()
+
+
+def _connect(db_path: str):
+    """Return this thread's connection to ``db_path``, opening it on first use.
+
+    Connecting costs far more than the single-row lookups made per email, so
+    each thread keeps one connection per cache file until main() finishes.
+    """
     import sqlite3
-    con = sqlite3.connect(db_path)
-    try:
-        cur = con.cursor()
-        cur.execute("CREATE TABLE IF NOT EXISTS mx_cache (domain TEXT PRIMARY KEY, hosts_json TEXT NOT NULL, checked_at INTEGER NOT NULL)")
-        cur.execute("CREATE TABLE IF NOT EXISTS email_cache (email TEXT PRIMARY KEY, result_json TEXT NOT NULL, checked_at INTEGER NOT NULL)")
-        con.commit()
-    finally:
+    key = (threading.get_ident(), db_path)
+    con = _conns.get(key)
+    if con is None:
+        # Only the owning thread uses it; main() closes it after the workers exit
+        con = sqlite3.connect(db_path, check_same_thread=False)
+        with _conns_lock:
+            _conns[key] = con
+    return con
+
+
+def _close_connections():
+    """Close every cache connection opened by _connect()."""
+    with _conns_lock:
+        conns = list(_conns.values())
+        _conns.clear()
+    for con in conns:
         con.close()
 
 
+def _init_cache(db_path: str):
+    con = _connect(db_path)
+    con.execute("CREATE TABLE IF NOT EXISTS mx_cache (domain TEXT PRIMARY KEY, hosts_json TEXT NOT NULL, checked_at INTEGER NOT NULL)")
+    con.execute("CREATE TABLE IF NOT EXISTS email_cache (email TEXT PRIMARY KEY, result_json TEXT NOT NULL, checked_at INTEGER NOT NULL)")
+    con.commit()
+
+
 def _load_mx(db_path: str, domain: str):
-    import sqlite3, json
-    con = sqlite3.connect(db_path)
-    try:
-        cur = con.cursor()
-        cur.execute("SELECT hosts_json, checked_at FROM mx_cache WHERE domain=?", (domain,))
-        row = cur.fetchone()
-        if not row:
-            return None
-        hosts = json.loads(row[0])
-        return {"hosts": hosts, "checked_at": int(row[1])}
-    finally:
-        con.close()
+    import json
+    row = _connect(db_path).execute("SELECT hosts_json, checked_at FROM mx_cache WHERE domain=?", (domain,)).fetchone()
+    if not row:
+        return None
+    hosts = json.loads(row[0])
+    return {"hosts": hosts, "checked_at": int(row[1])}
 
 
 def _save_mx(db_path: str, domain: str, hosts: List[str]):
-    import sqlite3, json, time
-    con = sqlite3.connect(db_path)
-    try:
-        cur = con.cursor()
-        cur.execute("REPLACE INTO mx_cache(domain, hosts_json, checked_at) VALUES(?,?,?)", (domain, json.dumps(hosts), int(time.time())))
-        con.commit()
-    finally:
-        con.close()
+    import json
+    con = _connect(db_path)
+    con.execute("REPLACE INTO mx_cache(domain, hosts_json, checked_at) VALUES(?,?,?)", (domain, json.dumps(hosts), int(time.time())))
+    con.commit()
 
 
 def _is_fresh(checked_at: int, ttl_days: int) -> bool:
@@ -295,34 +395,162 @@ def _is_fresh(checked_at: int, ttl_days: int) -> bool:
     return (now - checked_at) < (ttl_days * 24 * 3600)
 
 
+def _mx_hosts(db_path: str, domain: str, ttl_days: int) -> List[str]:
+    """Return MX hosts for ``domain`` from the cache, resolving and storing them when stale.
+
+    Empty answers are cached as well, but only for NEGATIVE_MX_TTL_SECONDS
+    (or ``ttl_days`` if shorter, so 0 disables caching): domains without MX
+    are not re-resolved on every run, while a transient DNS failure (which
+    also yields no hosts) is retried soon.
+    """
+    entry = _load_mx(db_path, domain)
+    if entry:
+        checked_at = int(entry["checked_at"])
+        if entry["hosts"]:
+            if _is_fresh(checked_at, ttl_days):
+                return list(entry["hosts"])
+        elif int(time.time()) - checked_at < min(NEGATIVE_MX_TTL_SECONDS, ttl_days * 24 * 3600):
+            return []
+    hosts = resolve_mx(domain)
+    _save_mx(db_path, domain, hosts)
+    return hosts
+
+
 def _load_email(db_path: str, email: str):
-    import sqlite3, json
-    con = sqlite3.connect(db_path)
-    try:
-        cur = con.cursor()
-        cur.execute("SELECT result_json, checked_at FROM email_cache WHERE email=?", (email,))
-        row = cur.fetchone()
-        if not row:
-            return None
-        result = json.loads(row[0])
-        return {"result": result, "checked_at": int(row[1])}
-    finally:
-        con.close()
+    import json
+    row = _connect(db_path).execute("SELECT result_json, checked_at FROM email_cache WHERE email=?", (email,)).fetchone()
+    if not row:
+        return None
+    result = json.loads(row[0])
+    return {"result": result, "checked_at": int(row[1])}
 
 
 def _save_email(db_path: str, email: str, result: Dict[str, Any]):
-    import sqlite3, json, time
-    con = sqlite3.connect(db_path)
+    import json
+    con = _connect(db_path)
+    con.execute("REPLACE INTO email_cache(email, result_json, checked_at) VALUES(?,?,?)", (email, json.dumps(result), int(time.time())))
+    con.commit()
+
+
+def _probe_domain(domain: str, emails: List[str], args, db_path: str) -> List[dict]:
+    """Apply the per-domain policy and probe ``emails`` (all on ``domain``) in order.
+
+    Quota and backoff state only ever concern one domain, so each domain is
+    handled start to finish by one call and domains can run concurrently.
+    """
+    results: list[dict] = []
+    probed = 0
+    backoff_until = 0.0
+    hosts: Optional[List[str]] = None
+
+    # One connection per MX for all of this domain's addresses
+    session = SmtpSession()
     try:
-        cur = con.cursor()
-        cur.execute("REPLACE INTO email_cache(email, result_json, checked_at) VALUES(?,?,?)", (email, json.dumps(result), int(time.time())))
-        con.commit()
+        for email in emails:
+            if args.skip_free and should_skip_domain(domain):
+                results.append({
+                    "email": email,
+                    "domain": domain,
+                    "mx_used": None,
+                    "accepts_rcpt": False,
+                    "smtp_code": None,
+                    "smtp_message": "skipped free domain",
+                    "error_category": "policy",
+                    "rtt_ms": None,
+                    "mx_found": False,
+                })
+                continue
+
+            # Enforce per-domain quota
+            if probed >= int(args.max_per_domain):
+                results.append({
+                    "email": email,
+                    "domain": domain,
+                    "mx_used": None,
+                    "accepts_rcpt": False,
+                    "smtp_code": None,
+                    "smtp_message": "domain quota exceeded",
+                    "error_category": "policy",
+                    "rtt_ms": None,
+                    "mx_found": False,
+                })
+                continue
+
+            # Check domain backoff
+            if time.time() < backoff_until:
+                results.append({
+                    "email": email,
+                    "domain": domain,
+                    "mx_used": None,
+                    "accepts_rcpt": False,
+                    "smtp_code": None,
+                    "smtp_message": "backoff active",
+                    "error_category": "policy",
+                    "rtt_ms": None,
+                    "mx_found": False,
+                })
+                continue
+
+            # Email-level cache
+            e_entry = _load_email(db_path, email)
+            if e_entry and _is_fresh(int(e_entry["checked_at"]), int(args.mx_ttl_days)):
+                results.append(e_entry["result"])
+                continue
+
+            probed += 1
+
+            if not args.mx:
+                # One lookup per domain per run (cache first)
+                if hosts is None:
+                    hosts = _mx_hosts(db_path, domain, int(args.mx_ttl_days))
+
+                if not hosts:
+                    results.append({
+                        "email": email,
+                        "domain": domain,
+                        "mx_used": None,
+                        "accepts_rcpt": False,
+                        "smtp_code": None,
+                        "smtp_message": "no MX records found",
+                        "error_category": "network",
+                        "rtt_ms": None,
+                        "mx_found": False,
+                    })
+                    continue
+
+                # Probe first available MX, simple PoC iteration until success/last
+                probe_result = None
+                for host in hosts:
+                    pr = probe_rcpt(host, email, timeout=args.timeout, session=session)
+                    pr.setdefault("mx_found", True)
+                    probe_result = pr
+                    # Simple backoff handling on temp errors
+                    if pr.get("error_category") == "temp":
+                        # backoff grows with attempts on this domain in this run
+                        backoff_seconds = min(60, 2 ** max(1, probed))
+                        backoff_until = time.time() + backoff_seconds
+                    # Stop at first 2xx accept
+                    if pr.get("accepts_rcpt"):
+                        break
+                if probe_result is not None:
+                    _save_email(db_path, email, probe_result)
+                results.append(probe_result)
+                continue
+
+            # Real probe path using explicit MX
+            res = probe_rcpt(args.mx, email, timeout=args.timeout, session=session)
+            # Ensure mx_found flag present for output consistency
+            res.setdefault("mx_found", True)
+            _save_email(db_path, email, res)
+            results.append(res)
     finally:
-        con.close()
+        session.close()
+
+    return results
 
 
 def main(argv=None) -> int:
-    import sys
+    from concurrent.futures import ThreadPoolExecutor
 
     args = _parse_args(argv)
     emails = _read_emails(args.emails_file, args.email)
@@ -330,136 +558,44 @@ def main(argv=None) -> int:
         # input error
         return 2
 
-    results: list[dict] = []
+    results: list[Optional[dict]] = [None] * len(emails)
 
     db_path = _cache_path()
-    _init_cache(db_path)
-
-    domain_counts: Dict[str, int] = {}
-    domain_backoff_until: Dict[str, float] = {}
+    try:
+        _init_cache(db_path)
 
-    for email in emails:
-        try:
-            domain = parse_domain(email)
-        except ValueError:
-            results.append({
-                "email": email,
-                "domain": None,
-                "mx_used": None,
-                "accepts_rcpt": False,
-                "smtp_code": None,
-                "smtp_message": "invalid email",
-                "error_category": "input",
-                "rtt_ms": None,
-                "mx_found": False,
-            })
-            continue
-
-        if args.skip_free and should_skip_domain(domain):
-            results.append({
-                "email": email,
-                "domain": domain,
-                "mx_used": None,
-                "accepts_rcpt": False,
-                "smtp_code": None,
-                "smtp_message": "skipped free domain",
-                "error_category": "policy",
-                "rtt_ms": None,
-                "mx_found": False,
-            })
-            continue
-
-        # Enforce per-domain quota
-        cnt = domain_counts.get(domain, 0)
-        if cnt >= int(args.max_per_domain):
-            results.append({
-                "email": email,
-                "domain": domain,
-                "mx_used": None,
-                "accepts_rcpt": False,
-                "smtp_code": None,
-                "smtp_message": "domain quota exceeded",
-                "error_category": "policy",
-                "rtt_ms": None,
-                "mx_found": False,
-            })
-            continue
-
-        # Check domain backoff
-        now = time.time()
-        until = domain_backoff_until.get(domain, 0)
-        if now < until:
-            results.append({
-                "email": email,
-                "domain": domain,
-                "mx_used": None,
-                "accepts_rcpt": False,
-                "smtp_code": None,
-                "smtp_message": "backoff active",
-                "error_category": "policy",
-                "rtt_ms": None,
-                "mx_found": False,
-            })
-            continue
-
-        # Email-level cache
-        e_entry = _load_email(db_path, email)
-        if e_entry and _is_fresh(int(e_entry["checked_at"]), int(args.mx_ttl_days)):
-            results.append(e_entry["result"])
-            continue
-
-        domain_counts[domain] = cnt + 1
-
-        if not args.mx:
-            # Try cache first
-            mx_entry = _load_mx(db_path, domain)
-            hosts: List[str] = []
-            if mx_entry and _is_fresh(int(mx_entry["checked_at"]), int(args.mx_ttl_days)):
-                hosts = list(mx_entry["hosts"]) or []
-            else:
-                hosts = resolve_mx(domain)
-                if hosts:
-                    _save_mx(db_path, domain, hosts)
-
-            if not hosts:
-                results.append({
+        # Group by domain, keeping input order within each domain
+        by_domain: Dict[str, List[int]] = {}
+        for i, email in enumerate(emails):
+            try:
+                domain = parse_domain(email)
+            except ValueError:
+                results[i] = {
                     "email": email,
-                    "domain": domain,
+                    "domain": None,
                     "mx_used": None,
                     "accepts_rcpt": False,
                     "smtp_code": None,
-                    "smtp_message": "no MX records found",
-                    "error_category": "network",
+                    "smtp_message": "invalid email",
+                    "error_category": "input",
                     "rtt_ms": None,
                     "mx_found": False,
-                })
+                }
                 continue
-
-            # Probe first available MX, simple PoC iteration until success/last
-            probe_result = None
-            for host in hosts:
-                pr = probe_rcpt(host, email, timeout=args.timeout)
-                pr.setdefault("mx_found", True)
-                probe_result = pr
-                # Simple backoff handling on temp errors
-                if pr.get("error_category") == "temp":
-                    # backoff grows with attempts on this domain in this run
-                    backoff_seconds = min(60, 2 ** max(1, domain_counts.get(domain, 1)))
-                    domain_backoff_until[domain] = time.time() + backoff_seconds
-                # Stop at first 2xx accept
-                if pr.get("accepts_rcpt"):
-                    break
-            if probe_result is not None:
-                _save_email(db_path, email, probe_result)
-            results.append(probe_result)
-            continue
-
-        # Real probe path using explicit MX
-        res = probe_rcpt(args.mx, email, timeout=args.timeout)
-        # Ensure mx_found flag present for output consistency
-        res.setdefault("mx_found", True)
-        _save_email(db_path, email, res)
-        results.append(res)
+            by_domain.setdefault(domain, []).append(i)
+
+        # SMTP dialogues are network-bound: probe different domains concurrently
+        workers = max(1, min(int(args.workers), len(by_domain) or 1))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                domain: pool.submit(_probe_domain, domain, [emails[i] for i in idxs], args, db_path)
+                for domain, idxs in by_domain.items()
+            }
+            for domain, fut in futures.items():
+                for i, row in zip(by_domain[domain], fut.result()):
+                    results[i] = row
+    finally:
+        _close_connections()
 
     _write_output(results, args.out)
     return 0
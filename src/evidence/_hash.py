@@ -0,0 +1,24 @@
+"""
+Content hashing for Mini Evidence Packages.
+
+SHA-256 over normalized node text (stripped, lowercased). Cards repeat the
+same verbatim text for several contacts (name line, email and phone anchors
+share a node), so digests are memoized per distinct input.
+"""
+
+import hashlib
+from functools import lru_cache
+
+
+@lru_cache(maxsize=8192)
+def content_hash(text: str) -> str:
+    """
+    SHA-256 of normalized text content.
+    
+    Args:
+        text: Raw text content
+        
+    Returns:
+        64-character SHA-256 hash (lowercase hex)
+    """
+    return hashlib.sha256(text.strip().lower().encode('utf-8')).hexdigest()
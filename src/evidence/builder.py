@@ -13,16 +13,21 @@ Creates complete Mini Evidence Packages with all 7 required fields:
 Records missing any field are marked UNVERIFIED per PoC specification.
 """
 
-import hashlib
+from __future__ import annotations
+
 import os
+import sys
+import zlib
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 
-from playwright.sync_api import Page, ElementHandle, Locator
-from selectolax.parser import HTMLParser, Node
+from selectolax.lexbor import LexborNode as Node
+if TYPE_CHECKING:  # static-only runs never import Playwright
+    from playwright.sync_api import Page, ElementHandle, Locator
 
-from src.schemas import Evidence
+from src.schemas import Evidence, _VERSION_RE, _is_http
+from src.evidence._hash import content_hash
 
 
 class EvidenceBuilder:
@@ -44,6 +49,24 @@ class EvidenceBuilder:
         self.parser_version = parser_version
         self.screenshot_dir = Path(screenshot_dir)
         self.screenshot_dir.mkdir(parents=True, exist_ok=True)
+        # Shared evidence timestamp while a batch (e.g. one page) is being extracted
+        self._frozen_now: Optional[datetime] = None
+    
+    def freeze_clock(self, ts: Optional[datetime] = None) -> None:
+        """
+        Stamp all evidence created until unfreeze_clock() with one timestamp.
+        
+        Args:
+            ts: Timezone-aware batch time (defaults to now, UTC)
+        """
+        self._frozen_now = ts or datetime.now(timezone.utc)
+    
+    def unfreeze_clock(self) -> None:
+        """Return to per-evidence timestamps."""
+        self._frozen_now = None
+    
+    def _now(self) -> datetime:
+        return self._frozen_now or datetime.now(timezone.utc)
     
     def create_evidence_static(
         self,
@@ -58,27 +81,21 @@ class EvidenceBuilder:
         Args:
             source_url: URL where data was extracted
             selector: CSS selector used for extraction
-            node: selectolax Node object
+            node: selectolax (lexbor) node object
             verbatim_text: Verbatim text content from node
             
         Returns:
             Complete Evidence object with all 7 fields
         """
-        timestamp = datetime.now(timezone.utc)
+        timestamp = self._now()
         content_hash = self._compute_content_hash(verbatim_text)
         
         # Generate screenshot placeholder for static content
         # In static mode we can't take real screenshots, so we use a placeholder
         screenshot_path = self._generate_screenshot_path("static", source_url, selector)
         
-        return Evidence(
-            source_url=source_url,
-            selector_or_xpath=selector,
-            verbatim_quote=verbatim_text,
-            dom_node_screenshot=str(screenshot_path),
-            timestamp=timestamp,
-            parser_version=self.parser_version,
-            content_hash=content_hash
+        return self._make_evidence(
+            source_url, selector, verbatim_text, str(screenshot_path), timestamp, content_hash
         )
     
     def create_evidence_playwright(
@@ -102,7 +119,7 @@ class EvidenceBuilder:
         Returns:
             Complete Evidence object with all 7 fields including real screenshot
         """
-        timestamp = datetime.now(timezone.utc)
+        timestamp = self._now()
         content_hash = self._compute_content_hash(verbatim_text)
         
         # Take real screenshot of the DOM element
@@ -110,11 +127,48 @@ class EvidenceBuilder:
             page, element, source_url, selector
         )
         
+        return self._make_evidence(
+            source_url, selector, verbatim_text, str(screenshot_path), timestamp, content_hash
+        )
+    
+    def _make_evidence(
+        self,
+        source_url: str,
+        selector: str,
+        verbatim_text: str,
+        screenshot: str,
+        timestamp: datetime,
+        content_hash: str
+    ) -> Evidence:
+        """
+        Build Evidence, skipping pydantic validation for inputs known to be valid.
+        
+        The builder produces the timestamp (aware) and hash (lowercase hex)
+        itself, so once the caller-supplied fields pass the same checks the
+        model's validators run, the model is constructed directly. Anything
+        else goes through full validation and raises as before.
+        """
+        if (
+            type(source_url) is str and _is_http(source_url)
+            and type(selector) is str and isinstance(verbatim_text, str)
+            and isinstance(self.parser_version, str) and _VERSION_RE.match(self.parser_version)
+            and timestamp.utcoffset() is not None
+        ):
+            # URLs and selectors repeat across a page's contacts: share one object each
+            return Evidence.model_construct(
+                source_url=sys.intern(source_url),
+                selector_or_xpath=sys.intern(selector),
+                verbatim_quote=verbatim_text,
+                dom_node_screenshot=screenshot,
+                timestamp=timestamp,
+                parser_version=self.parser_version,
+                content_hash=content_hash
+            )
         return Evidence(
             source_url=source_url,
             selector_or_xpath=selector,
             verbatim_quote=verbatim_text,
-            dom_node_screenshot=str(screenshot_path),
+            dom_node_screenshot=screenshot,
             timestamp=timestamp,
             parser_version=self.parser_version,
             content_hash=content_hash
@@ -130,11 +184,8 @@ class EvidenceBuilder:
         Returns:
             64-character SHA-256 hash (lowercase hex)
         """
-        # Normalize text: strip whitespace, convert to lowercase
-        normalized = text.strip().lower()
-        
-        # Compute SHA-256 hash
-        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+        # Normalize (strip whitespace, lowercase) and hash; memoized per text
+        return content_hash(text)
     
     def _generate_screenshot_path(self, mode: str, url: str, selector: str) -> Path:
         """
@@ -148,9 +199,9 @@ class EvidenceBuilder:
         Returns:
             Path object for screenshot file
         """
-        # Create safe filename from URL and selector
-        url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
-        selector_hash = hashlib.md5(selector.encode()).hexdigest()[:8]
+        # Create safe filename from URL and selector (32-bit tags, no crypto needed)
+        url_hash = f"{zlib.crc32(url.encode()):08x}"
+        selector_hash = f"{zlib.crc32(selector.encode()):08x}"
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         filename = f"{mode}_{url_hash}_{selector_hash}_{timestamp}.png"
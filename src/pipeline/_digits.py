@@ -0,0 +1,21 @@
+"""
+Digit extraction shared by the extractors and exporters.
+
+Phone values are compared and validated as bare digit strings. Scraped
+text is almost always ASCII, so the common case deletes non-digits with
+bytes.translate and only other input goes through the regex engine.
+"""
+
+import re
+
+
+_NON_DIGIT_RE = re.compile(r"\D")
+# Every byte except ASCII 0-9, for bytes.translate(None, ...) deletion
+_NON_DIGIT_BYTES = bytes(c for c in range(256) if not 0x30 <= c <= 0x39)
+
+
+def digits_only(s: str) -> str:
+    """Strip everything but digits; ASCII input (the common case) skips the regex engine."""
+    if s.isascii():
+        return s.encode('ascii').translate(None, _NON_DIGIT_BYTES).decode('ascii')
+    return _NON_DIGIT_RE.sub("", s)
@@ -8,10 +8,11 @@ href or anchor text suggests team/leadership/people/contacts sections.
 This avoids hardcoding per-site paths and works across EN/RU/DE variants.
 """
 
+from functools import lru_cache
 from typing import List, Set
 from urllib.parse import urlparse, urljoin, urlunparse
 
-from selectolax.parser import HTMLParser
+from selectolax.lexbor import LexborHTMLParser as HTMLParser
 
 from .fetchers.static import StaticFetcher
 
@@ -45,7 +46,9 @@ def _is_candidate_link(text: str, href: str) -> bool:
     return any(k in t or k in h for k in KEYWORDS)
 
 
+@lru_cache(maxsize=4096)
 def _normalize_url(u: str) -> str:
+    # Cached: navigation links repeat on every page of a site
     try:
         p = urlparse(u)
         netloc = (p.netloc or '').lower()
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 from .fetchers.static import FetchResult
 
@@ -34,7 +35,7 @@ TARGET_CARD_CLASS_RE = re.compile(r'class\s*=\s*"[^"]*(team|member|profile|perso
 H3_H4_RE = re.compile(r"<h[34][^>]*>", re.IGNORECASE)
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class EscalationDecision:
     escalate: bool
     reasons: List[str]
@@ -79,6 +80,21 @@ def detect_cards_without_contacts(html: str | None) -> bool:
     return headings >= 8  # a rough threshold
 
 
+@lru_cache(maxsize=64)
+def _html_reasons(html: str | None) -> Tuple[str, ...]:
+    """Content-only escalation reasons; memoized so retries of the same page skip the marker scans."""
+    reasons: List[str] = []
+    # Anti-bot/dynamic markers
+    if detect_anti_bot(html):
+        reasons.append("anti-bot markers detected")
+    # JS markers (independent of page size)
+    reasons.extend(detect_js_markers(html))
+    # Cards heuristic (cards present but no contacts anchors)
+    if detect_cards_without_contacts(html):
+        reasons.append("cards_present_but_no_mailto_tel")
+    return tuple(reasons)
+
+
 def decide_escalation(fetch: FetchResult, selector_hits: int) -> EscalationDecision:
     reasons: List[str] = []
     # MIME redirect into SPA/JS app
@@ -87,13 +103,6 @@ def decide_escalation(fetch: FetchResult, selector_hits: int) -> EscalationDecis
     # No target selectors and page is tiny
     if selector_hits == 0 and fetch.content_length < 5 * 1024:
         reasons.append("selector_hits==0 && content_length<5KiB")
-    # Anti-bot/dynamic markers
-    if detect_anti_bot(fetch.html):
-        reasons.append("anti-bot markers detected")
-    # JS markers (independent of page size)
-    js_reasons = detect_js_markers(fetch.html)
-    reasons.extend(js_reasons)
-    # Cards heuristic (cards present but no contacts anchors)
-    if detect_cards_without_contacts(fetch.html):
-        reasons.append("cards_present_but_no_mailto_tel")
+    # Anti-bot, JS and card markers depend on the HTML alone
+    reasons.extend(_html_reasons(fetch.html))
     return EscalationDecision(escalate=len(reasons) > 0, reasons=reasons)
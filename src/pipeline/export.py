@@ -15,20 +15,63 @@ Key Features:
 import csv
 import json
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import BinaryIO, Iterable, List, Optional, Union
 from datetime import datetime as dt, datetime
 from urllib.parse import urlsplit, urlunsplit
 
-from src.schemas import Contact, ContactExport, VerificationStatus
+from src.schemas import Contact, ContactExport, VerificationStatus, _EXPORT_HEADER
+from src.pipeline._digits import digits_only
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # Fallback to stdlib json
 
+
+_WHITESPACE_RE = re.compile(r"\s+")
+# Below this many people, consolidation stays in-process even when workers > 1
+_PARALLEL_MIN_GROUPS = 2000
+# Digit runs such as 20240115 / 2024011512 are dates or IDs, not phone numbers
+_DATE_LIKE_DIGITS_RE = re.compile(r"(?:19|20)\d{6,8}")
+_LATIN_NAME_TOKEN_RE = re.compile(r"[a-z]{3,}")
+# Ranking signals: anchor selectors (a[href*='mailto:'] / a[href*='tel:']) and team-page paths
+_ANCHOR_SELECTOR_RE = re.compile(r"a\[href\*='(mailto|tel):'\]")
+_SEMANTIC_PATH_RE = re.compile(r"/(?:leadership|our-team|team)")
+
+
+def _phone_digits(s: Optional[str]) -> str:
+    return digits_only(s or '')
+
+
+def _is_plausible_phone_digits(digits: str) -> bool:
+    """10-15 digits and not date-like."""
+    return 10 <= len(digits) <= 15 and _DATE_LIKE_DIGITS_RE.fullmatch(digits) is None
+
+
+# scheme, host, path of a plain ASCII http(s) URL; anything else takes the urlsplit path
+_REPORT_URL_RE = re.compile(r"(https?)://([^/?#\[\]\s]+)((?:/[^?#\s]*)?)(?:[?#]\S*)?", re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
 def normalize_url_for_report(u: str) -> str:
     """Normalize URLs for reporting purposes only (does not change Evidence):
     - host -> lower and strip leading 'www.'
     - drop query and fragment
     - trim trailing '/' except for root
+    Cached: contacts from the same page share their source URL.
     """
+    m = _REPORT_URL_RE.fullmatch(u) if isinstance(u, str) and u.isascii() else None
+    if m is not None:
+        netloc = m[2].lower()
+        if netloc.startswith('www.'):
+            netloc = netloc[4:]
+        path = m[3]
+        if path.endswith('/') and path != '/':
+            path = path.rstrip('/')
+        return f"{m[1].lower()}://{netloc}{path}"
     try:
         sp = urlsplit(u)
         netloc = (sp.netloc or '').lower()
@@ -43,8 +86,9 @@ def normalize_url_for_report(u: str) -> str:
         return u or ''
 
 
+@lru_cache(maxsize=1 << 16)
 def normalize_person_name(s: str) -> str:
-    """Normalize person name for grouping keys (unicode-safe).
+    """Normalize person name for grouping keys (unicode-safe; memoized per raw name).
     - lowercased, trimmed
     - collapse whitespace
     - strip commas and periods (dots) so that variants like "J. W. Alberstadt, Jr." and
@@ -56,7 +100,7 @@ def normalize_person_name(s: str) -> str:
     # Lowercase and replace commas/dots with space, then collapse whitespace
     s2 = s.lower()
     s2 = s2.replace(',', ' ').replace('.', ' ')
-    s2 = re.sub(r"\s+", " ", s2).strip()
+    s2 = _WHITESPACE_RE.sub(" ", s2).strip()
     return s2
 
 
@@ -66,7 +110,7 @@ def _norm_key(company: str, person_name: str, contact_type: str, contact_value:
     if contact_type == 'email':
         value_norm = (contact_value or '').strip().lower()
     elif contact_type == 'phone':
-        value_norm = re.sub(r"\D", "", (contact_value or ''))
+        value_norm = _phone_digits(contact_value)
     else:
         value_norm = (contact_value or '').strip().lower()
     return (company_norm, person_norm, contact_type, value_norm)
@@ -82,11 +126,8 @@ def _quality_tuple(c: Contact) -> tuple:
       4) Canon URL length (shorter is better)
       5) Fresher captured_at
     """
-    sel = (c.evidence.selector_or_xpath or '').lower() if c.evidence else ''
-    anchor = 1 if ("a[href*='mailto:']" in sel or "a[href*='tel:']" in sel) else 0
-
-    surl = (c.evidence.source_url or '').lower() if c.evidence else ''
-    semantic = 1 if any(k in surl for k in ('/leadership', '/our-team', '/team')) else 0
+    anchor = 1 if (c.evidence and _anchor_kinds(c.evidence.selector_or_xpath)) else 0
+    semantic = _is_semantic_url(c.evidence.source_url) if c.evidence else 0
 
     role_good = 1 if (c.role_title and c.role_title.strip().lower() != 'unknown') else 0
 
@@ -105,13 +146,15 @@ def dedupe_contacts_for_export(contacts: List[Contact]) -> List[Contact]:
     """
     if not contacts:
         return []
-    best: dict[tuple, Contact] = {}
+    # key -> (quality, contact); each contact's quality is computed exactly once
+    best: dict[tuple, tuple[tuple, Contact]] = {}
     for c in contacts:
         key = _norm_key(c.company, c.person_name, c.contact_type.value, c.contact_value)
+        q = _quality_tuple(c)
         prev = best.get(key)
-        if prev is None or _quality_tuple(c) > _quality_tuple(prev):
-            best[key] = c
-    kept = list(best.values())
+        if prev is None or q > prev[0]:
+            best[key] = (q, c)
+    kept = [c for _, c in best.values()]
     removed = len(contacts) - len(kept)
     if removed > 0:
         print(f"🧹 Dedupe: kept {len(kept)} of {len(contacts)}")
@@ -132,28 +175,39 @@ def _email_domain_score(email: str, source_url: str) -> int:
         host = (urlsplit(source_url).netloc or '').lower()
     except Exception:
         host = ''
-    edom = (email.split('@')[-1] or '').lower()
+    edom = (email.rpartition('@')[2] or '').lower()
     return 1 if (_registrable_domain(edom) == _registrable_domain(host)) else 0
 
 
+_GENERIC_LOCALPARTS = frozenset({'info', 'hr', 'contact', 'office'})
+
+
 def _is_generic_localpart(email: str) -> int:
-    local = (email.split('@')[0] or '').lower()
-    generics = {'info', 'hr', 'contact', 'office'}
-    return 1 if (local not in generics) else 0
+    local = email.partition('@')[0].lower()
+    return 1 if (local not in _GENERIC_LOCALPARTS) else 0
 
 
+@lru_cache(maxsize=4096)
 def _is_semantic_url(u: str) -> int:
-    low = (u or '').lower()
-    return 1 if any(k in low for k in ('/leadership', '/our-team', '/team')) else 0
+    """1 if the URL points at a leadership/team page; memoized per distinct URL."""
+    return 1 if _SEMANTIC_PATH_RE.search((u or '').lower()) else 0
+
 
+@lru_cache(maxsize=1024)
+def _anchor_kinds(sel: str) -> frozenset:
+    """Anchor href schemes ('mailto', 'tel') named by a selector.
 
-def _is_anchor_selector(sel: str, want: str) -> int:
-    low = (sel or '').lower()
-    return 1 if (want in low) else 0
+    Extractors emit a small fixed set of selector strings, so this acts as a
+    lookup table after the first scan of each one.
+    """
+    return frozenset(_ANCHOR_SELECTOR_RE.findall((sel or '').lower()))
 
 
 def _is_toll_free(num: str) -> int:
-    d = re.sub(r"\D", "", num or '')
+    return _is_toll_free_digits(_phone_digits(num))
+
+
+def _is_toll_free_digits(d: str) -> int:
     return 0 if d.startswith(('800', '888', '877', '866')) else 1
 
 
@@ -171,182 +225,261 @@ def _best_role_for_person(contacts: List[Contact]) -> str:
     return best or 'Unknown'
 
 
-def consolidate_per_person(contacts: List[Contact]) -> List[dict]:
-    """Aggregate contacts per person into a single row per person.
+@lru_cache(maxsize=4096)
+def _name_tokens_latin(name: str) -> tuple[str, ...]:
+    """Latin name tokens (3+ letters) used to match email local-parts; computed once per name."""
+    return tuple(_LATIN_NAME_TOKEN_RE.findall((name or '').lower()))
 
-    - Key: (company_norm, person_name_norm)
-    - For each person choose best email/phone/vcard based on ranking rules.
-    Returns list of dict rows with fields:
-      company, person_name, role_title, email, phone, vcard,
-      source_url_email, source_url_phone, source_url_vcard
+
+def _pick_best_contacts(clist: List[Contact], tokens: tuple[str, ...]) -> tuple:
+    """Single pass over one person's contacts returning (email, phone, vcard) picks.
+
+    Per-contact features (anchor kinds, source URL, recency) are read once
+    and scored in place; ranking rules:
+      - email: anchor > semantic URL > local-part matches name > recency
+      - phone: anchor candidates win outright; otherwise only valid text phones
+        (10-15 digits, not date-like); then semantic URL > non toll-free > recency
+      - vcard (.vcf links): semantic URL > recency
     """
-    if not contacts:
-        return []
+    email_best = email_score = None
+    phone_anchor_best = phone_anchor_score = None
+    phone_text_best = phone_text_score = None
+    vcard_best = vcard_score = None
+
+    for c in clist:
+        ctype = c.contact_type.value
+        ev = c.evidence
+        anchors = _anchor_kinds(ev.selector_or_xpath) if ev else frozenset()
+        surl = (ev.source_url or '') if ev else ''
+        fresh = c.captured_at or datetime.min
+
+        if ctype == 'email':
+            local = (c.contact_value or '').partition('@')[0].lower()
+            score = (
+                1 if 'mailto' in anchors else 0,                  # 1) anchor
+                _is_semantic_url(surl),                           # 2) semantic URL
+                1 if any(tok in local for tok in tokens) else 0,  # 3) local-part matches name
+                fresh,                                            # 4) recency
+            )
+            if (email_best is None) or (score > email_score):
+                email_best, email_score = c, score
+        elif ctype == 'phone':
+            anchor = 1 if 'tel' in anchors else 0
+            if not anchor and phone_anchor_best is not None:
+                continue  # anchors already present; text phones cannot win
+            digits = _phone_digits(c.contact_value)
+            if not anchor and not _is_plausible_phone_digits(digits):
+                continue
+            score = (
+                anchor,                         # anchor first
+                _is_semantic_url(surl),         # semantic URL
+                _is_toll_free_digits(digits),   # prefer non toll-free
+                fresh,                          # fresher
+            )
+            if anchor:
+                if (phone_anchor_best is None) or (score > phone_anchor_score):
+                    phone_anchor_best, phone_anchor_score = c, score
+            elif (phone_text_best is None) or (score > phone_text_score):
+                phone_text_best, phone_text_score = c, score
+        elif ctype == 'link' and (c.contact_value or '').lower().endswith('.vcf'):
+            # vCard: trust extractor attribution
+            score = (_is_semantic_url(surl), fresh)
+            if (vcard_best is None) or (score > vcard_score):
+                vcard_best, vcard_score = c, score
+
+    phone_best = phone_anchor_best if phone_anchor_best is not None else phone_text_best
+    return email_best, phone_best, vcard_best
+
+
+def _output_phone(phone_best: Optional[Contact]) -> str:
+    """Digits for the chosen phone; anchors prefer digits from the verbatim quote."""
+    if phone_best is None:
+        return ''
+    ev = phone_best.evidence
+    if ev and 'tel' in _anchor_kinds(ev.selector_or_xpath):
+        # Try to parse digits from verbatim (often mirrors the href or the displayed number)
+        digits_from_verb = _phone_digits(ev.verbatim_quote if ev else '')
+        if _is_plausible_phone_digits(digits_from_verb):
+            candidate = digits_from_verb
+        else:
+            candidate = _phone_digits(phone_best.contact_value)
+    else:
+        candidate = _phone_digits(phone_best.contact_value)
+    # Normalize to strip leading US country code '1' if present (11-digit NANP)
+    if len(candidate) == 11 and candidate.startswith('1'):
+        candidate = candidate[1:]
+    return candidate
 
-    # 1) Filter out obvious non-persons BEFORE grouping
-    NON_PERSON_PHRASES = {
-        'mailing address', 'click here', 'branch hours', 'business services team',
-        'executive team', 'support', 'department', 'services', 'contact us', 'resources'
-    }
 
-    filtered: list[Contact] = []
-    for c in contacts:
-        pname = (c.person_name or '').strip().lower()
-        if any(phrase in pname for phrase in NON_PERSON_PHRASES):
-            continue  # exclude from consolidation
-        filtered.append(c)
+# Display names that are page furniture rather than people; excluded before grouping
+NON_PERSON_PHRASES = frozenset({
+    'mailing address', 'click here', 'branch hours', 'business services team',
+    'executive team', 'support', 'department', 'services', 'contact us', 'resources'
+})
+_NON_PERSON_RE = re.compile('|'.join(re.escape(p) for p in sorted(NON_PERSON_PHRASES)))
 
-    if not filtered:
-        print(f"👤 Consolidation: persons=0, from_contacts={len(contacts)}")
-        return []
 
-    # 2) Group by (company, person)
+def _group_contacts_by_person(contacts: List[Contact]) -> dict[tuple, list[Contact]]:
+    """Drop non-person rows and bucket the rest by (company_norm, person_name_norm).
+
+    One pass; the phrase filter is a single alternation scan per name and the
+    bucket key is computed once per contact.
+    """
     by_person: dict[tuple, list[Contact]] = {}
-    for c in filtered:
-        key = ((c.company or '').strip().lower(), normalize_person_name(c.person_name or ''))
+    for c in contacts:
+        pname = c.person_name or ''
+        if _NON_PERSON_RE.search(pname.lower()):
+            continue  # exclude from consolidation
+        key = ((c.company or '').strip().lower(), normalize_person_name(pname))
         by_person.setdefault(key, []).append(c)
+    return by_person
 
-    def _name_tokens_latin(name: str) -> list[str]:
-        low = (name or '').lower()
-        return re.findall(r"[a-z]{3,}", low)
 
-    def _local_matches_name(local: str, tokens: list[str]) -> int:
-        loc = (local or '').lower()
-        return 1 if any(tok in loc for tok in tokens) else 0
+def _map_person_groups(fn, groups: List[List[Contact]], workers: int) -> list:
+    """Apply fn to every person group, in order; fan out to processes when workers > 1.
 
-    def _digits_only(s: str) -> str:
-        return re.sub(r"\D", "", s or '')
+    Groups are independent, so scoring can run in a ProcessPoolExecutor to get
+    past the GIL on large crawls. Small inputs stay in-process: pool start-up
+    and pickling cost more than scoring a few hundred people.
+    """
+    if workers > 1 and len(groups) >= _PARALLEL_MIN_GROUPS:
+        chunksize = max(1, len(groups) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(fn, groups, chunksize=chunksize))
+    return list(map(fn, groups))
+
+
+def _person_row(clist: List[Contact]) -> dict:
+    """Consolidated export row for one person's contacts."""
+    # Stable display values from any contact in group
+    company_disp = clist[0].company
+    person_disp = clist[0].person_name
+
+    # Prepare name tokens for email local-part matching, then rank per spec
+    tokens = _name_tokens_latin(person_disp)
+    email_best, phone_best, vcard_best = _pick_best_contacts(clist, tokens)
+
+    role_final = _best_role_for_person(clist)
+
+    # Output: one best email and one best phone (phone normalized to digits if present)
+    out_phone = _output_phone(phone_best)
+
+    return {
+        'company': company_disp,
+        'person_name': person_disp,
+        'role_title': role_final or 'Unknown',
+        'email': email_best.contact_value if email_best else '',
+        'phone': out_phone,
+        'vcard': vcard_best.contact_value if vcard_best else '',
+        'source_url_email': normalize_url_for_report(email_best.evidence.source_url) if email_best and email_best.evidence else '',
+        'source_url_phone': normalize_url_for_report(phone_best.evidence.source_url) if phone_best and phone_best.evidence else '',
+        'source_url_vcard': normalize_url_for_report(vcard_best.evidence.source_url) if vcard_best and vcard_best.evidence else '',
+    }
 
-    def _looks_like_date_number(digits: str) -> bool:
-        # r'^(19|20)\d{6,8}$' on the normalized digits
-        return bool(re.match(r"^(19|20)\d{6,8}$", digits or ''))
 
-    rows: list[dict] = []
-    for (company_norm, person_norm), clist in by_person.items():
-        # Stable display values from any contact in group
-        company_disp = clist[0].company
-        person_disp = clist[0].person_name
+def consolidate_per_person(contacts: List[Contact], workers: int = 1) -> List[dict]:
+    """Aggregate contacts per person into a single row per person.
 
-        # Prepare name tokens for email local-part matching
-        tokens = _name_tokens_latin(person_disp)
+    - Key: (company_norm, person_name_norm)
+    - For each person choose best email/phone/vcard based on ranking rules.
+    - workers > 1 scores person groups in a process pool (large inputs only).
+    Returns list of dict rows with fields:
+      company, person_name, role_title, email, phone, vcard,
+      source_url_email, source_url_phone, source_url_vcard
+    """
+    if not contacts:
+        return []
 
-        # Rank email candidates per spec
-        email_best: Optional[Contact] = None
-        email_score_best: Optional[tuple] = None
-        for c in clist:
-            if c.contact_type.value != 'email':
-                continue
-            sel = (c.evidence.selector_or_xpath or '') if c.evidence else ''
-            surl = (c.evidence.source_url or '') if c.evidence else ''
-            local = (c.contact_value or '').split('@')[0].lower()
-            name_match = _local_matches_name(local, tokens)
-            score = (
-                _is_anchor_selector(sel.lower(), "a[href*='mailto:']"),  # 1) anchor
-                _is_semantic_url(surl),                                   # 2) semantic URL
-                name_match,                                               # 3) local-part matches name
-                c.captured_at or datetime.min,                            # 4) recency
-            )
-            if (email_best is None) or (score > email_score_best):
-                email_best = c
-                email_score_best = score
-
-        # Rank phone candidates per spec
-        phone_best: Optional[Contact] = None
-        phone_score_best: Optional[tuple] = None
-        phone_candidates_anchor: list[Contact] = []
-        phone_candidates_text: list[Contact] = []
-        for c in clist:
-            if c.contact_type.value != 'phone':
-                continue
-            sel = (c.evidence.selector_or_xpath or '') if c.evidence else ''
-            if _is_anchor_selector(sel.lower(), "a[href*='tel:']"):
-                phone_candidates_anchor.append(c)
-            else:
-                phone_candidates_text.append(c)
-
-        def _score_phone(c: Contact) -> tuple:
-            sel = (c.evidence.selector_or_xpath or '') if c.evidence else ''
-            surl = (c.evidence.source_url or '') if c.evidence else ''
-            return (
-                _is_anchor_selector(sel.lower(), "a[href*='tel:']"),  # anchor first
-                _is_semantic_url(surl),                                # semantic URL
-                _is_toll_free(c.contact_value),                        # prefer non toll-free
-                c.captured_at or datetime.min,                         # fresher
-            )
+    # Filter out obvious non-persons, then group by (company, person)
+    by_person = _group_contacts_by_person(contacts)
+    if not by_person:
+        print(f"👤 Consolidation: persons=0, from_contacts={len(contacts)}")
+        return []
 
-        if phone_candidates_anchor:
-            for c in phone_candidates_anchor:
-                score = _score_phone(c)
-                if (phone_best is None) or (score > phone_score_best):
-                    phone_best = c
-                    phone_score_best = score
-        else:
-            # No anchor phones; consider text-only phones with validation
-            valid_texts: list[Contact] = []
-            for c in phone_candidates_text:
-                digits = _digits_only(c.contact_value)
-                if 10 <= len(digits) <= 15 and not _looks_like_date_number(digits):
-                    valid_texts.append(c)
-            for c in valid_texts:
-                score = _score_phone(c)
-                if (phone_best is None) or (score > phone_score_best):
-                    phone_best = c
-                    phone_score_best = score
-
-        # vCard: trust extractor attribution; pick best by semantic URL then recency
-        vcard_best = None
-        vcard_score_best = None
-        for c in clist:
-            if c.contact_type.value != 'link':
-                continue
-            if not (c.contact_value or '').lower().endswith('.vcf'):
-                continue
-            surl = (c.evidence.source_url or '') if c.evidence else ''
-            score = (
-                _is_semantic_url(surl),
-                c.captured_at or datetime.min,
-            )
-            if (vcard_best is None) or (score > vcard_score_best):
-                vcard_best = c
-                vcard_score_best = score
-
-        role_final = _best_role_for_person(clist)
-
-        # Output: one best email and one best phone (phone normalized to digits if present)
-        out_phone = ''
-        if phone_best is not None:
-            # Prefer digits from verbatim when anchor is present; fallback to contact_value
-            sel_best = (phone_best.evidence.selector_or_xpath or '') if phone_best.evidence else ''
-            if _is_anchor_selector(sel_best.lower(), "a[href*='tel:']"):
-                # Try to parse digits from verbatim (often mirrors the href or the displayed number)
-                verb = (phone_best.evidence.verbatim_quote or '') if phone_best.evidence else ''
-                digits_from_verb = _digits_only(verb)
-                candidate = digits_from_verb if (10 <= len(digits_from_verb) <= 15 and not _looks_like_date_number(digits_from_verb)) else _digits_only(phone_best.contact_value)
-            else:
-                candidate = _digits_only(phone_best.contact_value)
-            # Normalize to strip leading US country code '1' if present (11-digit NANP)
-            if len(candidate) == 11 and candidate.startswith('1'):
-                candidate = candidate[1:]
-            out_phone = candidate
-
-        row = {
-            'company': company_disp,
-            'person_name': person_disp,
-            'role_title': role_final or 'Unknown',
-            'email': email_best.contact_value if email_best else '',
-            'phone': out_phone,
-            'vcard': vcard_best.contact_value if vcard_best else '',
-            'source_url_email': normalize_url_for_report(email_best.evidence.source_url) if email_best and email_best.evidence else '',
-            'source_url_phone': normalize_url_for_report(phone_best.evidence.source_url) if phone_best and phone_best.evidence else '',
-            'source_url_vcard': normalize_url_for_report(vcard_best.evidence.source_url) if vcard_best and vcard_best.evidence else '',
-        }
-        rows.append(row)
+    rows = _map_person_groups(_person_row, list(by_person.values()), workers)
 
     print(f"👤 Consolidation: persons={len(rows)}, from_contacts={len(contacts)}")
     return rows
 
 
-def consolidate_per_person_with_evidence(contacts: List[Contact], min_level: Optional['DecisionLevel'] = None) -> List[dict]:
+_EVIDENCE_KEYS = frozenset({
+    'source_url', 'selector_or_xpath', 'verbatim_quote', 'dom_node_screenshot',
+    'timestamp', 'parser_version', 'content_hash',
+})
+
+
+def _evidence_dict(c: Optional[Contact]) -> Optional[dict]:
+    """The 7 Mini Evidence Package fields of a selected contact, or None."""
+    if not c or not c.evidence:
+        return None
+    ev = c.evidence
+    return {
+        'source_url': ev.source_url,
+        'selector_or_xpath': ev.selector_or_xpath,
+        'verbatim_quote': ev.verbatim_quote,
+        'dom_node_screenshot': ev.dom_node_screenshot,
+        'timestamp': ev.timestamp,
+        'parser_version': ev.parser_version,
+        'content_hash': ev.content_hash,
+    }
+
+
+def _person_row_with_evidence(clist: List[Contact], min_level: Optional['DecisionLevel'] = None) -> Optional[dict]:
+    """Decision row with evidence for one person, or None when below min_level."""
+    # Local import to avoid hard dependency if roles module is optional elsewhere
+    from src.pipeline.roles import classify_role
+
+    # Stable display values from any contact in group
+    company_disp = clist[0].company
+    person_disp = clist[0].person_name
+
+    # Prepare name tokens for email local-part matching, then rank (same logic)
+    tokens = _name_tokens_latin(person_disp)
+    email_best, phone_best, vcard_best = _pick_best_contacts(clist, tokens)
+
+    role_final = _best_role_for_person(clist)
+
+    # Decision level and reasons using any evidence source URL in the group
+    url_ctx = None
+    for candidate_contact in (email_best, phone_best, vcard_best):
+        if candidate_contact and candidate_contact.evidence and candidate_contact.evidence.source_url:
+            url_ctx = candidate_contact.evidence.source_url
+            break
+    if url_ctx is None and clist and clist[0].evidence and clist[0].evidence.source_url:
+        url_ctx = clist[0].evidence.source_url
+
+    level, reasons = classify_role(role_final or 'Unknown', url_ctx)
+
+    # Apply threshold filter before building the output row
+    if (min_level is not None) and (level < min_level):
+        return None
+
+    # Normalize phone like consolidate_per_person
+    out_phone = _output_phone(phone_best)
+
+    present_evs = [ev for ev in (email_best.evidence if email_best else None, phone_best.evidence if phone_best else None, vcard_best.evidence if vcard_best else None) if ev is not None]
+    evidence_complete = bool(present_evs) and all(ev.is_complete() for ev in present_evs)
+    verification_status = 'VERIFIED' if evidence_complete else 'UNVERIFIED'
+
+    return {
+        'company': company_disp,
+        'person_name': person_disp,
+        'role_title': role_final or 'Unknown',
+        'decision_level': level.name,
+        'decision_reasons': reasons,
+        'email': email_best.contact_value if email_best else '',
+        'phone': out_phone,
+        'vcard': vcard_best.contact_value if vcard_best else '',
+        # Evidence dicts for selected contacts (7 fields)
+        'evidence_email': _evidence_dict(email_best),
+        'evidence_phone': _evidence_dict(phone_best),
+        'evidence_vcard': _evidence_dict(vcard_best),
+        'evidence_complete': evidence_complete,
+        'verification_status': verification_status,
+    }
+
+
+def consolidate_per_person_with_evidence(contacts: List[Contact], min_level: Optional['DecisionLevel'] = None, workers: int = 1) -> List[dict]:
     """Aggregate contacts per person with attached evidence and DecisionLevel.
 
     - Copies grouping and best selection logic from consolidate_per_person.
@@ -355,217 +488,68 @@ def consolidate_per_person_with_evidence(contacts: List[Contact], min_level: Opt
     - evidence_complete=True iff all present selected types have a complete mini-pack.
     - verification_status='VERIFIED' only when evidence_complete is True.
     - If min_level is provided, filters out rows below the threshold.
+    - workers > 1 scores person groups in a process pool (large inputs only).
     - Returns list of dicts with fields exactly:
       company, person_name, role_title, decision_level, decision_reasons,
       email, phone, vcard,
       evidence_email, evidence_phone, evidence_vcard,
       evidence_complete, verification_status
     """
-    # Local import to avoid hard dependency if roles module is optional elsewhere
-    from src.pipeline.roles import DecisionLevel, classify_role
-
     if not contacts:
         return []
 
-    # 1) Filter out obvious non-persons BEFORE grouping (same rules as consolidate_per_person)
-    NON_PERSON_PHRASES = {
-        'mailing address', 'click here', 'branch hours', 'business services team',
-        'executive team', 'support', 'department', 'services', 'contact us', 'resources'
-    }
-
-    filtered: list[Contact] = []
-    for c in contacts:
-        pname = (c.person_name or '').strip().lower()
-        if any(phrase in pname for phrase in NON_PERSON_PHRASES):
-            continue
-        filtered.append(c)
-
-    if not filtered:
+    # Filter out obvious non-persons, then group (same rules as consolidate_per_person)
+    by_person = _group_contacts_by_person(contacts)
+    if not by_person:
         print(f"👤 Consolidation (with evidence): persons=0, from_contacts={len(contacts)}")
         return []
 
-    # 2) Group by (company, person)
-    by_person: dict[tuple, list[Contact]] = {}
-    for c in filtered:
-        key = ((c.company or '').strip().lower(), normalize_person_name(c.person_name or ''))
-        by_person.setdefault(key, []).append(c)
-
-    def _name_tokens_latin(name: str) -> list[str]:
-        low = (name or '').lower()
-        return re.findall(r"[a-z]{3,}", low)
+    rows = [
+        row for row in _map_person_groups(
+            partial(_person_row_with_evidence, min_level=min_level), list(by_person.values()), workers
+        )
+        if row is not None
+    ]
 
-    def _local_matches_name(local: str, tokens: list[str]) -> int:
-        loc = (local or '').lower()
-        return 1 if any(tok in loc for tok in tokens) else 0
+    print(f"👤 Consolidation (with evidence): persons={len(rows)}, from_contacts={len(contacts)}")
+    return rows
 
-    def _digits_only(s: str) -> str:
-        return re.sub(r"\D", "", s or '')
 
-    def _looks_like_date_number(digits: str) -> bool:
-        return bool(re.match(r"^(19|20)\d{6,8}$", digits or ''))
+def _json_item_bytes(item, pretty: bool, default=None) -> bytes:
+    """Serialize one JSON value to UTF-8 bytes (orjson when installed).
 
-    rows: list[dict] = []
-    for (company_norm, person_norm), clist in by_person.items():
-        # Stable display values from any contact in group
-        company_disp = clist[0].company
-        person_disp = clist[0].person_name
+    Datetimes go through `default` and the stdlib path uses orjson's
+    separators, so the bytes are the same with or without orjson.
+    """
+    if orjson is not None:
+        option = orjson.OPT_PASSTHROUGH_DATETIME | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(item, default=default, option=option)
+    if pretty:
+        return json.dumps(item, indent=2, ensure_ascii=False, default=default).encode('utf-8')
+    return json.dumps(item, separators=(',', ':'), ensure_ascii=False, default=default).encode('utf-8')
 
-        # Prepare name tokens for email local-part matching
-        tokens = _name_tokens_latin(person_disp)
 
-        # Rank email candidates (same logic)
-        email_best: Optional[Contact] = None
-        email_score_best: Optional[tuple] = None
-        for c in clist:
-            if c.contact_type.value != 'email':
-                continue
-            sel = (c.evidence.selector_or_xpath or '') if c.evidence else ''
-            surl = (c.evidence.source_url or '') if c.evidence else ''
-            local = (c.contact_value or '').split('@')[0].lower()
-            name_match = _local_matches_name(local, tokens)
-            score = (
-                _is_anchor_selector(sel.lower(), "a[href*='mailto:']"),
-                _is_semantic_url(surl),
-                name_match,
-                c.captured_at or datetime.min,
-            )
-            if (email_best is None) or (score > email_score_best):
-                email_best = c
-                email_score_best = score
-
-        # Rank phone candidates (same logic)
-        phone_best: Optional[Contact] = None
-        phone_score_best: Optional[tuple] = None
-        phone_candidates_anchor: list[Contact] = []
-        phone_candidates_text: list[Contact] = []
-        for c in clist:
-            if c.contact_type.value != 'phone':
-                continue
-            sel = (c.evidence.selector_or_xpath or '') if c.evidence else ''
-            if _is_anchor_selector(sel.lower(), "a[href*='tel:']"):
-                phone_candidates_anchor.append(c)
-            else:
-                phone_candidates_text.append(c)
-
-        def _score_phone(c: Contact) -> tuple:
-            sel = (c.evidence.selector_or_xpath or '') if c.evidence else ''
-            surl = (c.evidence.source_url or '') if c.evidence else ''
-            return (
-                _is_anchor_selector(sel.lower(), "a[href*='tel:']"),
-                _is_semantic_url(surl),
-                _is_toll_free(c.contact_value),
-                c.captured_at or datetime.min,
-            )
+def _write_json_array(f: BinaryIO, items: Iterable, pretty: bool = True, default=None) -> int:
+    """Stream items to binary file f as a JSON array, one element at a time; returns the count.
 
-        if phone_candidates_anchor:
-            for c in phone_candidates_anchor:
-                score = _score_phone(c)
-                if (phone_best is None) or (score > phone_score_best):
-                    phone_best = c
-                    phone_score_best = score
+    Pretty output matches json.dump(list(items), f, indent=2, ensure_ascii=False)
+    without materialising the list; compact output has no spaces.
+    """
+    count = 0
+    for item in items:
+        data = _json_item_bytes(item, pretty, default)
+        if pretty:
+            f.write(b'[\n  ' if count == 0 else b',\n  ')
+            f.write(data.replace(b'\n', b'\n  '))
         else:
-            valid_texts: list[Contact] = []
-            for c in phone_candidates_text:
-                digits = _digits_only(c.contact_value)
-                if 10 <= len(digits) <= 15 and not _looks_like_date_number(digits):
-                    valid_texts.append(c)
-            for c in valid_texts:
-                score = _score_phone(c)
-                if (phone_best is None) or (score > phone_score_best):
-                    phone_best = c
-                    phone_score_best = score
-
-        # vCard candidates (same logic)
-        vcard_best: Optional[Contact] = None
-        vcard_score_best: Optional[tuple] = None
-        for c in clist:
-            if c.contact_type.value != 'link':
-                continue
-            if not (c.contact_value or '').lower().endswith('.vcf'):
-                continue
-            surl = (c.evidence.source_url or '') if c.evidence else ''
-            score = (
-                _is_semantic_url(surl),
-                c.captured_at or datetime.min,
-            )
-            if (vcard_best is None) or (score > vcard_score_best):
-                vcard_best = c
-                vcard_score_best = score
-
-        role_final = _best_role_for_person(clist)
-
-        # Normalize phone like consolidate_per_person
-        out_phone = ''
-        if phone_best is not None:
-            sel_best = (phone_best.evidence.selector_or_xpath or '') if phone_best.evidence else ''
-            if _is_anchor_selector(sel_best.lower(), "a[href*='tel:']"):
-                verb = (phone_best.evidence.verbatim_quote or '') if phone_best.evidence else ''
-                digits_from_verb = _digits_only(verb)
-                candidate = digits_from_verb if (10 <= len(digits_from_verb) <= 15 and not _looks_like_date_number(digits_from_verb)) else _digits_only(phone_best.contact_value)
-            else:
-                candidate = _digits_only(phone_best.contact_value)
-            if len(candidate) == 11 and candidate.startswith('1'):
-                candidate = candidate[1:]
-            out_phone = candidate
-
-        # Decision level and reasons using any evidence source URL in the group
-        url_ctx = None
-        for candidate_contact in (email_best, phone_best, vcard_best):
-            if candidate_contact and candidate_contact.evidence and candidate_contact.evidence.source_url:
-                url_ctx = candidate_contact.evidence.source_url
-                break
-        if url_ctx is None and clist and clist[0].evidence and clist[0].evidence.source_url:
-            url_ctx = clist[0].evidence.source_url
-
-        level, reasons = classify_role(role_final or 'Unknown', url_ctx)
-
-        # Evidence dicts for selected contacts (7 fields)
-        def ev_dict(c: Optional[Contact]) -> Optional[dict]:
-            if not c or not c.evidence:
-                return None
-            ev = c.evidence
-            return {
-                'source_url': ev.source_url,
-                'selector_or_xpath': ev.selector_or_xpath,
-                'verbatim_quote': ev.verbatim_quote,
-                'dom_node_screenshot': ev.dom_node_screenshot,
-                'timestamp': ev.timestamp,
-                'parser_version': ev.parser_version,
-                'content_hash': ev.content_hash,
-            }
-
-        ev_email = ev_dict(email_best)
-        ev_phone = ev_dict(phone_best)
-        ev_vcard = ev_dict(vcard_best)
-
-        present_evs = [ev for ev in (email_best.evidence if email_best else None, phone_best.evidence if phone_best else None, vcard_best.evidence if vcard_best else None) if ev is not None]
-        evidence_complete = bool(present_evs) and all(ev.is_complete() for ev in present_evs)
-        verification_status = 'VERIFIED' if evidence_complete else 'UNVERIFIED'
-
-        row = {
-            'company': company_disp,
-            'person_name': person_disp,
-            'role_title': role_final or 'Unknown',
-            'decision_level': level.name,
-            'decision_reasons': reasons,
-            'email': email_best.contact_value if email_best else '',
-            'phone': out_phone,
-            'vcard': vcard_best.contact_value if vcard_best else '',
-            'evidence_email': ev_email,
-            'evidence_phone': ev_phone,
-            'evidence_vcard': ev_vcard,
-            'evidence_complete': evidence_complete,
-            'verification_status': verification_status,
-        }
-
-        # Apply threshold filter if provided
-        if (min_level is not None) and (level < min_level):
-            continue
-
-        rows.append(row)
-
-    print(f"👤 Consolidation (with evidence): persons={len(rows)}, from_contacts={len(contacts)}")
-    return rows
+            f.write(b'[' if count == 0 else b',')
+            f.write(data)
+        count += 1
+    if count == 0:
+        f.write(b'[]')
+    else:
+        f.write(b'\n]' if pretty else b']')
+    return count
 
 
 class ContactExporter:
@@ -586,7 +570,7 @@ class ContactExporter:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
     
-    def to_decision_people_json(self, rows: list[dict], filename: Optional[str] = None, pretty: bool = True) -> str:
+    def to_decision_people_json(self, rows: Iterable[dict], filename: Optional[str] = None, pretty: bool = True) -> str:
         """Write decision-only people rows to JSON.
         Fields included per row:
         company, person_name, role_title, decision_level, decision_reasons,
@@ -598,15 +582,12 @@ class ContactExporter:
             timestamp = dt.now().strftime("%Y%m%d_%H%M%S")
             filename = f"decision_people_{timestamp}.json"
         path = self.output_dir / filename
-        with open(path, 'w', encoding='utf-8') as f:
-            if pretty:
-                json.dump(rows or [], f, indent=2, ensure_ascii=False, default=str)
-            else:
-                json.dump(rows or [], f, ensure_ascii=False, default=str)
-        print(f"💾 Decision JSON exported: {path} ({len(rows or [])} persons)")
+        with open(path, 'wb') as f:
+            n = _write_json_array(f, rows or [], pretty=pretty, default=str)
+        print(f"💾 Decision JSON exported: {path} ({n} persons)")
         return str(path)
 
-    def to_decision_people_csv(self, rows: list[dict], filename: Optional[str] = None) -> str:
+    def to_decision_people_csv(self, rows: Iterable[dict], filename: Optional[str] = None) -> str:
         """Write decision-only people rows to CSV.
         Flat columns:
         company,person_name,role_title,decision_level,has_evidence_email,has_evidence_phone,has_evidence_vcard,verification_status,
@@ -621,10 +602,8 @@ class ContactExporter:
         def _has_full(ev: Optional[dict]) -> int:
             if not isinstance(ev, dict):
                 return 0
-            keys = {
-                'source_url','selector_or_xpath','verbatim_quote','dom_node_screenshot','timestamp','parser_version','content_hash'
-            }
-            if not keys.issubset(set(ev.keys())):
+            keys = _EVIDENCE_KEYS
+            if not keys.issubset(ev.keys()):
                 return 0
             # consider non-empty values (timestamp allowed as datetime or str)
             for k in keys:
@@ -641,31 +620,33 @@ class ContactExporter:
             'verification_status','email','phone','vcard',
             'source_url_email','source_url_phone','source_url_vcard'
         ]
+        n = 0
         with open(path, 'w', newline='', encoding='utf-8') as f:
-            w = csv.DictWriter(f, fieldnames=columns)
-            w.writeheader()
+            # Positional rows in `columns` order; csv.writer quotes in C without DictWriter's per-row dict pass
+            w = csv.writer(f)
+            w.writerow(columns)
             for r in rows or []:
+                n += 1
                 ev_email = r.get('evidence_email')
                 ev_phone = r.get('evidence_phone')
                 ev_vcard = r.get('evidence_vcard')
-                out_row = {
-                    'company': r.get('company',''),
-                    'person_name': r.get('person_name',''),
-                    'role_title': r.get('role_title',''),
-                    'decision_level': r.get('decision_level','UNKNOWN'),
-                    'has_evidence_email': _has_full(ev_email),
-                    'has_evidence_phone': _has_full(ev_phone),
-                    'has_evidence_vcard': _has_full(ev_vcard),
-                    'verification_status': r.get('verification_status','UNVERIFIED'),
-                    'email': r.get('email',''),
-                    'phone': r.get('phone',''),
-                    'vcard': r.get('vcard',''),
-                    'source_url_email': (ev_email or {}).get('source_url','') if isinstance(ev_email, dict) else '',
-                    'source_url_phone': (ev_phone or {}).get('source_url','') if isinstance(ev_phone, dict) else '',
-                    'source_url_vcard': (ev_vcard or {}).get('source_url','') if isinstance(ev_vcard, dict) else '',
-                }
-                w.writerow(out_row)
-        print(f"💾 Decision CSV exported: {path} ({len(rows or [])} persons)")
+                w.writerow((
+                    r.get('company',''),
+                    r.get('person_name',''),
+                    r.get('role_title',''),
+                    r.get('decision_level','UNKNOWN'),
+                    _has_full(ev_email),
+                    _has_full(ev_phone),
+                    _has_full(ev_vcard),
+                    r.get('verification_status','UNVERIFIED'),
+                    r.get('email',''),
+                    r.get('phone',''),
+                    r.get('vcard',''),
+                    ev_email.get('source_url','') if isinstance(ev_email, dict) else '',
+                    ev_phone.get('source_url','') if isinstance(ev_phone, dict) else '',
+                    ev_vcard.get('source_url','') if isinstance(ev_vcard, dict) else '',
+                ))
+        print(f"💾 Decision CSV exported: {path} ({n} persons)")
         return str(path)
     """
     Exports contact data with evidence packages to CSV/JSON formats.
@@ -739,34 +720,27 @@ class ContactExporter:
         # Dedupe before export (export-layer only)
         contacts = dedupe_contacts_for_export(contacts)
 
-        # Convert to export format (flattened)
-        export_contacts = [ContactExport.from_contact(contact) for contact in contacts]
-        
+        # Flatten straight into rows; only source_url and datetimes need
+        # report formatting (source_url is normalized, the model is untouched)
+        rows = (
+            (company, person_name, role_title, contact_type, contact_value,
+             captured_at.isoformat(), verification_status,
+             normalize_url_for_report(source_url), selector_or_xpath, verbatim_quote,
+             dom_node_screenshot, timestamp.isoformat(), parser_version, content_hash)
+            for (company, person_name, role_title, contact_type, contact_value,
+                 captured_at, verification_status,
+                 source_url, selector_or_xpath, verbatim_quote,
+                 dom_node_screenshot, timestamp, parser_version, content_hash)
+            in ContactExport.rows_from_contacts(contacts)
+        )
+
         # Write CSV
         with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-            if export_contacts:
-                # Get field names from first contact
-                fieldnames = export_contacts[0].model_dump().keys()
-                
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for contact in export_contacts:
-                    # Convert to dict and handle datetime serialization
-                    row_data = contact.model_dump()
-
-                    # Normalize source_url for report (do not mutate model)
-                    if 'source_url' in row_data:
-                        row_data['source_url'] = normalize_url_for_report(row_data['source_url'])
-                    
-                    # Convert datetime objects to ISO format strings
-                    for key, value in list(row_data.items()):
-                        if isinstance(value, datetime):
-                            row_data[key] = value.isoformat()
-                    
-                    writer.writerow(row_data)
+            writer = csv.writer(csvfile)
+            writer.writerow(_EXPORT_HEADER)
+            writer.writerows(rows)
         
-        print(f"💾 CSV exported: {csv_path} ({len(export_contacts)} contacts)")
+        print(f"💾 CSV exported: {csv_path} ({len(contacts)} contacts)")
         return csv_path
     
     def to_json(
@@ -805,10 +779,9 @@ class ContactExporter:
         # Dedupe before export (export-layer only)
         contacts = dedupe_contacts_for_export(contacts)
 
-        # Convert to serializable format
-        export_data = []
-        for contact in contacts:
-            contact_dict = {
+        # Convert to serializable format lazily; rows are written as they are built
+        export_data = (
+            {
                 "company": contact.company,
                 "person_name": contact.person_name,
                 "role_title": contact.role_title,
@@ -827,16 +800,14 @@ class ContactExporter:
                     "content_hash": contact.evidence.content_hash
                 } if contact.evidence else None
             }
-            export_data.append(contact_dict)
-        
+            for contact in contacts
+        )
+
         # Write JSON
-        with open(json_path, 'w', encoding='utf-8') as jsonfile:
-            if pretty:
-                json.dump(export_data, jsonfile, indent=2, ensure_ascii=False)
-            else:
-                json.dump(export_data, jsonfile, ensure_ascii=False)
+        with open(json_path, 'wb') as jsonfile:
+            n = _write_json_array(jsonfile, export_data, pretty=pretty)
         
-        print(f"💾 JSON exported: {json_path} ({len(export_data)} contacts)")
+        print(f"💾 JSON exported: {json_path} ({n} contacts)")
         return json_path
     
     def to_both(
@@ -939,7 +910,7 @@ class ContactExporter:
     # -------------------------
     # People-level export
     # -------------------------
-    def to_people_csv(self, consolidated: List[dict], filename: Optional[str] = None) -> Path:
+    def to_people_csv(self, consolidated: Iterable[dict], filename: Optional[str] = None) -> Path:
         """Write consolidated per-person rows to CSV.
         Filename pattern: contacts_people_{timestamp}.csv if not provided.
         """
@@ -955,17 +926,18 @@ class ContactExporter:
             'company', 'person_name', 'role_title', 'email', 'phone', 'vcard',
             'source_url_email', 'source_url_phone', 'source_url_vcard'
         ]
+        n = 0
         with open(path, 'w', newline='', encoding='utf-8') as f:
-            w = csv.DictWriter(f, fieldnames=columns)
-            w.writeheader()
+            w = csv.writer(f)
+            w.writerow(columns)
             for row in consolidated:
-                # Ensure only known columns
-                out_row = {k: row.get(k, '') for k in columns}
-                w.writerow(out_row)
-        print(f"💾 People CSV exported: {path} ({len(consolidated)} persons)")
+                # Ensure only known columns, in header order
+                w.writerow([row.get(k, '') for k in columns])
+                n += 1
+        print(f"💾 People CSV exported: {path} ({n} persons)")
         return path
 
-    def to_people_json(self, consolidated: List[dict], filename: Optional[str] = None, pretty: bool = True) -> Path:
+    def to_people_json(self, consolidated: Iterable[dict], filename: Optional[str] = None, pretty: bool = True) -> Path:
         """Write consolidated per-person rows to JSON.
         Filename pattern: contacts_people_{timestamp}.json if not provided.
         """
@@ -973,10 +945,7 @@ class ContactExporter:
             timestamp = dt.now().strftime("%Y%m%d_%H%M%S")
             filename = f"contacts_people_{timestamp}.json"
         path = self.output_dir / filename
-        with open(path, 'w', encoding='utf-8') as f:
-            if pretty:
-                json.dump(consolidated or [], f, indent=2, ensure_ascii=False)
-            else:
-                json.dump(consolidated or [], f, ensure_ascii=False)
-        print(f"💾 People JSON exported: {path} ({len(consolidated or [])} persons)")
+        with open(path, 'wb') as f:
+            n = _write_json_array(f, consolidated or [], pretty=pretty)
+        print(f"💾 People JSON exported: {path} ({n} persons)")
         return path
@@ -12,21 +12,229 @@ Key Features:
 - Works with both static HTML and Playwright page objects
 """
 
+from __future__ import annotations
+
 import re
 import os
 import html
 import difflib
 import time
-from typing import List, Dict, Optional, Union, Tuple
+from functools import lru_cache
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, List, Dict, Optional, Union, Tuple
 from urllib.parse import urljoin, urlparse
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
-from selectolax.parser import HTMLParser, Node
-from playwright.sync_api import Page, ElementHandle, Locator
+from selectolax.lexbor import LexborHTMLParser as HTMLParser, LexborNode as Node
 import httpx
+if TYPE_CHECKING:  # Playwright is only needed once a browser is driven
+    from playwright.sync_api import Page, ElementHandle, Locator
 
 from ..schemas import ContactType, Contact, Evidence
 from ..evidence import EvidenceBuilder
+from ._digits import digits_only as _digits_only
+
+
+# Hot-path patterns shared by static and Playwright extraction (compiled once)
+_DATE_LIKE_DIGITS_RE = re.compile(r'^(19|20)\d{6,8}$')
+_HONORIFIC_PREFIX_RE = re.compile(r'^(Dr\.|Mr\.|Ms\.|Mrs\.)\s+')
+_TEL_CLASS_TOKEN_RE = re.compile(r'\btel\b')
+_NAME_ALPHA_SPLIT_RE = re.compile(r"[^a-zA-Z]+")
+_NAME_ALNUM_SPLIT_RE = re.compile(r"[^a-z0-9]+")
+_CLASS_TOKEN_SPLIT_RE = re.compile(r"[\s_-]+")
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
+_SECTION_HEADER_NAME_RE = re.compile(r"^(Our Team|Team|People|Staff|Contact|Contacts|News|Press)$", re.IGNORECASE)
+# "John Doe Email: john@example.com" style names near a contact link
+_CAPITALIZED_NAME_RE = re.compile(r'([A-Z][a-z]+ [A-Z][a-z]+(?:,? [A-Z]\.?[A-Z]\.?)?)')
+# Table header text -> column kind, first match wins
+_TABLE_HEADER_RULES: Tuple[Tuple[re.Pattern, str], ...] = (
+    (re.compile(r"\b(full\s*name|name|person|employee|имя|фамилия|surname)\b"), 'name'),
+    (re.compile(r"\b(first\s*name)\b"), 'first'),
+    (re.compile(r"\b(last\s*name|surname|фамилия)\b"), 'last'),
+    (re.compile(r"\b(title|role|position|должность)\b"), 'title'),
+    (re.compile(r"\b(email|e-mail|mail|почта)\b"), 'email'),
+    (re.compile(r"\b(phone|telephone|tel|телефон)\b"), 'phone'),
+)
+
+# Anything a contact could come from: an anchor (mailto/tel/vCard/D=1
+# profile), an email or obfuscated "at" token, or a digit for phone text
+_CONTACT_SIGNAL_RE = re.compile(r"<a[\s>]|@|&#0*64;|&#x0*40;|&commat;|\bat\b|\d", re.IGNORECASE)
+
+# Email deobfuscation: (at)/[at] and (dot)/[dot] tokens, spacing, mailto prefix.
+# Leading whitespace is only tried from the start of a run: a bare \s* prefix
+# rescans the rest of the run from every position, quadratic on padded text
+_OBF_AT_RE = re.compile(r"(?i)(?:(?<!\s)\s+)?(?:\(|\[)?at(?:\)|\])\s*")
+_OBF_DOT_RE = re.compile(r"(?i)(?:(?<!\s)\s+)?(?:\(|\[)?dot(?:\)|\])\s*")
+_SPACED_AT_RE = re.compile(r"(?:(?<!\s)\s+)?@\s*")
+_SPACED_DOT_RE = re.compile(r"(?:(?<!\s)\s+)?\.\s*")
+_MAILTO_PREFIX_RE = re.compile(r"(?i)mailto:\s*")
+_QUOTED_EMAIL_PART_RE = re.compile(r"[\"']([A-Za-z0-9._%+@-]+)[\"']")
+
+# Email addresses; ASCII-only classes, so skip Unicode case tables
+EMAIL_RE = re.compile(r'\b[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,}\b', re.IGNORECASE | re.ASCII)
+
+# Phone patterns (international formats)
+PHONE_RE = re.compile(
+    r'(?:\+?1[-\s]?)?\(?\d{3}\)?[-\s]?\d{3}[-\s]?\d{4}|'
+    r'\+?\d{1,3}[-\s]?\(?\d{1,4}\)?[-\s]?\d{1,4}[-\s]?\d{1,9}'
+)
+
+# Trigger patterns for hidden/revealed emails (used as a signal)
+SHOW_EMAIL_RE = re.compile(r"\b(show|reveal|display|показать|открыть)\s*(e-?mail|email|почт\w+|адрес)\b", re.I)
+
+# Contact anchor selectors shared by every query site, so repeated
+# css()/locator() lookups across a batch reuse one selector string
+_MAILTO_SEL = "a[href*='mailto:']"
+_TEL_SEL = "a[href*='tel:']"
+_VCARD_SEL = "a[href$='.vcf']"
+
+# Fast-sweep queries, repeated for every anchor on a listing page. Neither
+# selectolax nor Playwright exposes a parsed-selector object to cache, so the
+# strings are built once here and handed to each call unchanged.
+_MAILTO_PREFIX_SEL = "a[href^='mailto']"
+_TEL_PREFIX_SEL = "a[href^='tel']"
+_LIST_ITEM_ANCESTOR_XP = "xpath=ancestor::li[contains(@class, 'list-item')][1]"
+_LIST_ITEM_NAME_SEL = "h2, h3, h4, .list-item-content__title"
+_PRECEDING_HEADING_XPS = ("xpath=preceding::h2[1]", "xpath=preceding::h3[1]", "xpath=preceding::h4[1]")
+# [href, textContent] of every match, read in the page in one round trip
+_HREF_TEXT_JS = "els => els.map(e => [e.getAttribute('href') || '', e.textContent || ''])"
+
+# Footer/contact blocks scanned for cross-domain signals, as one selector list
+_FOOTER_CONTACT_SEL = "footer, address, .contact, .contacts, .contact-info, .contact-us, [class*='contact']"
+
+_COMPANY_SUFFIX_RE = re.compile(r'\s*[-|].*$')
+# Case-sensitive on purpose: the Playwright path has always matched it that way
+_PW_SECTION_SUFFIX_RE = re.compile(r'\s*(Team|People|About).*$')
+_GENERIC_SECTION_RE = re.compile(r'^(Contact|Contacts|News(?:\s*&\s*Insights)?|Press|Team|People|About)\b', re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _clean_company_text(text: str) -> str:
+    """Company name from a page title/heading; '' for generic section headers.
+
+    Pages of one site repeat the same <title>, so the cleanup is memoized.
+    """
+    # Remove everything after - or |
+    company_text = _COMPANY_SUFFIX_RE.sub('', text.strip())
+    # Drop generic section headers entirely
+    if _GENERIC_SECTION_RE.search(company_text):
+        return ''
+    return company_text[:100]  # Limit length
+
+
+def _netloc(url: str) -> str:
+    """Network location of url; plain slicing for 'scheme://host/...' URLs."""
+    scheme, sep, rest = url.partition('://')
+    if sep and scheme.isalpha():
+        end = len(rest)
+        for ch in '/?#':
+            i = rest.find(ch, 0, end)
+            if i != -1:
+                end = i
+        return rest[:end]
+    return urlparse(url).netloc
+
+
+@lru_cache(maxsize=4096)
+def _site_domain(url: str) -> str:
+    """Lower-cased host without 'www.'; every card of a page asks for the same URL."""
+    return _netloc(url).lower().replace('www.', '')
+
+
+@lru_cache(maxsize=4096)
+def _company_from_host(netloc: str) -> str:
+    """Fallback company name derived from the URL hostname."""
+    return netloc.replace('www.', '').title()
+
+
+@lru_cache(maxsize=1024)
+def _shared_name(name: str) -> str:
+    """Return the first-seen string equal to ``name`` (bounded flyweight).
+
+    A person's email and phone anchors each yield their own copy of the same
+    heading text; recent names resolve to one object shared by both contacts.
+    """
+    return name
+
+
+def _node_class(n: Node) -> str:
+    """Lower-cased class attribute; '' for text/document nodes met while walking the tree."""
+    try:
+        return (n.attrs.get('class', '') or '').lower()
+    except TypeError:
+        # lexbor only exposes attrs on element nodes
+        return ''
+
+
+# Second-level labels of two-part public suffixes (example.co.uk, example.com.au)
+_SECOND_LEVEL_LABELS = frozenset({'co', 'com', 'org', 'net', 'gov', 'ac', 'edu'})
+
+
+def _registrable(d: str) -> str:
+    d = d.lower().strip()
+    if d.startswith('www.'):
+        d = d[4:]
+    parts = d.split('.')
+    if len(parts) >= 3 and parts[-2] in _SECOND_LEVEL_LABELS and len(parts[-1]) <= 3:
+        return '.'.join(parts[-3:])
+    return '.'.join(parts[-2:]) if len(parts) >= 2 else d
+
+
+@lru_cache(maxsize=4096)
+def _domains_match(email_domain: str, site_domain: str) -> bool:
+    """Registrable parts equal, or SequenceMatcher ratio >= 0.9.
+
+    Memoized per (email, site) domain pair: a page repeats the same few
+    domains. real_quick_ratio()/quick_ratio() are cheap upper bounds on
+    ratio(), so dissimilar pairs are rejected before the full match.
+    """
+    d1 = _registrable(email_domain)
+    d2 = _registrable(site_domain)
+    if d1 == d2:
+        return True
+    sm = difflib.SequenceMatcher(None, d1, d2)
+    return sm.real_quick_ratio() >= 0.9 and sm.quick_ratio() >= 0.9 and sm.ratio() >= 0.9
+
+
+# Common selectors for person information
+PERSON_SELECTORS: Tuple[str, ...] = (
+    # Prefer full entry cards first
+    '.entry-team-info',
+    # Avada cards
+    '.fusion-layout-column.bg-green.text-white.text-center',
+    # Common person cards
+    '.person, .team-member, .employee, .staff-member',
+    '.bio, .biography, .profile',
+    '.card .person-info, .member-card, .profile-card, .team-card',
+    '[data-person], [data-team-member]',
+    'article.person, section.team-member, article.profile',
+    # WordPress builders (Elementor/Avada/WPBakery)
+    '.elementor-team-member, .team-member__content, .elementor-widget-team-member, .our-team, .team-grid article',
+    "[class*='team-member']", "[class*='member-card']",
+    # Heuristic by class name fragments
+    "[class*='team-info']",
+    "[class*='team']", "[class*='people']", "[class*='person']",
+    "[class*='staff']", "[class*='member']", "[class*='attorney']", "[class*='lawyer']",
+)
+
+# Selectors for names within person containers
+NAME_SELECTORS: Tuple[str, ...] = (
+    'h1, h2, h3, h4',
+    '.name, .person-name, .full-name, .profile-name',
+    ".heading, .card-title, .profile-header h2, .profile-header h3",
+    'strong:first-child, b:first-child',
+)
+
+# Selectors for job titles/roles
+TITLE_SELECTORS: Tuple[str, ...] = (
+    '.title, .job-title, .position, .role, .position-title',
+    '.subtitle, .description:first-of-type, .profile-title, .card-subtitle',
+    'em, i, .italic',
+    'p:first-of-type, .bio p:first-child',
+    # adjacency patterns: title follows name header
+    'h3 + p, h4 + p',
+)
 
 
 class ContactExtractor:
@@ -49,6 +257,12 @@ class ContactExtractor:
         
         # D=1 follow-up budget (reset per top-level extract call)
         self._d1_budget: Optional[int] = None
+        # Keep-alive client for D=1 profile follows (created on first use)
+        self._profile_client: Optional[httpx.Client] = None
+        # (profile_url, person_name) follows queued by the top-level page, fetched together
+        self._d1_pending: Optional[List[Tuple[str, str]]] = None
+        # True while a top-level static extraction holds the evidence clock
+        self._evidence_clock_frozen: bool = False
         
         # Cross-domain acceptance scoring (hardcoded weights and threshold; no new configs)
         self._XDOM_THRESHOLD: int = 5  # moderate threshold
@@ -73,57 +287,16 @@ class ContactExtractor:
         self._site_host: Optional[str] = None
         self._site_mailto_counts: Counter[str] = Counter()
         # Trigger patterns for hidden/revealed emails (used as a signal)
-        self._show_email_re = re.compile(r"\b(show|reveal|display|показать|открыть)\s*(e-?mail|email|почт\w+|адрес)\b", re.I)
+        self._show_email_re = SHOW_EMAIL_RE
         
-        # Common selectors for person information
-        self.person_selectors = [
-            # Prefer full entry cards first
-            '.entry-team-info',
-            # Avada cards
-            '.fusion-layout-column.bg-green.text-white.text-center',
-            # Common person cards
-            '.person, .team-member, .employee, .staff-member',
-            '.bio, .biography, .profile',
-            '.card .person-info, .member-card, .profile-card, .team-card',
-            '[data-person], [data-team-member]',
-            'article.person, section.team-member, article.profile',
-            # WordPress builders (Elementor/Avada/WPBakery)
-            '.elementor-team-member, .team-member__content, .elementor-widget-team-member, .our-team, .team-grid article',
-            "[class*='team-member']", "[class*='member-card']",
-            # Heuristic by class name fragments
-            "[class*='team-info']",
-            "[class*='team']", "[class*='people']", "[class*='person']",
-            "[class*='staff']", "[class*='member']", "[class*='attorney']", "[class*='lawyer']",
-        ]
-        
-        # Selectors for names within person containers
-        self.name_selectors = [
-            'h1, h2, h3, h4',
-            '.name, .person-name, .full-name, .profile-name',
-            ".heading, .card-title, .profile-header h2, .profile-header h3",
-            'strong:first-child, b:first-child'
-        ]
+        # Selector tables are module constants, built once and shared by every instance
+        self.person_selectors = PERSON_SELECTORS
+        self.name_selectors = NAME_SELECTORS
+        self.title_selectors = TITLE_SELECTORS
         
-        # Selectors for job titles/roles
-        self.title_selectors = [
-            '.title, .job-title, .position, .role, .position-title',
-            '.subtitle, .description:first-of-type, .profile-title, .card-subtitle',
-            'em, i, .italic',
-            'p:first-of-type, .bio p:first-child',
-            # adjacency patterns: title follows name header
-            'h3 + p, h4 + p'
-        ]
-        
-        # Email patterns
-        self.email_pattern = re.compile(
-            r'\b[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,}\b', re.IGNORECASE
-        )
-        
-        # Phone patterns (international formats)
-        self.phone_pattern = re.compile(
-            r'(?:\+?1[-\s]?)?\(?\d{3}\)?[-\s]?\d{3}[-\s]?\d{4}|'
-            r'\+?\d{1,3}[-\s]?\(?\d{1,4}\)?[-\s]?\d{1,4}[-\s]?\d{1,9}'
-        )
+        # Email/phone patterns (module constants, compiled once per process)
+        self.email_pattern = EMAIL_RE
+        self.phone_pattern = PHONE_RE
 
         # Free email domains (used for allow_free env)
         self.free_email_domains = {
@@ -147,21 +320,21 @@ class ContactExtractor:
         # Remove common wrappers
         s_norm = s.replace('\u200b', '')  # zero-width
         # Normalize spaced tokens around at/dot
-        s_norm = re.sub(r"(?i)\s*(?:\(|\[)?at(?:\)|\])\s*", "@", s_norm)
-        s_norm = re.sub(r"(?i)\s*(?:\(|\[)?dot(?:\)|\])\s*", ".", s_norm)
+        s_norm = _OBF_AT_RE.sub("@", s_norm)
+        s_norm = _OBF_DOT_RE.sub(".", s_norm)
         s_norm = s_norm.replace("(at)", "@").replace("[at]", "@").replace(" at ", "@").replace("(dot)", ".").replace("[dot]", ".").replace(" dot ", ".")
         # Strip spaces around @ and .
-        s_norm = re.sub(r"\s*@\s*", "@", s_norm)
-        s_norm = re.sub(r"\s*\.\s*", ".", s_norm)
+        s_norm = _SPACED_AT_RE.sub("@", s_norm)
+        s_norm = _SPACED_DOT_RE.sub(".", s_norm)
         # Remove mailto: prefix if present
-        s_norm = re.sub(r"(?i)mailto:\s*", "", s_norm)
+        s_norm = _MAILTO_PREFIX_RE.sub("", s_norm)
         # Direct email match
         m = self.email_pattern.search(s_norm)
         if m:
             return m.group(0)
         # Try to reconstruct from quoted parts after a 'mailto:' style concat
         if 'mailto' in s.lower():
-            parts = re.findall(r"[\"']([A-Za-z0-9._%+@-]+)[\"']", s)
+            parts = _QUOTED_EMAIL_PART_RE.findall(s)
             if parts:
                 cand = ''.join(parts)
                 m2 = self.email_pattern.search(cand)
@@ -174,13 +347,15 @@ class ContactExtractor:
         if not href:
             return None
         s = href.strip()
-        raw = s[7:] if s.lower().startswith('mailto:') else s
-        email = raw.split('?', 1)[0].split('#', 1)[0].strip().lower()
-        if self.email_pattern.match(email):
-            return email
+        raw = s[7:] if s[:7].lower() == 'mailto:' else s
+        raw = raw.partition('?')[0].partition('#')[0]
+        if '@' in raw:
+            email = raw.strip().lower()
+            if self.email_pattern.match(email):
+                return email
         if fallback_text:
             ft = html.unescape(str(fallback_text)).strip()
-            m = self.email_pattern.search(ft.lower())
+            m = self.email_pattern.search(ft.lower()) if '@' in ft else None
             if m:
                 return m.group(0)
         return None
@@ -194,30 +369,23 @@ class ContactExtractor:
         """
         counts: Counter[str] = Counter()
         try:
-            for a in parser.css("a[href*='mailto:']"):
+            for a in parser.css(_MAILTO_SEL):
                 try:
                     href = (a.attrs.get('href', '') or '').strip()
                     txt = (a.text() or '').strip()
                     email = self._sanitize_mailto(href, txt) or self._deobfuscate_email(href) or self._deobfuscate_email(txt)
                     if not email or '@' not in email:
                         continue
-                    edom = email.split('@')[-1].lower()
+                    edom = email.rpartition('@')[2].lower()
                     counts[edom] += 1
                 except Exception:
                     continue
         except Exception:
             counts = Counter()
-        # Footer/contact blocks text
+        # Footer/contact blocks text (one traversal for all block kinds)
         parts: List[str] = []
         try:
-            for f in (parser.css('footer') or []):
-                t = f.text() or ''
-                if t:
-                    parts.append(t)
-        except Exception:
-            pass
-        try:
-            for blk in (parser.css("address, .contact, .contacts, .contact-info, .contact-us, [class*='contact']") or []):
+            for blk in (parser.css(_FOOTER_CONTACT_SEL) or []):
                 t = blk.text() or ''
                 if t:
                     parts.append(t)
@@ -234,7 +402,7 @@ class ContactExtractor:
 
     def _xdom_reset_or_update_site_counts(self, source_url: str) -> None:
         try:
-            host = urlparse(source_url).netloc.lower().replace('www.', '')
+            host = _site_domain(source_url)
         except Exception:
             host = ''
         if host and host != self._site_host:
@@ -315,7 +483,7 @@ class ContactExtractor:
 
     def _node_has_phone_hint(self, node: Node) -> bool:
         try:
-            if node.css_first("a[href*='tel:']") is not None:
+            if node.css_first(_TEL_SEL) is not None:
                 return True
             text = node.text() or ''
             return bool(self.phone_pattern.search(text))
@@ -324,7 +492,7 @@ class ContactExtractor:
 
     def _node_has_vcf_hint(self, node: Node) -> bool:
         try:
-            return node.css_first("a[href$='.vcf']") is not None
+            return node.css_first(_VCARD_SEL) is not None
         except Exception:
             return False
 
@@ -370,12 +538,26 @@ class ContactExtractor:
             s += self._XDOM_W['negative_zone']; signals.append('neg-zone')
         return s, signals
 
+    def _first_phone_in_text(self, text: str) -> Optional[Tuple[str, str]]:
+        """First 10-15 digit, non-date phone match in text as (digits, raw match)."""
+        # finditer: stop scanning at the first acceptable match
+        for m in self.phone_pattern.finditer(text):
+            raw = m.group(0)
+            num = _digits_only(raw)
+            if not num or len(num) < 10 or len(num) > 15:
+                continue
+            if _DATE_LIKE_DIGITS_RE.match(num):
+                continue
+            return num, raw
+        return None
+
     def _emails_from_text(self, node: Node) -> List[str]:
         """Find emails in raw text within a node, including deobfuscated ones."""
         found: set[str] = set()
         text = (node.text() or '')
-        for em in self.email_pattern.findall(text):
-            found.add(em)
+        # Regex scan only when an address is possible at all
+        if '@' in text:
+            found.update(self.email_pattern.findall(text))
         # Try deobfuscation on block text
         deob = self._deobfuscate_email(text)
         if deob:
@@ -388,28 +570,67 @@ class ContactExtractor:
                 found.add(cand)
         return list(found)
 
+    def _get_profile_client(self) -> httpx.Client:
+        """Pooled client for D=1 profile follows, so pages of one site reuse connections."""
+        if self._profile_client is None:
+            self._profile_client = httpx.Client(
+                timeout=8.0,
+                follow_redirects=True,
+                limits=httpx.Limits(max_keepalive_connections=20),
+            )
+        return self._profile_client
+
+    def _fetch_profile_html(self, url: str) -> Optional[str]:
+        try:
+            r = self._get_profile_client().get(url)
+            if r.status_code < 400 and 'text/html' in (r.headers.get('Content-Type','').lower()):
+                return r.text
+        except Exception:
+            pass
+        return None
+
+    def _follow_profiles(self, follows: List[Tuple[str, str]]) -> List[Contact]:
+        """D=1: fetch profile pages in parallel and keep the first contact matching each person.
+
+        Fetches share the pooled client from worker threads; parsing stays on
+        the calling thread because extraction mutates per-page instance state.
+        """
+        if not follows:
+            return []
+        urls = [u for u, _ in follows]
+        if len(urls) == 1:
+            pages = [self._fetch_profile_html(urls[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+                pages = list(pool.map(self._fetch_profile_html, urls))
+        found: List[Contact] = []
+        for (abs_url, person_name), page_html in zip(follows, pages):
+            if page_html is None:
+                continue
+            try:
+                bio_contacts = self.extract_from_static_html(page_html, abs_url)
+            except Exception:
+                continue
+            # choose the first matching by name
+            for bc in bio_contacts:
+                if bc.person_name.lower() == person_name.lower():
+                    found.append(bc)
+                    break
+        return found
+
+    def close(self) -> None:
+        """Clean up resources."""
+        if self._profile_client is not None:
+            self._profile_client.close()
+            self._profile_client = None
+
     def _email_domain_matches_site(self, email_domain: str, site_domain: str) -> bool:
         """Heuristic domain match: registrable part match or high similarity.
         Allows minor differences and subdomain variations.
         """
         if not email_domain or not site_domain:
             return False
-        def norm(d: str) -> str:
-            d = d.lower().strip()
-            if d.startswith('www.'):
-                d = d[4:]
-            return d
-        def registrable(d: str) -> str:
-            parts = d.split('.')
-            if len(parts) >= 3 and parts[-2] in {'co','com','org','net','gov','ac','edu'} and len(parts[-1]) <= 3:
-                return '.'.join(parts[-3:])
-            return '.'.join(parts[-2:]) if len(parts) >= 2 else d
-        d1 = registrable(norm(email_domain))
-        d2 = registrable(norm(site_domain))
-        if d1 == d2:
-            return True
-        ratio = difflib.SequenceMatcher(None, d1, d2).ratio()
-        return ratio >= 0.9
+        return _domains_match(email_domain, site_domain)
     
     def extract_from_static_html(self, html: str, source_url: str) -> List[Contact]:
         """
@@ -422,6 +643,26 @@ class ContactExtractor:
         Returns:
             List of Contact objects with complete evidence packages
         """
+        if not _CONTACT_SIGNAL_RE.search(html):
+            # No anchors, email tokens or digits (challenge pages, JS shells):
+            # nothing can be attributed, so skip parsing and the evidence clock
+            self._page_mailto_counts = Counter()
+            self._footer_contact_text = ""
+            self._xdom_reset_or_update_site_counts(source_url)
+            return []
+        if self._evidence_clock_frozen:
+            # Nested D=1 follow-up: keep the outer page's timestamp
+            return self._extract_from_static_html(html, source_url)
+        # One evidence timestamp per top-level page instead of a clock read per contact
+        self.evidence_builder.freeze_clock(datetime.now(timezone.utc))
+        self._evidence_clock_frozen = True
+        try:
+            return self._extract_from_static_html(html, source_url)
+        finally:
+            self._evidence_clock_frozen = False
+            self.evidence_builder.unfreeze_clock()
+
+    def _extract_from_static_html(self, html: str, source_url: str) -> List[Contact]:
         parser = HTMLParser(html)
         contacts: List[Contact] = []
         
@@ -438,53 +679,61 @@ class ContactExtractor:
         local_reset = False
         if self._d1_budget is None:
             self._d1_budget = 5
+            self._d1_pending = []
             local_reset = True
         
-        # Extract company name from page
-        company_name = self._extract_company_name_static(parser, source_url)
+        try:
+            # Extract company name from page
+            company_name = self._extract_company_name_static(parser, source_url)
         
-        # Find person containers first
-        found_person_containers = False
-        seen_roots = set()
-        for selector in self.person_selectors:
-            person_nodes = parser.css(selector)
-            if person_nodes:
-                found_person_containers = True
+            # Find person containers first
+            found_person_containers = False
+            seen_roots = set()
+            for selector in self.person_selectors:
+                person_nodes = parser.css(selector)
+                if person_nodes:
+                    found_person_containers = True
             
-            for person_node in person_nodes:
-                root = self._choose_card_root_by_repetition(person_node)
-                root_id = id(root)
-                if root_id in seen_roots:
-                    continue
-                seen_roots.add(root_id)
-                person_contacts = self._extract_person_contacts_static(
-                    root, source_url, company_name, selector
-                )
-                contacts.extend(person_contacts)
-        
-        # If no structured person containers were found, try table extractor first (aggressive), then generic fallback.
-        # scan for repeating sibling blocks that look like cards and extract from them.
-        if not found_person_containers:
-            used_table = False
-            if self.aggressive_static:
-                try:
-                    table_contacts = self._extract_table_contacts_static(parser, source_url, company_name)
-                    if table_contacts:
-                        print(f"[AGG] table-extractor: +{len(table_contacts)} contacts from tables @ {source_url}")
-                        contacts.extend(table_contacts)
-                        used_table = True
-                except Exception:
-                    # Fail-quietly for PoC
-                    pass
-            if not used_table:
-                fallback_contacts = self._fallback_repeating_cards(parser, source_url, company_name)
-                contacts.extend(fallback_contacts)
-        # Post-filtering and deduplication
-        contacts = self._postprocess_and_dedup(contacts)
+                for person_node in person_nodes:
+                    root = self._choose_card_root_by_repetition(person_node)
+                    root_id = id(root)
+                    if root_id in seen_roots:
+                        continue
+                    seen_roots.add(root_id)
+                    person_contacts = self._extract_person_contacts_static(
+                        root, source_url, company_name, selector
+                    )
+                    contacts.extend(person_contacts)
         
-        # Reset D=1 budget after top-level extraction completes
-        if local_reset:
-            self._d1_budget = None
+            # If no structured person containers were found, try table extractor first (aggressive), then generic fallback.
+            # scan for repeating sibling blocks that look like cards and extract from them.
+            if not found_person_containers:
+                used_table = False
+                if self.aggressive_static:
+                    try:
+                        table_contacts = self._extract_table_contacts_static(parser, source_url, company_name)
+                        if table_contacts:
+                            print(f"[AGG] table-extractor: +{len(table_contacts)} contacts from tables @ {source_url}")
+                            contacts.extend(table_contacts)
+                            used_table = True
+                    except Exception:
+                        # Fail-quietly for PoC
+                        pass
+                if not used_table:
+                    fallback_contacts = self._fallback_repeating_cards(parser, source_url, company_name)
+                    contacts.extend(fallback_contacts)
+            # Fetch the queued D=1 profile pages concurrently
+            if local_reset:
+                pending, self._d1_pending = self._d1_pending, None
+                contacts.extend(self._follow_profiles(pending or []))
+            # Post-filtering and deduplication
+            contacts = self._postprocess_and_dedup(contacts)
+        finally:
+            # Reset D=1 state after top-level extraction, even if it raised,
+            # so later calls do not queue follow-ups that never run
+            if local_reset:
+                self._d1_budget = None
+                self._d1_pending = None
         return contacts
     
     def extract_from_playwright(self, page: Page, source_url: str) -> List[Contact]:
@@ -542,17 +791,12 @@ class ContactExtractor:
         for selector in company_selectors:
             element = parser.css_first(selector)
             if element and element.text():
-                company_text = element.text().strip()
-                # Clean up common patterns
-                company_text = re.sub(r'\s*[-|].*$', '', company_text)  # Remove everything after - or |
-                # Drop generic section headers entirely
-                if re.search(r'^(Contact|Contacts|News(?:\s*&\s*Insights)?|Press|Team|People|About)\b', company_text, re.IGNORECASE):
-                    company_text = ''
+                company_text = _clean_company_text(element.text())
                 if company_text:
-                    return company_text[:100]  # Limit length
+                    return company_text
         
         # Fallback: extract from URL hostname
-        return urlparse(source_url).netloc.replace('www.', '').title()
+        return _company_from_host(_netloc(source_url))
     
     def _extract_company_name_playwright(self, page: Page, source_url: str) -> str:
         """Extract company name from Playwright page."""
@@ -571,8 +815,8 @@ class ContactExtractor:
                 if text_content:
                     company_text = text_content.strip()
                     # Clean up common patterns
-                    company_text = re.sub(r'\s*[-|].*$', '', company_text)
-                    company_text = re.sub(r'\s*(Team|People|About).*$', '', company_text, re.IGNORECASE)
+                    company_text = _COMPANY_SUFFIX_RE.sub('', company_text)
+                    company_text = _PW_SECTION_SUFFIX_RE.sub('', company_text)
                     if company_text:
                         return company_text[:100]
                         
@@ -580,7 +824,7 @@ class ContactExtractor:
                 continue
         
         # Fallback: extract from URL hostname
-        return urlparse(source_url).netloc.replace('www.', '').title()
+        return _company_from_host(_netloc(source_url))
     
     def _extract_person_contacts_static(
         self, 
@@ -616,7 +860,7 @@ class ContactExtractor:
         found_phone = False
 
         # Email domain filter inputs
-        site_domain = urlparse(source_url).netloc.lower().replace('www.', '')
+        site_domain = _site_domain(source_url)
         allow_free_env = os.getenv('EGC_ALLOW_FREE_EMAIL', '0') == '1'
 
         # 1) Emails: prefer mailto; if absent, use aria/title/icon or text-only within card root
@@ -628,7 +872,7 @@ class ContactExtractor:
         has_show_trigger = self._node_has_show_email_trigger(person_node)
         negative_zone = self._is_negative_zone_path(source_url)
         # If show-email trigger is present and we didn't capture an email here, leave card as valid via other signals; dynamic path may reveal later.
-        email_link = self._nearest_link(person_node, name_node, "a[href*='mailto:']") if name_node else None
+        email_link = self._nearest_link(person_node, name_node, _MAILTO_SEL) if name_node else None
         if email_link:
             href = (email_link.attrs.get('href','') or '').strip()
             txt = (email_link.text() or '').strip()
@@ -638,6 +882,13 @@ class ContactExtractor:
             if email_val and self.email_pattern.match(email_val):
                 candidate_emails.append((email_val, email_link, f"{base_selector} a[href*='mailto:']"))
         else:
+            # Card text is scanned at most once, however many email hints point at it
+            card_emails: Optional[List[str]] = None
+            def emails_in_card() -> List[str]:
+                nonlocal card_emails
+                if card_emails is None:
+                    card_emails = self._emails_from_text(person_node)
+                return card_emails
             # a[aria-label*='email' i], a[title*='email' i]
             for a in person_node.css('a'):
                 if not a or not a.attrs:
@@ -645,7 +896,7 @@ class ContactExtractor:
                 lab = (a.attrs.get('aria-label') or a.attrs.get('title') or '').lower()
                 if 'email' in lab:
                     # Try to extract email from card text
-                    for em in self._emails_from_text(person_node):
+                    for em in emails_in_card():
                         candidate_emails.append((em.lower(), a, f"{base_selector} a[aria|title*=email]"))
                         break
             # i[class*='envelope'] → nearest parent-anchor
@@ -660,12 +911,12 @@ class ContactExtractor:
                             break
                         parent = parent.parent
                     if anchor is not None:
-                        for em in self._emails_from_text(person_node):
+                        for em in emails_in_card():
                             candidate_emails.append((em, anchor, f"{base_selector} i[class*='envelope']~a"))
                             break
             # Pure text email within card
             if not candidate_emails:
-                for em in self._emails_from_text(person_node):
+                for em in emails_in_card():
                     candidate_emails.append((em.lower(), person_node, f"{base_selector} :text-email"))
                     break
 
@@ -674,7 +925,7 @@ class ContactExtractor:
         for email_val, node_for_ev, sel in candidate_emails:
             if not email_val or email_val in used_emails:
                 continue
-            email_domain = email_val.split('@')[-1].lower() if '@' in email_val else ''
+            email_domain = email_val.rpartition('@')[2].lower() if '@' in email_val else ''
             same_domain = email_domain.endswith(site_domain)
             brand_match = same_domain or self._email_domain_matches_site(email_domain, site_domain)
             # Free email acceptance remains behind env guard
@@ -686,7 +937,7 @@ class ContactExtractor:
                 accept = True
             else:
                 # Cross-domain scoring path
-                from_mailto = ("mailto:" in sel) or (node_for_ev is not None and getattr(node_for_ev, 'attrs', None) and str((node_for_ev.attrs.get('href','') or '')).lower().startswith('mailto:'))
+                from_mailto = ("mailto:" in sel) or (node_for_ev is not None and getattr(node_for_ev, 'attrs', None) and str((node_for_ev.attrs.get('href','') or ''))[:7].lower() == 'mailto:')
                 page_count = self._xdom_page_domain_count(email_domain)
                 site_count = self._xdom_site_domain_count(email_domain)
                 in_footer = self._xdom_domain_in_footer_or_contacts(email_domain)
@@ -742,14 +993,23 @@ class ContactExtractor:
 
         # 2) Phones: tel links; if none, aria/title/icon or text within card
         phones_added = False
-        phone_link = self._nearest_link(person_node, name_node, "a[href*='tel:']") if name_node else None
+        phone_link = self._nearest_link(person_node, name_node, _TEL_SEL) if name_node else None
         candidate_phones: List[tuple[str, Optional[Node], str, str]] = []  # (normalized_digits, node, selector, raw_display)
         if phone_link:
             href = phone_link.attrs.get('href','') or ''
             phone_raw = href[4:] if href.startswith('tel:') else href
-            normalized_phone = re.sub(r"\D", "", phone_raw)
+            normalized_phone = _digits_only(phone_raw)
             candidate_phones.append((normalized_phone, phone_link, f"{base_selector} a[href*='tel:']", phone_raw))
         else:
+            # First plausible phone in the card text, scanned at most once per card
+            card_phone: Optional[Tuple[str, str]] = None
+            card_phone_scanned = False
+            def phone_in_card() -> Optional[Tuple[str, str]]:
+                nonlocal card_phone, card_phone_scanned
+                if not card_phone_scanned:
+                    card_phone_scanned = True
+                    card_phone = self._first_phone_in_text(person_node.text() or '')
+                return card_phone
             # a[aria-label*='phone' i], a[title*='phone' i]
             for a in person_node.css('a'):
                 if not a or not a.attrs:
@@ -757,20 +1017,14 @@ class ContactExtractor:
                 lab = (a.attrs.get('aria-label') or a.attrs.get('title') or '').lower()
                 if 'phone' in lab or 'tel' in lab:
                     # extract first phone from card text
-                    text_block = person_node.text() or ''
-                    for m in self.phone_pattern.findall(text_block):
-                        raw = m if isinstance(m, str) else ''.join(m)
-                        num = re.sub(r"\D", "", raw)
-                        if not num or len(num) < 10 or len(num) > 15:
-                            continue
-                        if re.match(r'^(19|20)\d{6,8}$', num):
-                            continue
+                    found = phone_in_card()
+                    if found:
+                        num, raw = found
                         candidate_phones.append((num, a, f"{base_selector} a[aria|title*=phone]", raw))
-                        break
             # icons i[class*='phone'|'tel'] → nearest anchor
             for i_node in person_node.css('i'):
                 cls = (i_node.attrs.get('class','') or '').lower()
-                if ('phone' in cls) or (re.search(r'\btel\b', cls) is not None):
+                if ('phone' in cls) or (_TEL_CLASS_TOKEN_RE.search(cls) is not None):
                     parent = i_node.parent
                     anchor = None
                     while parent is not None:
@@ -779,28 +1033,16 @@ class ContactExtractor:
                             break
                         parent = parent.parent
                     if anchor is not None:
-                        text_block = person_node.text() or ''
-                        for m in self.phone_pattern.findall(text_block):
-                            raw = m if isinstance(m, str) else ''.join(m)
-                            num = re.sub(r"\D", "", raw)
-                            if not num or len(num) < 10 or len(num) > 15:
-                                continue
-                            if re.match(r'^(19|20)\d{6,8}$', num):
-                                continue
+                        found = phone_in_card()
+                        if found:
+                            num, raw = found
                             candidate_phones.append((num, anchor, f"{base_selector} i[class*='phone|tel']~a", raw))
-                            break
             # Pure text phone within card
             if not candidate_phones:
-                text_block = person_node.text() or ''
-                for m in self.phone_pattern.findall(text_block):
-                    raw = m if isinstance(m, str) else ''.join(m)
-                    num = re.sub(r"\D", "", raw)
-                    if not num or len(num) < 10 or len(num) > 15:
-                        continue
-                    if re.match(r'^(19|20)\d{6,8}$', num):
-                        continue
+                found = phone_in_card()
+                if found:
+                    num, raw = found
                     candidate_phones.append((num, person_node, f"{base_selector} :text-phone", raw))
-                    break
         
         for num, node_for_ev, sel, raw_disp in candidate_phones:
             evidence = self.evidence_builder.create_evidence_static(
@@ -843,10 +1085,10 @@ class ContactExtractor:
                 joined = urljoin(source_url, href)
                 path = href_low
             # Normalize tokens from person name (ASCII letters best-effort)
-            name_tokens = [t for t in re.split(r"[^a-zA-Z]+", person_name.lower()) if t]
+            name_tokens = [t for t in _NAME_ALPHA_SPLIT_RE.split(person_name.lower()) if t]
             # Fallback: split on non-alphanumerics if above yields nothing
             if not name_tokens:
-                name_tokens = [t for t in re.split(r"[^a-z0-9]+", person_name.lower()) if t]
+                name_tokens = [t for t in _NAME_ALNUM_SPLIT_RE.split(person_name.lower()) if t]
             path_low = path.lower()
             if not any(tok and tok in path_low for tok in name_tokens):
                 # Do not attribute vCard to this person if filename doesn't include their name tokens
@@ -883,22 +1125,18 @@ class ContactExtractor:
                     if not cand or not cand.attrs:
                         continue
                     href = cand.attrs.get('href') or ''
-                    if href and (not href.startswith('mailto:')) and (not href.startswith('tel:')):
+                    if href and not href.startswith(('mailto:', 'tel:')):
                         profile_href = href
                         break
             if profile_href:
                 try:
                     abs_url = urljoin(source_url, profile_href)
                     self._d1_budget -= 1
-                    with httpx.Client(timeout=8.0, follow_redirects=True) as c:
-                        r = c.get(abs_url)
-                        if r.status_code < 400 and 'text/html' in (r.headers.get('Content-Type','').lower()):
-                            bio_contacts = self.extract_from_static_html(r.text, abs_url)
-                            # choose the first matching by name
-                            for bc in bio_contacts:
-                                if bc.person_name.lower() == person_name.lower():
-                                    contacts.append(bc)
-                                    break
+                    if self._d1_pending is not None:
+                        # Top-level page: fetched with the other cards' profiles
+                        self._d1_pending.append((abs_url, person_name))
+                    else:
+                        contacts.extend(self._follow_profiles([(abs_url, person_name)]))
                 except Exception:
                     pass
 
@@ -935,7 +1173,7 @@ class ContactExtractor:
 
                 page.goto(url, wait_until='load', timeout=timeout_ms)
                 try:
-                    page.wait_for_selector("a[href^='mailto'], a[href^='tel']", timeout=2000)
+                    page.wait_for_selector(f"{_MAILTO_PREFIX_SEL}, {_TEL_PREFIX_SEL}", timeout=2000)
                 except Exception:
                     try:
                         page.wait_for_selector("section, .team, [class*=team], [class*=member], article", timeout=2000)
@@ -949,36 +1187,41 @@ class ContactExtractor:
                 except Exception:
                     path_low = ''
                 is_listing_url = any(x in path_low for x in ("/team", "/our-team", "/people", "/leadership", "/management"))
-                site_domain = urlparse(url).netloc.lower().replace('www.', '')
+                site_domain = _site_domain(url)
                 allow_free_env = os.getenv('EGC_ALLOW_FREE_EMAIL', '0') == '1'
                 d1_budget = 5
+                d1_follows: List[Tuple[str, str]] = []
 
                 # -------------------------------
                 # Fast sweep: global mailto/tel first
                 # -------------------------------
                 try:
-                    email_anchors = page.query_selector_all("a[href^='mailto']")
+                    email_anchors = page.query_selector_all(_MAILTO_PREFIX_SEL)
                 except Exception:
                     email_anchors = []
                 try:
-                    phone_anchors = page.query_selector_all("a[href^='tel']")
+                    phone_anchors = page.query_selector_all(_TEL_PREFIX_SEL)
                 except Exception:
                     phone_anchors = []
 
                 def _clean_name(txt: Optional[str]) -> Optional[str]:
                     if not txt:
                         return None
-                    name = re.sub(r'^(Dr\.|Mr\.|Ms\.|Mrs\.)\s+', '', txt.strip())
-                    return name if self._is_valid_person_name(name) else None
+                    name = _HONORIFIC_PREFIX_RE.sub('', txt.strip())
+                    return _shared_name(name) if self._is_valid_person_name(name) else None
 
                 # Emails
-                for a in email_anchors:
+                email_pairs = self._anchor_pairs_playwright(page, _MAILTO_PREFIX_SEL, email_anchors)
+                for i, a in enumerate(email_anchors):
                     # Budget guard
                     if (time.monotonic() - start_t) > budget_s:
                         break
                     try:
-                        href = (a.get_attribute('href') or '').strip()
-                        txt = (a.text_content() or '').strip()
+                        if email_pairs is not None:
+                            href, txt = email_pairs[i][0].strip(), email_pairs[i][1].strip()
+                        else:
+                            href = (a.get_attribute('href') or '').strip()
+                            txt = (a.text_content() or '').strip()
                         email = self._sanitize_mailto(href, txt) or self._deobfuscate_email(href) or self._deobfuscate_email(txt)
                         if not email:
                             continue
@@ -989,12 +1232,12 @@ class ContactExtractor:
                         role = None
                         container = None
                         try:
-                            container = a.query_selector("xpath=ancestor::li[contains(@class, 'list-item')][1]")
+                            container = a.query_selector(_LIST_ITEM_ANCESTOR_XP)
                         except Exception:
                             container = None
                         if container:
                             try:
-                                name_el = container.query_selector("h2, h3, h4, .list-item-content__title")
+                                name_el = container.query_selector(_LIST_ITEM_NAME_SEL)
                                 name = _clean_name(name_el.text_content() if name_el else None)
                             except Exception:
                                 name = None
@@ -1015,7 +1258,7 @@ class ContactExtractor:
                         if not name:
                             # Try nearest previous heading
                             prev = None
-                            for xp in ("xpath=preceding::h2[1]", "xpath=preceding::h3[1]", "xpath=preceding::h4[1]"):
+                            for xp in _PRECEDING_HEADING_XPS:
                                 try:
                                     prev = a.query_selector(xp)
                                     if prev:
@@ -1027,7 +1270,7 @@ class ContactExtractor:
                                     continue
 
                         # Domain policy: accept if domain matches OR we have a valid person name nearby
-                        edom = email.split('@')[-1]
+                        edom = email.rpartition('@')[2]
                         domain_ok = (
                             edom.endswith(site_domain)
                             or self._email_domain_matches_site(edom, site_domain)
@@ -1044,7 +1287,7 @@ class ContactExtractor:
 
                         ev = self.evidence_builder.create_evidence_playwright(
                             source_url=url,
-                            selector="a[href*='mailto:']",
+                            selector=_MAILTO_SEL,
                             page=page,
                             element=a,
                             verbatim_text=txt or email,
@@ -1054,13 +1297,14 @@ class ContactExtractor:
                         continue
 
                 # Phones
-                for a in phone_anchors:
+                phone_pairs = self._anchor_pairs_playwright(page, _TEL_PREFIX_SEL, phone_anchors)
+                for i, a in enumerate(phone_anchors):
                     if (time.monotonic() - start_t) > budget_s:
                         break
                     try:
-                        href = (a.get_attribute('href') or '').strip()
-                        raw = href[4:] if href.lower().startswith('tel:') else href
-                        digits = re.sub(r"\D", "", raw)
+                        href = (phone_pairs[i][0] if phone_pairs is not None else (a.get_attribute('href') or '')).strip()
+                        raw = href[4:] if href[:4].lower() == 'tel:' else href
+                        digits = _digits_only(raw)
                         if len(digits) == 11 and digits.startswith('1'):
                             digits = digits[1:]
                         if not (10 <= len(digits) <= 15):
@@ -1070,12 +1314,12 @@ class ContactExtractor:
                         role = None
                         container = None
                         try:
-                            container = a.query_selector("xpath=ancestor::li[contains(@class, 'list-item')][1]")
+                            container = a.query_selector(_LIST_ITEM_ANCESTOR_XP)
                         except Exception:
                             container = None
                         if container:
                             try:
-                                name_el = container.query_selector("h2, h3, h4, .list-item-content__title")
+                                name_el = container.query_selector(_LIST_ITEM_NAME_SEL)
                                 name = _clean_name(name_el.text_content() if name_el else None)
                             except Exception:
                                 name = None
@@ -1093,7 +1337,7 @@ class ContactExtractor:
                                         continue
                         if not name:
                             prev = None
-                            for xp in ("xpath=preceding::h2[1]", "xpath=preceding::h3[1]", "xpath=preceding::h4[1]"):
+                            for xp in _PRECEDING_HEADING_XPS:
                                 try:
                                     prev = a.query_selector(xp)
                                     if prev:
@@ -1110,10 +1354,10 @@ class ContactExtractor:
 
                         ev = self.evidence_builder.create_evidence_playwright(
                             source_url=url,
-                            selector="a[href*='tel:']",
+                            selector=_TEL_SEL,
                             page=page,
                             element=a,
-                            verbatim_text=(a.text_content() or raw),
+                            verbatim_text=((phone_pairs[i][1] if phone_pairs is not None else a.text_content()) or raw),
                         )
                         out.append(Contact(company=company_name, person_name=name, role_title=role or 'Unknown', contact_type=ContactType.PHONE, contact_value=digits, evidence=ev, captured_at=ev.timestamp))
                     except Exception:
@@ -1141,14 +1385,14 @@ class ContactExtractor:
                         found_phone = False
 
                         # EMAIL via anchors
-                        for a in el.locator("a[href*='mailto:']").all():
+                        for a in el.locator(_MAILTO_SEL).all():
                             href = (a.get_attribute('href') or '').strip()
                             txt = (a.text_content() or '').strip()
                             email = self._sanitize_mailto(href, txt) or self._deobfuscate_email(href) or self._deobfuscate_email(txt)
                             if not email:
                                 continue
                             email = email.lower()
-                            edom = (email.split('@')[-1] or '').lower()
+                            edom = (email.rpartition('@')[2] or '').lower()
                             brand_match = edom.endswith(site_domain) or self._email_domain_matches_site(edom, site_domain)
                             free_ok = (allow_free_env and (edom in self.free_email_domains))
                             accept = False
@@ -1190,7 +1434,7 @@ class ContactExtractor:
                                 continue
                             ev = self.evidence_builder.create_evidence_playwright(
                                 source_url=url,
-                                selector="a[href*='mailto:']",
+                                selector=_MAILTO_SEL,
                                 page=page,
                                 element=a,
                                 verbatim_text=txt or email,
@@ -1214,7 +1458,7 @@ class ContactExtractor:
                                     m2 = self.email_pattern.search((el.text_content() or '').lower())
                                     cand = m2.group(0) if m2 else None
                                 if cand:
-                                    edom = (cand.split('@')[-1] or '').lower()
+                                    edom = (cand.rpartition('@')[2] or '').lower()
                                     brand_match = edom.endswith(site_domain) or self._email_domain_matches_site(edom, site_domain)
                                     free_ok = (allow_free_env and (edom in self.free_email_domains))
                                     accept = False
@@ -1269,11 +1513,11 @@ class ContactExtractor:
                         if not found_email:
                             for a in el.locator("a:has(i[class*='envelope'])").all():
                                 txt = (a.text_content() or '').strip()
-                                m = self.email_pattern.search(txt.lower())
+                                m = self.email_pattern.search(txt.lower()) if '@' in txt else None
                                 if not m:
                                     continue
                                 cand = m.group(0)
-                                edom = (cand.split('@')[-1] or '').lower()
+                                edom = (cand.rpartition('@')[2] or '').lower()
                                 brand_match = edom.endswith(site_domain) or self._email_domain_matches_site(edom, site_domain)
                                 free_ok = (allow_free_env and (edom in self.free_email_domains))
                                 accept = False
@@ -1327,10 +1571,10 @@ class ContactExtractor:
                         # EMAIL via text
                         if not found_email:
                             card_text = (el.text_content() or '')
-                            m = self.email_pattern.search(card_text.lower())
+                            m = self.email_pattern.search(card_text.lower()) if '@' in card_text else None
                             if m:
                                 cand = m.group(0)
-                                edom = (cand.split('@')[-1] or '').lower()
+                                edom = (cand.rpartition('@')[2] or '').lower()
                                 brand_match = edom.endswith(site_domain) or self._email_domain_matches_site(edom, site_domain)
                                 free_ok = (allow_free_env and (edom in self.free_email_domains))
                                 accept = False
@@ -1382,14 +1626,14 @@ class ContactExtractor:
                                     found_email = True
 
                         # PHONE via anchors
-                        for a in el.locator("a[href*='tel:']").all():
+                        for a in el.locator(_TEL_SEL).all():
                             href = a.get_attribute('href') or ''
                             raw = href[4:] if href.startswith('tel:') else href
-                            digits = re.sub(r"\D", "", raw)
+                            digits = _digits_only(raw)
                             if 10 <= len(digits) <= 15:
                                 ev = self.evidence_builder.create_evidence_playwright(
                                     source_url=url,
-                                    selector="a[href*='tel:']",
+                                    selector=_TEL_SEL,
                                     page=page,
                                     element=a,
                                     verbatim_text=(a.text_content() or raw),
@@ -1403,86 +1647,70 @@ class ContactExtractor:
                             for a in el.locator('a').all():
                                 lab = ((a.get_attribute('aria-label') or a.get_attribute('title') or '') or '').lower()
                                 if 'phone' in lab or 'tel' in lab:
-                                    text_block = (el.text_content() or '')
-                                    for m in self.phone_pattern.findall(text_block):
-                                        raw = m if isinstance(m, str) else ''.join(m)
-                                        digits = re.sub(r"\D", "", raw)
-                                        if 10 <= len(digits) <= 15 and not re.match(r'^(19|20)\d{6,8}$', digits):
-                                            ev = self.evidence_builder.create_evidence_playwright(
-                                                source_url=url,
-                                                selector="a[aria|title*=phone]",
-                                                page=page,
-                                                element=a,
-                                                verbatim_text=raw,
-                                            )
-                                            out.append(Contact(company=company_name, person_name=name, role_title=title or 'Unknown', contact_type=ContactType.PHONE, contact_value=digits, evidence=ev, captured_at=ev.timestamp))
-                                            found_phone = True
-                                            break
-                                if found_phone:
-                                    break
-                        if not found_phone:
-                            for a in el.locator("a:has(i[class*='phone']), a:has(i[class*='tel'])").all():
-                                text_block = (el.text_content() or '')
-                                for m in self.phone_pattern.findall(text_block):
-                                    raw = m if isinstance(m, str) else ''.join(m)
-                                    digits = re.sub(r"\D", "", raw)
-                                    if 10 <= len(digits) <= 15 and not re.match(r'^(19|20)\d{6,8}$', digits):
+                                    found = self._first_phone_in_text(el.text_content() or '')
+                                    if found:
+                                        digits, raw = found
                                         ev = self.evidence_builder.create_evidence_playwright(
                                             source_url=url,
-                                            selector="i[class*='phone|tel']~a",
+                                            selector="a[aria|title*=phone]",
                                             page=page,
                                             element=a,
                                             verbatim_text=raw,
                                         )
                                         out.append(Contact(company=company_name, person_name=name, role_title=title or 'Unknown', contact_type=ContactType.PHONE, contact_value=digits, evidence=ev, captured_at=ev.timestamp))
                                         found_phone = True
-                                        break
                                 if found_phone:
                                     break
-
-                        # PHONE via text
                         if not found_phone:
-                            text_block = (el.text_content() or '')
-                            for m in self.phone_pattern.findall(text_block):
-                                raw = m if isinstance(m, str) else ''.join(m)
-                                digits = re.sub(r"\D", "", raw)
-                                if 10 <= len(digits) <= 15 and not re.match(r'^(19|20)\d{6,8}$', digits):
+                            for a in el.locator("a:has(i[class*='phone']), a:has(i[class*='tel'])").all():
+                                found = self._first_phone_in_text(el.text_content() or '')
+                                if found:
+                                    digits, raw = found
                                     ev = self.evidence_builder.create_evidence_playwright(
                                         source_url=url,
-                                        selector=":text-phone(card)",
+                                        selector="i[class*='phone|tel']~a",
                                         page=page,
-                                        element=el,
+                                        element=a,
                                         verbatim_text=raw,
                                     )
                                     out.append(Contact(company=company_name, person_name=name, role_title=title or 'Unknown', contact_type=ContactType.PHONE, contact_value=digits, evidence=ev, captured_at=ev.timestamp))
                                     found_phone = True
+                                if found_phone:
                                     break
 
+                        # PHONE via text
+                        if not found_phone:
+                            found = self._first_phone_in_text(el.text_content() or '')
+                            if found:
+                                digits, raw = found
+                                ev = self.evidence_builder.create_evidence_playwright(
+                                    source_url=url,
+                                    selector=":text-phone(card)",
+                                    page=page,
+                                    element=el,
+                                    verbatim_text=raw,
+                                )
+                                out.append(Contact(company=company_name, person_name=name, role_title=title or 'Unknown', contact_type=ContactType.PHONE, contact_value=digits, evidence=ev, captured_at=ev.timestamp))
+                                found_phone = True
+
                         # D=1 follow-up when no email/phone
                         if (not found_email and not found_phone) and d1_budget > 0:
                             prof_href = None
                             for a in el.locator('a').all():
                                 href = a.get_attribute('href') or ''
-                                if not href or href.startswith('mailto:') or href.startswith('tel:'):
+                                if not href or href.startswith(('mailto:', 'tel:')):
                                     continue
                                 prof_href = href
                                 break
                             if prof_href:
                                 try:
-                                    abs_url = urljoin(url, prof_href)
+                                    d1_follows.append((urljoin(url, prof_href), name))
                                     d1_budget -= 1
-                                    with httpx.Client(timeout=8.0, follow_redirects=True) as c:
-                                        r = c.get(abs_url)
-                                        if r.status_code < 400 and 'text/html' in (r.headers.get('Content-Type','').lower()):
-                                            bio_contacts = self.extract_from_static_html(r.text, abs_url)
-                                            for bc in bio_contacts:
-                                                if bc.person_name.lower() == name.lower():
-                                                    out.append(bc)
-                                                    break
                                 except Exception:
                                     pass
 
                 browser.close()
+                out.extend(self._follow_profiles(d1_follows))
         except Exception:
             pass
         return self._postprocess_and_dedup(out)
@@ -1497,15 +1725,15 @@ class ContactExtractor:
             except Exception:
                 path_low = ''
             is_listing_url = any(x in path_low for x in ("/team", "/our-team", "/people", "/leadership", "/management"))
-            site_domain = urlparse(url).netloc.lower().replace('www.', '')
+            site_domain = _site_domain(url)
             allow_free_env = os.getenv('EGC_ALLOW_FREE_EMAIL', '0') == '1'
 
             try:
-                email_anchors = page.query_selector_all("a[href^='mailto']")
+                email_anchors = page.query_selector_all(_MAILTO_PREFIX_SEL)
             except Exception:
                 email_anchors = []
             try:
-                phone_anchors = page.query_selector_all("a[href^='tel']")
+                phone_anchors = page.query_selector_all(_TEL_PREFIX_SEL)
             except Exception:
                 phone_anchors = []
 
@@ -1520,13 +1748,17 @@ class ContactExtractor:
             def _clean_name(txt: Optional[str]) -> Optional[str]:
                 if not txt:
                     return None
-                name = re.sub(r'^(Dr\.|Mr\.|Ms\.|Mrs\.)\s+', '', txt.strip())
-                return name if self._is_valid_person_name(name) else None
+                name = _HONORIFIC_PREFIX_RE.sub('', txt.strip())
+                return _shared_name(name) if self._is_valid_person_name(name) else None
 
-            for a in email_anchors:
+            email_pairs = self._anchor_pairs_playwright(page, _MAILTO_PREFIX_SEL, email_anchors)
+            for i, a in enumerate(email_anchors):
                 try:
-                    href = (a.get_attribute('href') or '').strip()
-                    txt = (a.text_content() or '').strip()
+                    if email_pairs is not None:
+                        href, txt = email_pairs[i][0].strip(), email_pairs[i][1].strip()
+                    else:
+                        href = (a.get_attribute('href') or '').strip()
+                        txt = (a.text_content() or '').strip()
                     email = self._sanitize_mailto(href, txt) or self._deobfuscate_email(href) or self._deobfuscate_email(txt)
                     if not email:
                         continue
@@ -1535,12 +1767,12 @@ class ContactExtractor:
                     role = None
                     container = None
                     try:
-                        container = a.query_selector("xpath=ancestor::li[contains(@class, 'list-item')][1]")
+                        container = a.query_selector(_LIST_ITEM_ANCESTOR_XP)
                     except Exception:
                         container = None
                     if container:
                         try:
-                            name_el = container.query_selector("h2, h3, h4, .list-item-content__title")
+                            name_el = container.query_selector(_LIST_ITEM_NAME_SEL)
                             name = _clean_name(name_el.text_content() if name_el else None)
                         except Exception:
                             name = None
@@ -1557,7 +1789,7 @@ class ContactExtractor:
                                 except Exception:
                                     continue
                     if not name:
-                        for xp in ("xpath=preceding::h2[1]", "xpath=preceding::h3[1]", "xpath=preceding::h4[1]"):
+                        for xp in _PRECEDING_HEADING_XPS:
                             try:
                                 prev = a.query_selector(xp)
                                 if prev:
@@ -1568,7 +1800,7 @@ class ContactExtractor:
                             except Exception:
                                 continue
                     # Domain policy: accept brand OR score-based cross-domain
-                    edom = (email.split('@')[-1] or '').lower()
+                    edom = (email.rpartition('@')[2] or '').lower()
                     brand_match = edom.endswith(site_domain) or self._email_domain_matches_site(edom, site_domain)
                     free_ok = (allow_free_env and (edom in self.free_email_domains))
                     accept = False
@@ -1586,11 +1818,11 @@ class ContactExtractor:
                             has_show_trigger = bool(self._show_email_re.search(container_txt.lower())) if container_txt else False
                             if container:
                                 try:
-                                    has_phone_hint = container.query_selector("a[href*='tel:']") is not None
+                                    has_phone_hint = container.query_selector(_TEL_SEL) is not None
                                 except Exception:
                                     has_phone_hint = False
                                 try:
-                                    has_vcf_hint = container.query_selector("a[href$='.vcf']") is not None
+                                    has_vcf_hint = container.query_selector(_VCARD_SEL) is not None
                                 except Exception:
                                     has_vcf_hint = False
                         except Exception:
@@ -1631,7 +1863,7 @@ class ContactExtractor:
                         role = "Unknown"
                     ev = self.evidence_builder.create_evidence_playwright(
                         source_url=url,
-                        selector="a[href*='mailto:']",
+                        selector=_MAILTO_SEL,
                         page=page,
                         element=a,
                         verbatim_text=txt or email,
@@ -1640,11 +1872,12 @@ class ContactExtractor:
                 except Exception:
                     continue
 
-            for a in phone_anchors:
+            phone_pairs = self._anchor_pairs_playwright(page, _TEL_PREFIX_SEL, phone_anchors)
+            for i, a in enumerate(phone_anchors):
                 try:
-                    href = (a.get_attribute('href') or '').strip()
-                    raw = href[4:] if href.lower().startswith('tel:') else href
-                    digits = re.sub(r"\D", "", raw)
+                    href = (phone_pairs[i][0] if phone_pairs is not None else (a.get_attribute('href') or '')).strip()
+                    raw = href[4:] if href[:4].lower() == 'tel:' else href
+                    digits = _digits_only(raw)
                     if len(digits) == 11 and digits.startswith('1'):
                         digits = digits[1:]
                     if not (10 <= len(digits) <= 15):
@@ -1653,12 +1886,12 @@ class ContactExtractor:
                     role = None
                     container = None
                     try:
-                        container = a.query_selector("xpath=ancestor::li[contains(@class, 'list-item')][1]")
+                        container = a.query_selector(_LIST_ITEM_ANCESTOR_XP)
                     except Exception:
                         container = None
                     if container:
                         try:
-                            name_el = container.query_selector("h2, h3, h4, .list-item-content__title")
+                            name_el = container.query_selector(_LIST_ITEM_NAME_SEL)
                             name = _clean_name(name_el.text_content() if name_el else None)
                         except Exception:
                             name = None
@@ -1675,7 +1908,7 @@ class ContactExtractor:
                                 except Exception:
                                     continue
                     if not name:
-                        for xp in ("xpath=preceding::h2[1]", "xpath=preceding::h3[1]", "xpath=preceding::h4[1]"):
+                        for xp in _PRECEDING_HEADING_XPS:
                             try:
                                 prev = a.query_selector(xp)
                                 if prev:
@@ -1691,10 +1924,10 @@ class ContactExtractor:
                         role = "Unknown"
                     ev = self.evidence_builder.create_evidence_playwright(
                         source_url=url,
-                        selector="a[href*='tel:']",
+                        selector=_TEL_SEL,
                         page=page,
                         element=a,
-                        verbatim_text=(a.text_content() or raw),
+                        verbatim_text=((phone_pairs[i][1] if phone_pairs is not None else a.text_content()) or raw),
                     )
                     out.append(Contact(company=company_name, person_name=name, role_title=role or 'Unknown', contact_type=ContactType.PHONE, contact_value=digits, evidence=ev, captured_at=ev.timestamp))
                 except Exception:
@@ -1704,34 +1937,48 @@ class ContactExtractor:
         except Exception:
             return []
 
+    def _anchor_pairs_playwright(self, page: Page, selector: str, anchors: list) -> Optional[List[Tuple[str, str]]]:
+        """(href, textContent) for each of ``anchors``, the page's matches for ``selector``.
+
+        Read for all anchors in one round trip instead of two per anchor. Returns
+        None when the batch read fails or the page changed between the two
+        queries, so callers read each handle themselves.
+        """
+        try:
+            pairs = page.eval_on_selector_all(selector, _HREF_TEXT_JS)
+            if len(pairs) == len(anchors):
+                return [(pair[0] or '', pair[1] or '') for pair in pairs]
+        except Exception:
+            pass
+        return None
+
     def _xdom_prepare_context_playwright(self, page: Page, source_url: str) -> None:
         """Populate domain counts and footer/contact text from a Playwright Page."""
         counts: Counter[str] = Counter()
         try:
-            anchors = page.query_selector_all("a[href^='mailto']")
+            # One round-trip for every anchor's (href, text) instead of two per anchor
+            anchors = list(page.eval_on_selector_all(
+                _MAILTO_PREFIX_SEL,
+                _HREF_TEXT_JS,
+            ))
         except Exception:
             anchors = []
-        for a in anchors or []:
+        for pair in anchors:
             try:
-                href = (a.get_attribute('href') or '').strip()
-                txt = (a.text_content() or '').strip()
+                href, txt = (pair[0] or '').strip(), (pair[1] or '').strip()
                 email = self._sanitize_mailto(href, txt) or self._deobfuscate_email(href) or self._deobfuscate_email(txt)
                 if not email or '@' not in email:
                     continue
-                edom = email.split('@')[-1].lower()
+                edom = email.rpartition('@')[2].lower()
                 counts[edom] += 1
             except Exception:
                 continue
         parts: List[str] = []
         try:
-            for sel in ['footer', 'address', '.contact', '.contacts', '.contact-info', '.contact-us', "[class*='contact']"]:
-                try:
-                    for el in page.locator(sel).all():
-                        t = (el.text_content() or '').strip()
-                        if t:
-                            parts.append(t)
-                except Exception:
-                    continue
+            for t in page.locator(_FOOTER_CONTACT_SEL).all_text_contents():
+                t = (t or '').strip()
+                if t:
+                    parts.append(t)
         except Exception:
             pass
         self._page_mailto_counts = counts
@@ -1745,9 +1992,8 @@ class ContactExtractor:
                 return True
             # Also check visible button/anchor descendants
             try:
-                nodes = el.locator('a, button, span, div').all()
-                for n in nodes:
-                    t = (n.text_content() or '').lower()
+                for t in el.locator('a, button, span, div').all_text_contents():
+                    t = (t or '').lower()
                     if t and self._show_email_re.search(t):
                         return True
             except Exception:
@@ -1759,7 +2005,7 @@ class ContactExtractor:
     def _element_has_phone_hint_pw(self, el: Locator) -> bool:
         try:
             try:
-                if el.locator("a[href*='tel:']").count() > 0:
+                if el.locator(_TEL_SEL).count() > 0:
                     return True
             except Exception:
                 pass
@@ -1770,7 +2016,7 @@ class ContactExtractor:
 
     def _element_has_vcf_hint_pw(self, el: Locator) -> bool:
         try:
-            return el.locator("a[href$='.vcf']").count() > 0
+            return el.locator(_VCARD_SEL).count() > 0
         except Exception:
             return False
 
@@ -1797,7 +2043,7 @@ class ContactExtractor:
         has_vcf_hint = self._element_has_vcf_hint_pw(person_element)
         has_show_trigger = self._element_has_show_email_trigger_pw(person_element)
         negative_zone = self._is_negative_zone_path(source_url)
-        site_domain = urlparse(source_url).netloc.lower().replace('www.', '')
+        site_domain = _site_domain(source_url)
         allow_free_env = os.getenv('EGC_ALLOW_FREE_EMAIL', '0') == '1'
         
         # Extract emails
@@ -1807,7 +2053,7 @@ class ContactExtractor:
             verbatim_text = email_element.text_content() or email
             
             # Domain acceptance with cross-domain scoring
-            edom = (email.split('@')[-1] or '').lower()
+            edom = (email.rpartition('@')[2] or '').lower()
             brand_match = edom.endswith(site_domain) or self._email_domain_matches_site(edom, site_domain)
             free_ok = (allow_free_env and (edom in self.free_email_domains))
             accept = False
@@ -1878,7 +2124,7 @@ class ContactExtractor:
                 element=phone_element,
                 verbatim_text=verbatim_text
             )
-            normalized_phone = re.sub(r"\D", "", phone)
+            normalized_phone = _digits_only(phone)
             try:
                 contacts.append(Contact(
                     company=company_name,
@@ -1901,7 +2147,7 @@ class ContactExtractor:
             if name_node and name_node.text():
                 name = name_node.text().strip()
                 # Basic cleaning
-                name = re.sub(r'^(Dr\.|Mr\.|Ms\.|Mrs\.)\s+', '', name)
+                name = _HONORIFIC_PREFIX_RE.sub('', name)
                 if self._is_valid_person_name(name):
                     return name[:100]
         return None
@@ -1924,7 +2170,7 @@ class ContactExtractor:
                 name = name_element.text_content()
                 if name:
                     name = name.strip()
-                    name = re.sub(r'^(Dr\.|Mr\.|Ms\.|Mrs\.)\s+', '', name)
+                    name = _HONORIFIC_PREFIX_RE.sub('', name)
                     if len(name) > 3:
                         return name[:100]
             except Exception:
@@ -1950,16 +2196,19 @@ class ContactExtractor:
         emails = []
         
         # Look for mailto links only (avoid text scanning to reduce noise)
-        mailto_links = person_node.css('a[href*="mailto:"]')
+        mailto_links = person_node.css(_MAILTO_SEL)
         for link in mailto_links:
             href = link.attrs.get('href', '')
             if href.startswith('mailto:'):
-                email = href[7:]  # Remove 'mailto:'
-                if self.email_pattern.match(email):
+                # Drop 'mailto:' and any ?subject=/#fragment tail
+                raw = href[7:].partition('?')[0]
+                if '@' not in raw:
+                    continue
+                email = raw.strip().lower()
+                if self.email_pattern.fullmatch(email):
                     emails.append((email, 'a[href*="mailto:"]'))
         
         return emails
-        return emails
 
     # -------------------------
     # Card root and proximity helpers
@@ -1973,8 +2222,8 @@ class ContactExtractor:
         cur = node
         max_up = 3
         while cur is not None and max_up >= 0:
-            cls = (cur.attrs.get('class', '') or '').lower()
-            tokens = set(re.split(r"[\s_-]+", cls)) if cls else set()
+            cls = _node_class(cur)
+            tokens = set(_CLASS_TOKEN_SPLIT_RE.split(cls)) if cls else set()
             if any(tok in tokens for tok in preferred_tokens) or cur.tag in ('article', 'section'):
                 return cur
             cur = cur.parent
@@ -1986,9 +2235,9 @@ class ContactExtractor:
         Falls back to token-based _get_card_root if no repetition is detected.
         """
         def signature(n: Node) -> str:
-            cls = (n.attrs.get('class','') or '').lower()
+            cls = _node_class(n)
             tag = n.tag or ''
-            tokens = re.split(r"[\s_-]+", cls) if cls else []
+            tokens = _CLASS_TOKEN_SPLIT_RE.split(cls) if cls else []
             sig = tag + ':' + '|'.join(tokens[:2])
             return sig
         def direct_children(n: Node):
@@ -2026,8 +2275,8 @@ class ContactExtractor:
         if not n or not n.text():
             return None
         name = n.text().strip()
-        name = re.sub(r'^(Dr\.|Mr\.|Ms\.|Mrs\.)\s+', '', name)
-        return name if self._is_valid_person_name(name) else None
+        name = _HONORIFIC_PREFIX_RE.sub('', name)
+        return _shared_name(name) if self._is_valid_person_name(name) else None
 
     def _ancestors(self, n: Node) -> List[Node]:
         res = []
@@ -2074,11 +2323,19 @@ class ContactExtractor:
         # If name is inside a paragraph, try text after <br>
         parent = name_node.parent
         if parent is not None and parent.tag == 'p':
-            raw_html = parent.html or ''
-            parts = re.split(r'<br\s*/?>', raw_html, flags=re.IGNORECASE)
-            if len(parts) >= 2:
-                # Take the text after the first <br>
-                after = HTMLParser(parts[1]).text().strip()
+            # Take the text between the first <br> and the next one, walking the
+            # already-parsed paragraph instead of re-parsing its serialized HTML
+            seen_br = False
+            after_parts: List[str] = []
+            for n in parent.traverse(include_text=True):
+                if n.tag == 'br':
+                    if seen_br:
+                        break
+                    seen_br = True
+                elif seen_br and n.tag == '-text':
+                    after_parts.append(n.text_content or '')
+            if seen_br:
+                after = ''.join(after_parts).strip()
                 if self._is_valid_role_title(after):
                     return after
         # Else try next sibling text within the same fusion-text container
@@ -2106,7 +2363,7 @@ class ContactExtractor:
             sib = root.parent.child
             while sib is not None:
                 if sib is not root:
-                    cls = (sib.attrs.get('class','') or '').lower()
+                    cls = _node_class(sib)
                     if any(tok in cls for tok in ['eti-links','links','contact','contacts','actions','icons']):
                         return sib
                 sib = sib.next
@@ -2133,8 +2390,8 @@ class ContactExtractor:
             if len(children) < 3:
                 continue
             def sig(n: Node) -> str:
-                cls = (n.attrs.get('class','') or '').lower()
-                tokens = re.split(r"[\s_-]+", cls) if cls else []
+                cls = _node_class(n)
+                tokens = _CLASS_TOKEN_SPLIT_RE.split(cls) if cls else []
                 return f"{n.tag}:{'|'.join(tokens[:2])}"
             groups: Dict[str, List[Node]] = {}
             for n in children:
@@ -2160,7 +2417,7 @@ class ContactExtractor:
         if not name:
             return False
         # Exclude generic section headers
-        if re.search(r"^(Our Team|Team|People|Staff|Contact|Contacts|News|Press)$", name, re.IGNORECASE):
+        if _SECTION_HEADER_NAME_RE.search(name):
             return False
         # Non-person stop-list
         stoplist = {
@@ -2170,7 +2427,7 @@ class ContactExtractor:
         if name.strip().lower() in stoplist:
             return False
         # Require at least two tokens; each must contain at least one letter (Unicode-aware)
-        parts = [p for p in re.split(r"\s+", name.strip()) if p]
+        parts = name.split()
         if len(parts) < 2:
             return False
         def has_letter(tok: str) -> bool:
@@ -2217,11 +2474,11 @@ class ContactExtractor:
             if c.contact_type.value == 'email':
                 return (c.contact_value or '').strip().lower()
             if c.contact_type.value == 'phone':
-                return re.sub(r"\D", "", c.contact_value or '')
+                return _digits_only(c.contact_value or '')
             return (c.contact_value or '').strip().lower()
         def quality(c: Contact) -> tuple:
             sel = (c.evidence.selector_or_xpath or '').lower() if c.evidence else ''
-            anchor_pref = 1 if ('mailto:' in sel or "a[href*='mailto:']" in sel or 'tel:' in sel or "a[href*='tel:']" in sel) else 0
+            anchor_pref = 1 if ('mailto:' in sel or 'tel:' in sel) else 0
             role_good = 1 if (c.role_title and c.role_title.strip().lower() != 'unknown') else 0
             return (anchor_pref, role_good)
 
@@ -2267,7 +2524,7 @@ class ContactExtractor:
         phones = []
         
         # Look for tel links only
-        tel_links = person_node.css('a[href*="tel:"]')
+        tel_links = person_node.css(_TEL_SEL)
         for link in tel_links:
             href = link.attrs.get('href', '')
             if href.startswith('tel:'):
@@ -2282,7 +2539,7 @@ class ContactExtractor:
         
         # Look for mailto links
         try:
-            mailto_links = person_element.locator('a[href*="mailto:"]').all()
+            mailto_links = person_element.locator(_MAILTO_SEL).all()
             for link in mailto_links:
                 href = link.get_attribute('href') or ''
                 if href.startswith('mailto:'):
@@ -2295,7 +2552,7 @@ class ContactExtractor:
         # Look for email patterns in text (create locator for text context)
         try:
             text_content = person_element.text_content() or ''
-            found_emails = self.email_pattern.findall(text_content)
+            found_emails = self.email_pattern.findall(text_content) if '@' in text_content else []
             for email in found_emails:
                 if email not in [e[0] for e in emails]:
                     # Use the person element itself as context
@@ -2311,7 +2568,7 @@ class ContactExtractor:
         
         # Look for tel links
         try:
-            tel_links = person_element.locator('a[href*="tel:"]').all()
+            tel_links = person_element.locator(_TEL_SEL).all()
             for link in tel_links:
                 href = link.get_attribute('href') or ''
                 if href.startswith('tel:'):
@@ -2347,7 +2604,7 @@ class ContactExtractor:
         contacts = []
         
         # Find all mailto links on the page
-        mailto_links = parser.css('a[href*="mailto:"]')
+        mailto_links = parser.css(_MAILTO_SEL)
         
         for link in mailto_links:
             href = link.attrs.get('href', '')
@@ -2384,7 +2641,7 @@ class ContactExtractor:
             ))
         
         # Find phone numbers in tel links
-        tel_links = parser.css('a[href*="tel:"]')
+        tel_links = parser.css(_TEL_SEL)
         
         for link in tel_links:
             href = link.attrs.get('href', '')
@@ -2427,26 +2684,17 @@ class ContactExtractor:
         tables = parser.css('table') or []
         if not tables:
             return results
-        site_domain = urlparse(source_url).netloc.lower().replace('www.', '')
+        site_domain = _site_domain(source_url)
         allow_free_env = os.getenv('EGC_ALLOW_FREE_EMAIL', '0') == '1'
 
         def norm_txt(s: Optional[str]) -> str:
-            return re.sub(r"\s+", " ", (s or '').strip()).lower()
+            return _WHITESPACE_RUN_RE.sub(" ", (s or '').strip()).lower()
         # Header classification
         def classify(h: str) -> str | None:
             h = norm_txt(h)
-            if re.search(r"\b(full\s*name|name|person|employee|имя|фамилия|surname)\b", h):
-                return 'name'
-            if re.search(r"\b(first\s*name)\b", h):
-                return 'first'
-            if re.search(r"\b(last\s*name|surname|фамилия)\b", h):
-                return 'last'
-            if re.search(r"\b(title|role|position|должность)\b", h):
-                return 'title'
-            if re.search(r"\b(email|e-mail|mail|почта)\b", h):
-                return 'email'
-            if re.search(r"\b(phone|telephone|tel|телефон)\b", h):
-                return 'phone'
+            for pattern, kind in _TABLE_HEADER_RULES:
+                if pattern.search(h):
+                    return kind
             return None
 
         for tbl in tables:
@@ -2494,10 +2742,10 @@ class ContactExtractor:
                 if 'email' in col_map:
                     email_text, email_node = get_cell(col_map['email'])
                     # Prefer mailto in the cell
-                    a_mail = email_node.css_first("a[href*='mailto:']") if email_node else None
+                    a_mail = email_node.css_first(_MAILTO_SEL) if email_node else None
                     if a_mail:
                         href = a_mail.attrs.get('href','')
-                        if href.lower().startswith('mailto:'):
+                        if href[:7].lower() == 'mailto:':
                             email_val = href[7:]
                         elif '@' in href:
                             email_val = href
@@ -2510,12 +2758,12 @@ class ContactExtractor:
                     phone_text, phone_node = get_cell(col_map['phone'])
                     m = self.phone_pattern.search(phone_text or '')
                     if m:
-                        phone_val = re.sub(r"\D", "", m.group(0))
+                        phone_val = _digits_only(m.group(0))
 
                 # Domain policy for email
                 email_ok = False
                 if email_val:
-                    email_domain = email_val.split('@')[-1].lower()
+                    email_domain = email_val.rpartition('@')[2].lower()
                     same_domain = email_domain.endswith(site_domain)
                     email_ok = same_domain or (self.aggressive_static and self._email_domain_matches_site(email_domain, site_domain)) or (allow_free_env and (email_domain in self.free_email_domains))
 
@@ -2562,7 +2810,7 @@ class ContactExtractor:
                         pass
 
                 # VCF in row
-                a_vcf = tr.css_first("a[href$='.vcf']")
+                a_vcf = tr.css_first(_VCARD_SEL)
                 if a_vcf:
                     vcf_url = urljoin(source_url, a_vcf.attrs.get('href',''))
                     evv = self.evidence_builder.create_evidence_static(
@@ -2599,8 +2847,7 @@ class ContactExtractor:
             parent_text = parent.text() or ''
             
             # Look for patterns like "John Doe Email: john@example.com"
-            name_pattern = r'([A-Z][a-z]+ [A-Z][a-z]+(?:,? [A-Z]\.?[A-Z]\.?)?)'
-            names = re.findall(name_pattern, parent_text)
+            names = _CAPITALIZED_NAME_RE.findall(parent_text)
             
             for name in names:
                 if len(name) > 5 and not any(word in name.lower() for word in 
@@ -6,7 +6,7 @@ from typing import Optional
 from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class PlaywrightResult:
     url: str
     status_code: int
@@ -12,7 +12,7 @@ import httpx
 DEFAULT_UA = "EGC-StaticFetcher/0.1 (+https://example.com)"
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class FetchResult:
     url: str
     status_code: int
@@ -42,6 +42,8 @@ class StaticFetcher:
         self.user_agent = user_agent
         self.respect_robots = respect_robots
         self._client = httpx.Client(timeout=self.timeout_s, headers={"User-Agent": self.user_agent})
+        # Parsed robots.txt per origin; None when the site has none (allow all)
+        self._robots: dict[str, robotparser.RobotFileParser | None] = {}
 
     def close(self) -> None:
         self._client.close()
@@ -50,16 +52,23 @@ class StaticFetcher:
         if not self.respect_robots:
             return True
         parsed = urlparse(url)
-        robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
-        try:
-            resp = self._client.get(robots_url)
-        except Exception:
-            # If cannot retrieve robots, default allow in PoC
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        # One robots.txt request per site instead of one per fetched page
+        if origin in self._robots:
+            rp = self._robots[origin]
+        else:
+            try:
+                resp = self._client.get(f"{origin}/robots.txt")
+            except Exception:
+                # If cannot retrieve robots, default allow in PoC (not cached: retried next fetch)
+                return True
+            rp = None
+            if resp.status_code < 400:
+                rp = robotparser.RobotFileParser()
+                rp.parse(resp.text.splitlines())
+            self._robots[origin] = rp
+        if rp is None:
             return True
-        if resp.status_code >= 400:
-            return True
-        rp = robotparser.RobotFileParser()
-        rp.parse(resp.text.splitlines())
         # Try with our UA, else fallback to '*'
         return rp.can_fetch(self.user_agent, url) and rp.can_fetch("*", url)
 
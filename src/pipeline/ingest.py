@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
 from typing import Dict, Optional, List
 import json
@@ -14,7 +15,7 @@ from src.schemas import Contact
 from src.evidence import EvidenceBuilder
 
 
-@dataclass
+@dataclass(slots=True)
 class IngestResult:
     """Result of ingestion pipeline with method tracking and extracted contacts."""
     url: str
@@ -36,32 +37,44 @@ class DomainTracker:
     
     def __init__(self, max_headless_pct: float = 0.2):
         self.max_headless_pct = max_headless_pct
-        self._domain_stats: Dict[str, Dict[str, int]] = {}  # domain -> {static: N, headless: N}
+        # domain -> row index into the parallel counter columns below
+        self._domain_index: Dict[str, int] = {}
+        self._static_counts = array('Q')
+        self._headless_counts = array('Q')
     
     def record_fetch(self, domain: str, method: str) -> None:
         """Record a fetch for domain statistics."""
-        if domain not in self._domain_stats:
-            self._domain_stats[domain] = {"static": 0, "headless": 0}
+        idx = self._domain_index.get(domain)
+        if idx is None:
+            idx = self._domain_index[domain] = len(self._static_counts)
+            self._static_counts.append(0)
+            self._headless_counts.append(0)
         
         if method == "playwright":
-            self._domain_stats[domain]["headless"] += 1
+            self._headless_counts[idx] += 1
         else:
-            self._domain_stats[domain]["static"] += 1
+            self._static_counts[idx] += 1
     
     def can_use_headless(self, domain: str) -> bool:
         """Check if headless usage is within guardrails (percentage)."""
-        stats = self._domain_stats.get(domain, {"static": 0, "headless": 0})
-        total = stats["static"] + stats["headless"]
+        idx = self._domain_index.get(domain)
+        if idx is None:
+            return True
+        headless = self._headless_counts[idx]
+        total = self._static_counts[idx] + headless
         
         if total == 0:
             return True
         
-        current_pct = stats["headless"] / total
+        current_pct = headless / total
         return current_pct < self.max_headless_pct
 
     def get_usage(self, domain: str) -> Dict[str, int]:
         """Return current usage counters for a domain (static/headless)."""
-        return dict(self._domain_stats.get(domain, {"static": 0, "headless": 0}))
+        idx = self._domain_index.get(domain)
+        if idx is None:
+            return {"static": 0, "headless": 0}
+        return {"static": self._static_counts[idx], "headless": self._headless_counts[idx]}
 
 
 class IngestPipeline:
@@ -435,3 +448,6 @@ class IngestPipeline:
     def close(self) -> None:
         """Clean up resources."""
         self.static_fetcher.close()
+        close_extractor = getattr(self.contact_extractor, 'close', None)
+        if callable(close_extractor):
+            close_extractor()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from enum import IntEnum
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 
@@ -30,8 +31,9 @@ class DecisionLevel(IntEnum):
         return mapping.get(key, cls.UNKNOWN)
 
 
-# Separators for tokenization (info only; classification uses regex on the whole string)
-_TOKEN_SPLIT_RE = re.compile(r"[ ,;|/–—·]+")
+# Word tokens of a title; only patterns keyed by one of them are searched
+_WORD_RE = re.compile(r"\w+")
+_GENERAL_COUNSEL_RE = re.compile(r"\bgeneral counsel\b", re.I)
 
 # Negative (exclude) patterns — checked before inclusives (except 'general counsel')
 _NEGATIVE_PATTERNS: list[tuple[re.Pattern[str], str]] = [
@@ -85,6 +87,24 @@ _POSITIVE_PATTERNS: list[tuple[re.Pattern[str], DecisionLevel, str]] = [
     (re.compile(r"\bmanager\b", re.I), DecisionLevel.MGMT, "manager"),
 ]
 
+
+def _index_by_keyword(labels: List[str], extra: dict[str, tuple[str, ...]]) -> dict[str, tuple[int, ...]]:
+    """Map a keyword to the indices (in list order) of patterns that need it.
+
+    Every pattern requires the last word of its label as a whole word, so a
+    title lacking that word cannot match and its pattern is never searched.
+    ``extra`` lists further spellings a pattern accepts (e.g. 'cochair').
+    """
+    index: dict[str, list[int]] = {}
+    for i, label in enumerate(labels):
+        for word in (_WORD_RE.findall(label)[-1], *extra.get(label, ())):
+            index.setdefault(word, []).append(i)
+    return {word: tuple(ids) for word, ids in index.items()}
+
+
+_NEGATIVE_INDEX = _index_by_keyword([label for _, label in _NEGATIVE_PATTERNS], {})
+_POSITIVE_INDEX = _index_by_keyword([label for _, _, label in _POSITIVE_PATTERNS], {"co-chair": ("cochair",)})
+
 # Structural hints coming from URL context
 _STRUCT_HINTS = [
     "leadership",
@@ -103,6 +123,15 @@ def _normalize(s: Optional[str]) -> str:
     return str(s).strip().lower()
 
 
+def _struct_hint(url_ctx: Optional[str]) -> Optional[str]:
+    """Return the first structural hint found in the URL context, if any."""
+    u = _normalize(url_ctx)
+    for key in _STRUCT_HINTS:
+        if key in u:
+            return key
+    return None
+
+
 def classify_role(title: Optional[str], url_ctx: Optional[str] | None = None) -> Tuple[DecisionLevel, List[str]]:
     """Classify a role title into a DecisionLevel and return reasons.
 
@@ -110,23 +139,34 @@ def classify_role(title: Optional[str], url_ctx: Optional[str] | None = None) ->
     - Structural hints from URL context can bump UNKNOWN/MGMT up one level (not above C_SUITE).
     - Robust to None/empty inputs.
     """
+    # Only the normalized title and the URL's first hint affect the result,
+    # so repeated titles across pages share one cache entry
+    level, reasons = _classify_role_cached(_normalize(title), _struct_hint(url_ctx))
+    return level, list(reasons)
+
+
+@lru_cache(maxsize=4096)
+def _classify_role_cached(tnorm: str, hint: Optional[str]) -> Tuple[DecisionLevel, Tuple[str, ...]]:
     reasons: List[str] = []
-    tnorm = _normalize(title)
 
     if not tnorm:
         # No title info
         level = DecisionLevel.UNKNOWN
     else:
-        # Tokenize (not strictly needed for regex-based checks, but kept for spec compliance)
-        _TOKEN_SPLIT_RE.split(tnorm)
-
         # Special-case: if 'general counsel' present, treat as C_SUITE regardless of 'counsel' negatives
-        if re.search(r"\bgeneral counsel\b", tnorm, re.I):
+        if _GENERAL_COUNSEL_RE.search(tnorm):
             level = DecisionLevel.C_SUITE
             reasons.append("title:general counsel")
         else:
+            # Narrow both pattern lists to those whose keyword occurs in the title
+            negatives: set[int] = set()
+            positives: set[int] = set()
+            for word in set(_WORD_RE.findall(tnorm)):
+                negatives.update(_NEGATIVE_INDEX.get(word, ()))
+                positives.update(_POSITIVE_INDEX.get(word, ()))
             # Negatives first
-            for pat, label in _NEGATIVE_PATTERNS:
+            for i in sorted(negatives):
+                pat, label = _NEGATIVE_PATTERNS[i]
                 if pat.search(tnorm):
                     level = DecisionLevel.NON_DM
                     reasons.append(f"exclude:{label}")
@@ -134,26 +174,19 @@ def classify_role(title: Optional[str], url_ctx: Optional[str] | None = None) ->
             else:
                 # Positives in order
                 level = DecisionLevel.UNKNOWN
-                for pat, lvl, label in _POSITIVE_PATTERNS:
+                for i in sorted(positives):
+                    pat, lvl, label = _POSITIVE_PATTERNS[i]
                     if pat.search(tnorm):
                         level = max(level, lvl)  # keep the strongest match if multiple
                         reasons.append(f"title:{label}")
                         # Do not break to allow capturing multiple reasons; final level is the strongest
-                if level is DecisionLevel.UNKNOWN:
-                    # No matches
-                    level = DecisionLevel.UNKNOWN
 
     # Structural hints: bump UNKNOWN/MGMT up one step (not above C_SUITE)
-    if url_ctx:
-        u = _normalize(url_ctx)
-        for key in _STRUCT_HINTS:
-            if key in u:
-                # Record the first structural reason encountered
-                reasons.append(f"struct:{key}")
-                if level in (DecisionLevel.UNKNOWN, DecisionLevel.MGMT):
-                    bumped = DecisionLevel(min(level + 1, DecisionLevel.C_SUITE))
-                    level = bumped
-                break
-
-    return level, reasons
+    if hint:
+        # Record the first structural reason encountered
+        reasons.append(f"struct:{hint}")
+        if level in (DecisionLevel.UNKNOWN, DecisionLevel.MGMT):
+            level = DecisionLevel(min(level + 1, DecisionLevel.C_SUITE))
+
+    return level, tuple(reasons)
 
@@ -5,12 +5,19 @@ Core data models for Contact and Evidence with validation based on
 Mini Evidence Package specification from README.md and WARP.md.
 """
 
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Annotated, Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
 import re
+import sys
 
-from pydantic import BaseModel, Field, field_validator, EmailStr
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # Fallback to pydantic's JSON serializer
+
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, StringConstraints, field_validator, EmailStr
 
 
 class ContactType(str, Enum):
@@ -19,12 +26,83 @@ class ContactType(str, Enum):
     PHONE = "phone"
     LINK = "link"
 
+    @classmethod
+    def from_value(cls, value: str) -> "ContactType":
+        """Plain dict lookup by value, bypassing Enum.__call__."""
+        try:
+            return _CONTACT_TYPE_BY_VALUE[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
 
 class VerificationStatus(str, Enum):
     """Status of record verification based on Evidence Completeness Rate."""
     VERIFIED = "VERIFIED"      # All 7 evidence fields present
     UNVERIFIED = "UNVERIFIED"  # Missing one or more evidence fields
 
+    @classmethod
+    def from_value(cls, value: str) -> "VerificationStatus":
+        """Plain dict lookup by value, bypassing Enum.__call__."""
+        try:
+            return _VERIFICATION_STATUS_BY_VALUE[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+
+_CONTACT_TYPE_BY_VALUE: Dict[str, ContactType] = {e.value: e for e in ContactType}
+_VERIFICATION_STATUS_BY_VALUE: Dict[str, VerificationStatus] = {e.value: e for e in VerificationStatus}
+
+
+# Contact value validation patterns, compiled once at import time
+_EMAIL_VALUE_RE = re.compile(r'^[^@]+@[^@]+\.[^@]+$')
+_PHONE_STRIP_RE = re.compile(r'[\s\-\(\)\+\.]')
+_PHONE_DIGITS_RE = re.compile(r'^\d{7,15}$')
+# ASCII counterpart of _PHONE_STRIP_RE for str.translate (\s covers \x1c-\x1f too)
+_PHONE_STRIP_TABLE = {c: None for c in range(128) if chr(c).isspace() or chr(c) in '-()+.'}
+_VERSION_RE = re.compile(r'^\d+\.\d+\.\d+(-[a-zA-Z0-9]+)?$')
+
+
+def _is_http(v: str) -> bool:
+    # https:// first: it is the common case and `or` short-circuits on it
+    return v.startswith('https://') or v.startswith('http://')
+
+
+def _validate_email(v: str) -> None:
+    if not _EMAIL_VALUE_RE.match(v):
+        raise ValueError('Invalid email format')
+
+
+def _validate_phone(v: str) -> None:
+    if v.isascii():
+        # Extracted values are plain digits; skip both regex passes for them
+        digits = v.translate(_PHONE_STRIP_TABLE)
+        valid = digits.isdigit() and 7 <= len(digits) <= 15
+    else:
+        valid = _PHONE_DIGITS_RE.match(_PHONE_STRIP_RE.sub('', v)) is not None
+    if not valid:
+        raise ValueError('Invalid phone format')
+
+
+def _validate_link(v: str) -> None:
+    if not _is_http(v):
+        raise ValueError('Links must start with http:// or https://')
+
+
+# Per-type contact_value validators (single dict lookup per Contact)
+_VALIDATORS: Dict[ContactType, Callable[[str], None]] = {
+    ContactType.EMAIL: _validate_email,
+    ContactType.PHONE: _validate_phone,
+    ContactType.LINK: _validate_link,
+}
+
+
+# SHA-256 hex digest; format check and lowercasing run inside pydantic-core
+# (the pattern is checked before to_lower, so it accepts either case)
+ContentHash = Annotated[
+    str,
+    StringConstraints(to_lower=True, min_length=64, max_length=64, pattern=r'^[a-fA-F0-9]{64}$'),
+]
+
 
 class ContentHashAlgorithm(str, Enum):
     """Supported content hashing algorithms."""
@@ -58,9 +136,9 @@ class Evidence(BaseModel):
         description="Path/reference to DOM node screenshot"
     )
     
-    timestamp: datetime = Field(
+    timestamp: AwareDatetime = Field(
         ..., 
-        description="ISO 8601 extraction timestamp"
+        description="ISO 8601 extraction timestamp (timezone-aware)"
     )
     
     parser_version: str = Field(
@@ -68,7 +146,7 @@ class Evidence(BaseModel):
         description="Tool version for reproducibility (e.g., '0.1.0-poc')"
     )
     
-    content_hash: str = Field(
+    content_hash: ContentHash = Field(
         ..., 
         description="SHA-256 hash of normalized node text"
     )
@@ -90,32 +168,31 @@ class Evidence(BaseModel):
     @classmethod
     def validate_source_url(cls, v):
         """Validate URL format."""
-        if not v.startswith(('http://', 'https://')):
+        if not _is_http(v):
             raise ValueError('source_url must be a valid HTTP/HTTPS URL')
         return v
 
-    @field_validator('content_hash')
-    @classmethod
-    def validate_content_hash(cls, v):
-        """Validate SHA-256 hash format."""
-        if not re.match(r'^[a-f0-9]{64}$', v.lower()):
-            raise ValueError('content_hash must be a valid SHA-256 hash (64 hex chars)')
-        return v.lower()
-
     @field_validator('parser_version')
     @classmethod
     def validate_parser_version(cls, v):
         """Validate parser version follows semantic versioning pattern."""
-        if not re.match(r'^\d+\.\d+\.\d+(-[a-zA-Z0-9]+)?$', v):
+        if not _VERSION_RE.match(v):
             raise ValueError('parser_version must follow semantic versioning (e.g., "0.1.0-poc")')
         return v
 
+    # Build the validator core on first use rather than at import time.
+    # Evidence is never mutated after extraction, so instances are frozen.
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
 
 class Contact(BaseModel):
     """
     Main contact record with nested Evidence package.
     
     Based on JSON example from README.md with full traceability support.
+    Evidence stays nested: EvidenceBuilder makes it with model_construct and
+    an Evidence instance is not re-validated here, so inlining its 7 fields
+    would add per-record validation rather than remove it.
     """
     company: str = Field(
         ..., 
@@ -147,9 +224,9 @@ class Contact(BaseModel):
         description="Complete Mini Evidence Package for this contact"
     )
     
-    captured_at: datetime = Field(
+    captured_at: AwareDatetime = Field(
         ..., 
-        description="Timestamp when this contact record was created"
+        description="Timestamp when this contact record was created (timezone-aware)"
     )
     
     verification_status: VerificationStatus = Field(
@@ -161,24 +238,26 @@ class Contact(BaseModel):
     @classmethod
     def validate_non_empty_strings(cls, v):
         """Ensure critical string fields are not empty."""
-        if not v or not v.strip():
+        if not v:
             raise ValueError('Field cannot be empty')
-        return v.strip()
+        # Only strip when there is edge whitespace (scraped values are usually clean)
+        if v[0].isspace() or v[-1].isspace():
+            v = v.strip()
+            if not v:
+                raise ValueError('Field cannot be empty')
+        return v
+
+    @field_validator('company', 'role_title')
+    @classmethod
+    def intern_repeated_strings(cls, v):
+        """Intern values shared by many contacts of one crawl (cheap hashing and equality)."""
+        return sys.intern(v)
 
     def model_post_init(self, __context) -> None:
         """Post-initialization validation and status setting."""
         # Validate contact_value based on contact_type
-        if self.contact_type == ContactType.EMAIL:
-            if not re.match(r'^[^@]+@[^@]+\.[^@]+$', self.contact_value):
-                raise ValueError('Invalid email format')
-        elif self.contact_type == ContactType.PHONE:
-            clean_phone = re.sub(r'[\s\-\(\)\+\.]', '', self.contact_value)
-            if not re.match(r'^\d{7,15}$', clean_phone):
-                raise ValueError('Invalid phone format')
-        elif self.contact_type == ContactType.LINK:
-            if not self.contact_value.startswith(('http://', 'https://')):
-                raise ValueError('Links must start with http:// or https://')
-        
+        _VALIDATORS[self.contact_type](self.contact_value)
+
         # Set verification status based on evidence completeness (7 required fields)
         try:
             if self.evidence and self.evidence.is_complete():
@@ -189,20 +268,30 @@ class Contact(BaseModel):
             # Any validation exception implies UNVERIFIED
             self.verification_status = VerificationStatus.UNVERIFIED
 
-    class ConfigDict:
-        """Pydantic v2 configuration."""
-        # Use enum values in serialization
-        use_enum_values = True
-        # Validate assignments
-        validate_assignment = True
+    def to_json_bytes(self, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON bytes (orjson when installed).
+
+        Values are dumped in pydantic's JSON mode first, so datetimes keep
+        pydantic's 'Z' form and the bytes match model_dump_json().
+        """
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if indent else 0
+            return orjson.dumps(self.model_dump(mode='json'), option=option)
+        return self.model_dump_json(indent=2 if indent else None).encode('utf-8')
+
+    # Build the validator core on first use rather than at import time.
+    # Enum members are kept as-is (no use_enum_values): callers rely on .value.
+    model_config = ConfigDict(defer_build=True)
 
 
-class ContactExport(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ContactExport:
     """
-    Simplified model for CSV/JSON exports.
+    Simplified record for CSV/JSON exports.
     
     Flattens nested Evidence for easier consumption while maintaining
-    all required fields from the Mini Evidence Package.
+    all required fields from the Mini Evidence Package. Serialization-only,
+    so it is a plain dataclass rather than a validated pydantic model.
     """
     company: str
     person_name: str
@@ -221,29 +310,44 @@ class ContactExport(BaseModel):
     parser_version: str
     content_hash: str
 
+    @staticmethod
+    def row_from_contact(contact: Contact) -> Tuple[Any, ...]:
+        """Flat export row for one contact, ordered as the fields above (_EXPORT_HEADER)."""
+        # Bind the nested evidence once instead of re-resolving it per field
+        ev = contact.evidence
+        return (
+            contact.company,
+            contact.person_name,
+            contact.role_title,
+            contact.contact_type.value,
+            contact.contact_value,
+            contact.captured_at,
+            contact.verification_status.value,
+            ev.source_url,
+            ev.selector_or_xpath,
+            ev.verbatim_quote,
+            ev.dom_node_screenshot,
+            ev.timestamp,
+            ev.parser_version,
+            ev.content_hash,
+        )
+
     @classmethod
     def from_contact(cls, contact: Contact) -> 'ContactExport':
-        """Create export model from full Contact model."""
-        return cls(
-            company=contact.company,
-            person_name=contact.person_name,
-            role_title=contact.role_title,
-            contact_type=contact.contact_type.value,
-            contact_value=contact.contact_value,
-            captured_at=contact.captured_at,
-            verification_status=contact.verification_status.value,
-            source_url=contact.evidence.source_url,
-            selector_or_xpath=contact.evidence.selector_or_xpath,
-            verbatim_quote=contact.evidence.verbatim_quote,
-            dom_node_screenshot=contact.evidence.dom_node_screenshot,
-            timestamp=contact.evidence.timestamp,
-            parser_version=contact.evidence.parser_version,
-            content_hash=contact.evidence.content_hash,
-        )
+        """Create export record from full Contact model."""
+        return cls(*ContactExport.row_from_contact(contact))
+
+    @staticmethod
+    def rows_from_contacts(contacts: Iterable[Contact]) -> Iterator[Tuple[Any, ...]]:
+        """Lazily map contacts to flat export rows (ordered as _EXPORT_HEADER) without building records."""
+        return map(ContactExport.row_from_contact, contacts)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
 
-    class ConfigDict:
-        """Pydantic v2 configuration for export model."""
-        pass
+# Column order shared by ContactExport and rows_from_contacts
+_EXPORT_HEADER: Tuple[str, ...] = tuple(f.name for f in fields(ContactExport))
 
 
 # Example usage and validation
@@ -273,8 +377,8 @@ if __name__ == "__main__":
     
     print("✅ Contact validation successful!")
     print(f"Status: {example_contact.verification_status}")
-    print(f"JSON: {example_contact.model_dump_json(indent=2)}")
+    print(f"JSON: {example_contact.to_json_bytes(indent=True).decode('utf-8')}")
     
     # Test export model
     export_model = ContactExport.from_contact(example_contact)
-    print("✅ Export model creation successful!")
+    print("✅ Export record creation successful!")
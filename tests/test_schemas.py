@@ -5,9 +5,13 @@ Basic validation tests for Contact and Evidence models to ensure
 they meet Mini Evidence Package requirements.
 """
 
+import json
 import pytest
-from datetime import datetime
-from src.schemas import Contact, Evidence, ContactType, VerificationStatus, ContactExport
+from datetime import datetime, timezone
+from src.schemas import Contact, Evidence, ContactType, VerificationStatus, ContactExport, _EXPORT_HEADER
+
+# Shared timestamp; these tests do not depend on distinct capture times
+_NOW = datetime.now(timezone.utc)
 
 
 class TestEvidence:
@@ -20,7 +24,7 @@ class TestEvidence:
             selector_or_xpath="div.person:nth-child(1)",
             verbatim_quote="John Doe - CEO",
             dom_node_screenshot="evidence/john_doe.png",
-            timestamp=datetime.now(),
+            timestamp=_NOW,
             parser_version="0.1.0-poc",
             content_hash="1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef"
         )
@@ -37,24 +41,64 @@ class TestEvidence:
                 selector_or_xpath="div.person",
                 verbatim_quote="Test",
                 dom_node_screenshot="test.png",
-                timestamp=datetime.now(),
+                timestamp=_NOW,
                 parser_version="0.1.0-poc",
                 content_hash="1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef"
             )
     
     def test_invalid_hash_raises_error(self):
         """Test that invalid SHA-256 hashes raise validation errors."""
-        with pytest.raises(ValueError, match="content_hash must be a valid SHA-256 hash"):
+        with pytest.raises(ValueError, match="content_hash"):
             Evidence(
                 source_url="https://example.com/team",
                 selector_or_xpath="div.person",
                 verbatim_quote="Test",
                 dom_node_screenshot="test.png",
-                timestamp=datetime.now(),
+                timestamp=_NOW,
                 parser_version="0.1.0-poc",
                 content_hash="invalid_hash"
             )
 
+    def test_evidence_is_frozen(self):
+        """Test that Evidence packages cannot be modified after creation."""
+        evidence = Evidence(
+            source_url="https://example.com/team",
+            selector_or_xpath="div.person",
+            verbatim_quote="Test",
+            dom_node_screenshot="test.png",
+            timestamp=_NOW,
+            parser_version="0.1.0-poc",
+            content_hash="1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef"
+        )
+        with pytest.raises(ValueError, match="frozen"):
+            evidence.verbatim_quote = "Changed"
+
+    def test_naive_timestamp_raises_error(self):
+        """Test that timestamps without tzinfo are rejected."""
+        with pytest.raises(ValueError, match="timestamp"):
+            Evidence(
+                source_url="https://example.com/team",
+                selector_or_xpath="div.person",
+                verbatim_quote="Test",
+                dom_node_screenshot="test.png",
+                timestamp=datetime(2025, 9, 4, 10, 15),
+                parser_version="0.1.0-poc",
+                content_hash="1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef"
+            )
+
+    def test_hash_is_lowercased(self):
+        """Test that upper-case SHA-256 hashes are normalized to lower-case."""
+        evidence = Evidence(
+            source_url="https://example.com/team",
+            selector_or_xpath="div.person",
+            verbatim_quote="Test",
+            dom_node_screenshot="test.png",
+            timestamp=_NOW,
+            parser_version="0.1.0-poc",
+            content_hash="ABCDEF1234567890ABCDEF1234567890ABCDEF1234567890ABCDEF1234567890"
+        )
+        assert evidence.content_hash == "abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890"
+
 
 class TestContact:
     """Test cases for Contact model."""
@@ -67,7 +111,7 @@ class TestContact:
             selector_or_xpath="div.person:nth-child(1)",
             verbatim_quote="Jane Smith - CTO",
             dom_node_screenshot="evidence/jane_smith.png",
-            timestamp=datetime.now(),
+            timestamp=_NOW,
             parser_version="0.1.0-poc",
             content_hash="abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890"
         )
@@ -81,7 +125,7 @@ class TestContact:
             contact_type=ContactType.EMAIL,
             contact_value="jane.smith@techcorp.com",
             evidence=valid_evidence,
-            captured_at=datetime.now()
+            captured_at=_NOW
         )
         
         assert contact.company == "Tech Corp"
@@ -96,7 +140,7 @@ class TestContact:
             selector_or_xpath="",  # Empty -> incomplete evidence
             verbatim_quote="Jane Smith - CTO",
             dom_node_screenshot="evidence/jane_smith.png",
-            timestamp=datetime.now(),
+            timestamp=_NOW,
             parser_version="0.1.0-poc",
             content_hash="abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890"
         )
@@ -107,7 +151,7 @@ class TestContact:
             contact_type=ContactType.EMAIL,
             contact_value="jane.smith@techcorp.com",
             evidence=incomplete_evidence,
-            captured_at=datetime.now(),
+            captured_at=_NOW,
         )
         assert contact.verification_status == VerificationStatus.UNVERIFIED
     
@@ -118,7 +162,7 @@ class TestContact:
             selector_or_xpath="",  # Empty -> incomplete evidence
             verbatim_quote="Jane Smith - CTO",
             dom_node_screenshot="evidence/jane_smith.png",
-            timestamp=datetime.now(),
+            timestamp=_NOW,
             parser_version="0.1.0-poc",
             content_hash="abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890"
         )
@@ -129,7 +173,7 @@ class TestContact:
             contact_type=ContactType.EMAIL,
             contact_value="jane.smith@techcorp.com",
             evidence=incomplete_evidence,
-            captured_at=datetime.now(),
+            captured_at=_NOW,
             verification_status=VerificationStatus.VERIFIED  # Should be ignored
         )
         assert contact.verification_status == VerificationStatus.UNVERIFIED
@@ -144,7 +188,7 @@ class TestContact:
             contact_type=ContactType.EMAIL,
             contact_value="john@example.com",
             evidence=valid_evidence,
-            captured_at=datetime.now()
+            captured_at=_NOW
         )
         assert contact.contact_value == "john@example.com"
         
@@ -157,7 +201,7 @@ class TestContact:
                 contact_type=ContactType.EMAIL,
                 contact_value="invalid-email",
                 evidence=valid_evidence,
-                captured_at=datetime.now()
+                captured_at=_NOW
             )
     
     def test_phone_validation(self, valid_evidence):
@@ -178,9 +222,21 @@ class TestContact:
                 contact_type=ContactType.PHONE,
                 contact_value=phone,
                 evidence=valid_evidence,
-                captured_at=datetime.now()
+                captured_at=_NOW
             )
             assert contact.contact_value == phone
+        
+        for phone in ["555-1234x", "123456", "1234567890123456", "555 123 4567 ext"]:
+            with pytest.raises(ValueError, match="Invalid phone format"):
+                Contact(
+                    company="Tech Corp",
+                    person_name="John Doe",
+                    role_title="Developer",
+                    contact_type=ContactType.PHONE,
+                    contact_value=phone,
+                    evidence=valid_evidence,
+                    captured_at=_NOW
+                )
     
     def test_empty_string_validation(self, valid_evidence):
         """Test that empty strings are not allowed for critical fields."""
@@ -192,9 +248,54 @@ class TestContact:
                 contact_type=ContactType.EMAIL,
                 contact_value="john@example.com",
                 evidence=valid_evidence,
-                captured_at=datetime.now()
+                captured_at=_NOW
             )
 
+    def test_to_json_bytes(self, valid_evidence):
+        """Test JSON bytes serialization keeps nested evidence and enum values."""
+        contact = Contact(
+            company="Test Corp",
+            person_name="Jane Smith",
+            role_title="CTO",
+            contact_type=ContactType.EMAIL,
+            contact_value="jane@test.com",
+            evidence=valid_evidence,
+            captured_at=_NOW
+        )
+        data = json.loads(contact.to_json_bytes())
+        assert data["contact_type"] == "email"
+        assert data["verification_status"] == "VERIFIED"
+        assert data["evidence"]["content_hash"] == valid_evidence.content_hash
+
+    @pytest.mark.parametrize("indent", [False, True])
+    def test_to_json_bytes_same_with_and_without_orjson(self, valid_evidence, monkeypatch, indent):
+        """Test orjson and pydantic paths write identical bytes (including 'Z' datetimes)."""
+        pytest.importorskip("orjson")
+        import src.schemas as schemas
+        contact = Contact(
+            company="Test Corp",
+            person_name="Zoë Smith",
+            role_title="CTO",
+            contact_type=ContactType.EMAIL,
+            contact_value="jane@test.com",
+            evidence=valid_evidence,
+            captured_at=_NOW
+        )
+        fast = contact.to_json_bytes(indent=indent)
+        monkeypatch.setattr(schemas, "orjson", None)
+        assert fast == contact.to_json_bytes(indent=indent)
+        assert b'Z"' in fast
+
+
+class TestEnumLookup:
+    """Test cases for value -> enum lookups."""
+
+    def test_from_value(self):
+        assert ContactType.from_value("phone") is ContactType.PHONE
+        assert VerificationStatus.from_value("VERIFIED") is VerificationStatus.VERIFIED
+        with pytest.raises(ValueError, match="not a valid ContactType"):
+            ContactType.from_value("fax")
+
 
 class TestContactExport:
     """Test cases for ContactExport model."""
@@ -206,7 +307,7 @@ class TestContactExport:
             selector_or_xpath="div.founder",
             verbatim_quote="Alice Johnson - Founder & CEO",
             dom_node_screenshot="evidence/alice_johnson.png",
-            timestamp=datetime.now(),
+            timestamp=_NOW,
             parser_version="0.1.0-poc",
             content_hash="fedcba0987654321fedcba0987654321fedcba0987654321fedcba0987654321"
         )
@@ -218,7 +319,7 @@ class TestContactExport:
             contact_type=ContactType.EMAIL,
             contact_value="alice@startup.com",
             evidence=evidence,
-            captured_at=datetime.now()
+            captured_at=_NOW
         )
         
         export = ContactExport.from_contact(contact)
@@ -230,6 +331,16 @@ class TestContactExport:
         assert export.source_url == evidence.source_url
         assert export.content_hash == evidence.content_hash
 
+        # Export records are immutable, flat containers
+        with pytest.raises(AttributeError):
+            export.company = "Other"
+        assert list(export.to_dict())[:2] == ["company", "person_name"]
+
+        # Flat rows follow the same column order as the export record
+        rows = list(ContactExport.rows_from_contacts([contact]))
+        assert rows == [tuple(export.to_dict().values())]
+        assert tuple(export.to_dict()) == _EXPORT_HEADER
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
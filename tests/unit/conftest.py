@@ -0,0 +1,23 @@
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+
+SMTP_PROBE_SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "smtp_probe.py"
+
+
+@pytest.fixture(scope="session")
+def smtp_probe_module() -> types.ModuleType:
+    """scripts/smtp_probe.py loaded once and registered as `smtp_probe` for patch() targets."""
+    if not SMTP_PROBE_SCRIPT.exists():
+        pytest.skip("scripts/smtp_probe.py not implemented yet")
+    spec = importlib.util.spec_from_file_location("smtp_probe", str(SMTP_PROBE_SCRIPT))
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    # Ensure module is visible to dataclasses/type resolution during exec
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -3,6 +3,9 @@ from datetime import datetime, timezone
 from src.pipeline.export import consolidate_per_person
 from src.schemas import Contact, ContactType, Evidence
 
+# Shared timestamp; these tests do not depend on distinct capture times
+_NOW = datetime.now(timezone.utc)
+
 
 def make_ev(url: str, selector: str, verb: str) -> Evidence:
     return Evidence(
@@ -10,7 +13,7 @@ def make_ev(url: str, selector: str, verb: str) -> Evidence:
         selector_or_xpath=selector,
         verbatim_quote=verb,
         dom_node_screenshot="evidence/node.png",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=_NOW,
         parser_version="0.1.0-test",
         content_hash=("a" * 64),
     )
@@ -27,7 +30,7 @@ def test_back_compat_people_consolidation_smoke():
         contact_type=ContactType.EMAIL,
         contact_value="jane.doe@acme.com",
         evidence=make_ev("https://acme.com/our-team", "div a[href*='mailto:']", "jane.doe@acme.com"),
-        captured_at=datetime.now(timezone.utc),
+        captured_at=_NOW,
     )
     c_phone_href = Contact(
         company=company,
@@ -36,7 +39,7 @@ def test_back_compat_people_consolidation_smoke():
         contact_type=ContactType.PHONE,
         contact_value="5551234567",
         evidence=make_ev("https://acme.com/our-team", "div a[href*='tel:']", "+1 555 123 4567"),
-        captured_at=datetime.now(timezone.utc),
+        captured_at=_NOW,
     )
     c_vcard = Contact(
         company=company,
@@ -45,7 +48,7 @@ def test_back_compat_people_consolidation_smoke():
         contact_type=ContactType.LINK,
         contact_value="https://acme.com/people/jane-doe.vcf",
         evidence=make_ev("https://acme.com/our-team", "div a[href$='.vcf']", "Download vCard"),
-        captured_at=datetime.now(timezone.utc),
+        captured_at=_NOW,
     )
 
     rows = consolidate_per_person([c_email, c_phone_href, c_vcard])
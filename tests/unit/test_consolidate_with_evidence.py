@@ -5,6 +5,9 @@ from src.pipeline.export import consolidate_per_person_with_evidence
 from src.pipeline.roles import DecisionLevel
 from src.schemas import Contact, ContactType, Evidence
 
+# Shared timestamp; these tests do not depend on distinct capture times
+_NOW = datetime.now(timezone.utc)
+
 
 def make_evidence(url: str, selector: str, verb: str) -> Evidence:
     return Evidence(
@@ -12,7 +15,7 @@ def make_evidence(url: str, selector: str, verb: str) -> Evidence:
         selector_or_xpath=selector,
         verbatim_quote=verb,
         dom_node_screenshot="evidence/node.png",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=_NOW,
         parser_version="0.1.0-test",
         content_hash=("a" * 64),
     )
@@ -26,7 +29,7 @@ def make_email(company: str, person: str, role: str, email: str, url: str) -> Co
         contact_type=ContactType.EMAIL,
         contact_value=email,
         evidence=make_evidence(url, "div a[href*='mailto:']", email),
-        captured_at=datetime.now(timezone.utc),
+        captured_at=_NOW,
     )
 
 
@@ -40,7 +43,7 @@ def make_phone(company: str, person: str, role: str, phone: str, url: str, verb:
         contact_type=ContactType.PHONE,
         contact_value=phone,
         evidence=make_evidence(url, "div a[href*='tel:']", verb or phone),
-        captured_at=datetime.now(timezone.utc),
+        captured_at=_NOW,
     )
 
 
@@ -3,7 +3,10 @@ import subprocess
 import sys
 from pathlib import Path
 
+import pytest
 
+
+@pytest.mark.serial
 def test_decision_filter_cli(tmp_path: Path):
     # Prepare temporary input JSON with 2 records
     records = [
@@ -1,6 +1,8 @@
 import re
 from pathlib import Path
 
+import pytest
+
 from scripts.decision_filter import DecisionLevel, classify, normalize_email
 
 
@@ -10,8 +12,9 @@ def _rec(title: str, **extra):
     return r
 
 
-def test_classification_vp_plus_or_higher():
-    titles = [
+@pytest.mark.parametrize(
+    "title",
+    [
         "President",
         "Managing Director",
         "Executive Director",
@@ -22,28 +25,31 @@ def test_classification_vp_plus_or_higher():
         "VP",
         "Head of Marketing",
         "Director",
-    ]
-    for t in titles:
-        lvl, _ = classify(_rec(t))
-        assert (
-            lvl in (DecisionLevel.VP_PLUS, DecisionLevel.C_SUITE)
-        ), f"Expected >= VP_PLUS for '{t}', got {lvl}"
+    ],
+)
+def test_classifies_at_or_above_vp_plus(title):
+    lvl, _ = classify(_rec(title))
+    assert (
+        lvl in (DecisionLevel.VP_PLUS, DecisionLevel.C_SUITE)
+    ), f"Expected >= VP_PLUS for '{title}', got {lvl}"
 
 
-def test_classification_negatives_below_vp_plus():
-    negatives = [
+@pytest.mark.parametrize(
+    "title",
+    [
         "Associate",
         "Of Counsel",
         "Counsel",
         "Paralegal",
         "Specialist",
         "Intern",
-    ]
-    for t in negatives:
-        lvl, _ = classify(_rec(t))
-        assert (
-            lvl in (DecisionLevel.UNKNOWN, DecisionLevel.NON_DM, DecisionLevel.MGMT)
-        ), f"Expected < VP_PLUS for '{t}', got {lvl}"
+    ],
+)
+def test_classifies_below_vp_plus(title):
+    lvl, _ = classify(_rec(title))
+    assert (
+        lvl in (DecisionLevel.UNKNOWN, DecisionLevel.NON_DM, DecisionLevel.MGMT)
+    ), f"Expected < VP_PLUS for '{title}', got {lvl}"
 
 
 def test_structural_hint_uplifts_director_to_vp_plus():
@@ -59,3 +65,7 @@ def test_email_normalization_and_generic_flag():
 
     lvl, reasons = classify(_rec("Director", email="info@example.com"))
     assert any(r == "email:generic" for r in reasons)
+
+    # Only an exact shared-inbox local part counts as generic
+    _, reasons = classify(_rec("Director", email="information@example.com"))
+    assert "email:generic" not in reasons
@@ -1,7 +1,48 @@
+from collections import Counter
+
+import pytest
+
 from scripts import decision_filter as df
 
 
-def test_vcard_title_upgrades_to_c_suite(monkeypatch):
+class FakeVcardHttp:
+    """Serves canned vCard HEAD/GET responses keyed by URL and counts calls."""
+
+    def __init__(self):
+        self.responses = {}
+        self.calls = Counter()
+
+    def respond(self, responses):
+        # url -> (status, body); HEAD reports the body length as content-length
+        self.responses.update(responses)
+
+    @property
+    def head_calls(self):
+        return self.calls["head"]
+
+    @property
+    def get_calls(self):
+        return self.calls["get"]
+
+    def head(self, url, timeout_s):
+        self.calls["head"] += 1
+        status, body = self.responses[url]
+        return status, {"content-length": str(len(body))}
+
+    def get(self, url, timeout_s, max_bytes):
+        self.calls["get"] += 1
+        return self.responses[url]
+
+
+@pytest.fixture
+def fake_vcard_http(monkeypatch):
+    fake = FakeVcardHttp()
+    monkeypatch.setattr(df, "_http_head", fake.head)
+    monkeypatch.setattr(df, "_http_get", fake.get)
+    return fake
+
+
+def test_vcard_title_upgrades_to_c_suite(fake_vcard_http):
     # Prepare a record with Unknown title and .vcf URL on allowed host
     recs = [
         {
@@ -10,20 +51,7 @@ def test_vcard_title_upgrades_to_c_suite(monkeypatch):
             "vcard": "https://example.com/card.vcf",
         }
     ]
-
-    # Mock HEAD and GET
-    head_calls = {"n": 0}
-
-    def mock_head(url, timeout_s):
-        head_calls["n"] += 1
-        return 200, {"content-length": "32"}
-
-    def mock_get(url, timeout_s, max_bytes):
-        body = b"TITLE: Managing Director\n"
-        return 200, body
-
-    monkeypatch.setattr(df, "_http_head", mock_head)
-    monkeypatch.setattr(df, "_http_get", mock_get)
+    fake_vcard_http.respond({"https://example.com/card.vcf": (200, b"TITLE: Managing Director\n")})
 
     kept, counts, drops = df.process_records(
         records=recs,
@@ -35,31 +63,23 @@ def test_vcard_title_upgrades_to_c_suite(monkeypatch):
         site_allow=["example.com"],
     )
 
-    assert head_calls["n"] == 1
+    assert fake_vcard_http.head_calls == 1
     assert len(kept) == 1
     out = kept[0]
     assert out["decision_level"] == df.DecisionLevel.C_SUITE.value
     assert out["role_title"] == "Managing Director"
 
 
-def test_vcard_budget_limits_requests(monkeypatch):
+def test_vcard_budget_limits_requests(fake_vcard_http):
     # Two records, budget = 1 -> only first should trigger requests
     recs = [
         {"person_name": "A", "role_title": "Unknown", "vcard": "https://example.com/a.vcf"},
         {"person_name": "B", "role_title": "Unknown", "vcard": "https://example.com/b.vcf"},
     ]
-
-    head_calls = {"n": 0}
-
-    def mock_head(url, timeout_s):
-        head_calls["n"] += 1
-        return 200, {"content-length": "16"}
-
-    def mock_get(url, timeout_s, max_bytes):
-        return 200, b"TITLE: VP\n"
-
-    monkeypatch.setattr(df, "_http_head", mock_head)
-    monkeypatch.setattr(df, "_http_get", mock_get)
+    fake_vcard_http.respond({
+        "https://example.com/a.vcf": (200, b"TITLE: VP\n"),
+        "https://example.com/b.vcf": (200, b"TITLE: VP\n"),
+    })
 
     kept, counts, drops = df.process_records(
         records=recs,
@@ -72,7 +92,8 @@ def test_vcard_budget_limits_requests(monkeypatch):
     )
 
     # Only one HEAD (and one GET) should have occurred
-    assert head_calls["n"] == 1
+    assert fake_vcard_http.head_calls == 1
+    assert fake_vcard_http.get_calls == 1
 
     # First should be upgraded to at least VP_PLUS and kept; second remains UNKNOWN and dropped by threshold
     assert len(kept) == 1
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import dataclasses
+
 from src.pipeline.escalation import decide_escalation, detect_anti_bot
 from src.pipeline.fetchers.static import FetchResult
 
 
-def _fr(**kw):
-    defaults = dict(url="https://example.com", status_code=200, mime="text/html", content_length=8000, html="<html><body>Hello</body></html>", headers={})
-    defaults.update(kw)
-    return FetchResult(**defaults)
+_BASE_FR = FetchResult(url="https://example.com", status_code=200, mime="text/html", content_length=8000, html="<html><body>Hello</body></html>", headers={})
+
+
+def _fr(**kw) -> FetchResult:
+    return dataclasses.replace(_BASE_FR, **kw)
 
 
 def test_no_escalation_when_html_ok_and_hits_positive():
@@ -1,21 +1,26 @@
 from __future__ import annotations
 
+import dataclasses
+
 import pytest
 
 from src.pipeline.escalation import decide_escalation
 from src.pipeline.fetchers.static import FetchResult
 
 
+_BASE_FETCH = FetchResult(
+    url="https://example.com/x",
+    status_code=200,
+    mime="text/html",
+    content_length=0,
+    html=None,
+    headers={},
+    blocked_by_robots=False,
+)
+
+
 def _mk_fetch(mime: str | None, html: str | None, content_length: int) -> FetchResult:
-    return FetchResult(
-        url="https://example.com/x",
-        status_code=200,
-        mime=mime,
-        content_length=content_length,
-        html=html,
-        headers={},
-        blocked_by_robots=False,
-    )
+    return dataclasses.replace(_BASE_FETCH, mime=mime, html=html, content_length=content_length)
 
 
 def test_escalation_triggers_on_non_html_mime():
@@ -5,7 +5,6 @@ Tests Mini Evidence Package creation with all 7 required fields
 for both static HTML and Playwright extraction methods.
 """
 
-import tempfile
 import pytest
 from pathlib import Path
 from datetime import datetime, timezone
@@ -18,67 +17,76 @@ from src.evidence.builder import EvidenceBuilder
 from src.schemas import Evidence
 
 
+def assert_sha256_hex(value: str) -> None:
+    """Assert value is a lower-case 64-char hex digest."""
+    assert len(value) == 64 and value == value.lower()
+    try:
+        bytes.fromhex(value)
+    except ValueError:
+        pytest.fail(f"not a hex digest: {value!r}")
+
+
+@pytest.fixture(scope="session")
+def builder(tmp_path_factory):
+    """Shared EvidenceBuilder; tests only add files to its screenshot directory."""
+    return EvidenceBuilder(
+        parser_version="0.1.0-test",
+        screenshot_dir=tmp_path_factory.mktemp("evidence_builder")
+    )
+
+
+@pytest.fixture(scope="module")
+def person_node():
+    """Parsed `div.person` node shared by static-evidence tests."""
+    return HTMLParser('<div class="person">Jane Doe — Head of Marketing</div>').css_first("div.person")
+
+
 class TestEvidenceBuilder:
     """Test suite for EvidenceBuilder class."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        # Use temporary directory for screenshots
-        self.temp_dir = tempfile.mkdtemp()
-        self.builder = EvidenceBuilder(
-            parser_version="0.1.0-test",
-            screenshot_dir=self.temp_dir
-        )
-    
-    def test_init_creates_screenshot_directory(self):
+    def test_init_creates_screenshot_directory(self, builder):
         """Test that initialization creates screenshot directory."""
-        assert self.builder.screenshot_dir.exists()
-        assert self.builder.parser_version == "0.1.0-test"
+        assert builder.screenshot_dir.exists()
+        assert builder.parser_version == "0.1.0-test"
     
-    def test_compute_content_hash(self):
+    def test_compute_content_hash(self, builder):
         """Test SHA-256 content hash computation."""
         text = "Jane Doe — Head of Marketing"
-        hash_result = self.builder._compute_content_hash(text)
+        hash_result = builder._compute_content_hash(text)
         
         # Should be 64-character hex string
-        assert len(hash_result) == 64
-        assert all(c in '0123456789abcdef' for c in hash_result)
+        assert_sha256_hex(hash_result)
         
         # Should normalize text (same result for different whitespace)
         text_normalized = "  jane doe — head of marketing  "
-        hash_normalized = self.builder._compute_content_hash(text_normalized)
+        hash_normalized = builder._compute_content_hash(text_normalized)
         assert hash_result == hash_normalized
     
-    def test_generate_screenshot_path(self):
+    def test_generate_screenshot_path(self, builder):
         """Test screenshot path generation."""
         url = "https://example.com/team"
         selector = "div.person-card"
         
-        path = self.builder._generate_screenshot_path("static", url, selector)
+        path = builder._generate_screenshot_path("static", url, selector)
         
         # Should be in screenshot directory
-        assert path.parent == self.builder.screenshot_dir
+        assert path.parent == builder.screenshot_dir
         
         # Should contain mode, hashes, and timestamp
         filename = path.name
         assert filename.startswith("static_")
         assert filename.endswith(".png")
     
-    def test_create_evidence_static(self):
+    def test_create_evidence_static(self, builder, person_node):
         """Test evidence creation for static HTML extraction."""
-        # Create mock selectolax node
-        html = '<div class="person">Jane Doe — Head of Marketing</div>'
-        parser = HTMLParser(html)
-        node = parser.css_first("div.person")
-        
         url = "https://example.com/team"
         selector = "div.person"
         verbatim_text = "Jane Doe — Head of Marketing"
         
-        evidence = self.builder.create_evidence_static(
+        evidence = builder.create_evidence_static(
             source_url=url,
             selector=selector,
-            node=node,
+            node=person_node,
             verbatim_text=verbatim_text
         )
         
@@ -89,12 +97,54 @@ class TestEvidenceBuilder:
         assert evidence.dom_node_screenshot  # Should have screenshot path
         assert isinstance(evidence.timestamp, datetime)
         assert evidence.parser_version == "0.1.0-test"
-        assert len(evidence.content_hash) == 64
+        assert_sha256_hex(evidence.content_hash)
         
         # Screenshot path should be in our temp directory
-        assert self.temp_dir in evidence.dom_node_screenshot
+        assert str(builder.screenshot_dir) in evidence.dom_node_screenshot
     
-    def test_create_evidence_playwright(self):
+    def test_built_evidence_matches_validated_model(self, builder, person_node):
+        """Test trusted construction yields the same model full validation would."""
+        evidence = builder.create_evidence_static(
+            source_url="https://example.com/team",
+            selector="div.person",
+            node=person_node,
+            verbatim_text="Jane Doe — Head of Marketing"
+        )
+        
+        assert evidence == Evidence.model_validate(evidence.model_dump())
+        assert evidence.model_fields_set == set(Evidence.model_fields)
+    
+    def test_invalid_source_url_still_rejected(self, builder, person_node):
+        """Test inputs outside the trusted path still go through validation."""
+        with pytest.raises(ValueError, match="source_url"):
+            builder.create_evidence_static(
+                source_url="ftp://example.com/team",
+                selector="div.person",
+                node=person_node,
+                verbatim_text="Jane Doe"
+            )
+    
+    def test_freeze_clock_shares_timestamp(self, builder, person_node):
+        """Test frozen clock stamps every evidence with the batch time."""
+        batch_ts = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        builder.freeze_clock(batch_ts)
+        try:
+            stamps = {
+                builder.create_evidence_static(
+                    source_url="https://example.com/team",
+                    selector=sel,
+                    node=person_node,
+                    verbatim_text="Jane Doe"
+                ).timestamp
+                for sel in ("div.person", "a[href*='mailto:']")
+            }
+        finally:
+            builder.unfreeze_clock()
+        
+        assert stamps == {batch_ts}
+        assert builder._now() != batch_ts
+    
+    def test_create_evidence_playwright(self, builder):
         """Test evidence creation for Playwright extraction."""
         # Create mock Playwright objects
         mock_page = Mock(spec=Page)
@@ -105,7 +155,7 @@ class TestEvidenceBuilder:
         selector = "div.person"
         verbatim_text = "Jane Doe — Head of Marketing"
         
-        evidence = self.builder.create_evidence_playwright(
+        evidence = builder.create_evidence_playwright(
             source_url=url,
             selector=selector,
             page=mock_page,
@@ -120,12 +170,12 @@ class TestEvidenceBuilder:
         assert evidence.dom_node_screenshot  # Should have screenshot path
         assert isinstance(evidence.timestamp, datetime)
         assert evidence.parser_version == "0.1.0-test"
-        assert len(evidence.content_hash) == 64
+        assert_sha256_hex(evidence.content_hash)
         
         # Should have called screenshot method
         mock_element.screenshot.assert_called_once()
     
-    def test_capture_element_screenshot_locator(self):
+    def test_capture_element_screenshot_locator(self, builder):
         """Test element screenshot capture with Locator object."""
         mock_page = Mock(spec=Page)
         mock_locator = Mock(spec=Locator)
@@ -134,7 +184,7 @@ class TestEvidenceBuilder:
         url = "https://example.com/test"
         selector = "div.test"
         
-        screenshot_path = self.builder._capture_element_screenshot(
+        screenshot_path = builder._capture_element_screenshot(
             mock_page, mock_locator, url, selector
         )
         
@@ -147,7 +197,7 @@ class TestEvidenceBuilder:
         assert isinstance(screenshot_path, Path)
         assert screenshot_path.suffix == '.png'
     
-    def test_capture_element_screenshot_element_handle(self):
+    def test_capture_element_screenshot_element_handle(self, builder):
         """Test element screenshot capture with ElementHandle object."""
         mock_page = Mock(spec=Page)
         mock_element = Mock(spec=ElementHandle)
@@ -159,7 +209,7 @@ class TestEvidenceBuilder:
         selector = "div.test"
         
         with patch('builtins.hasattr', return_value=False):
-            screenshot_path = self.builder._capture_element_screenshot(
+            screenshot_path = builder._capture_element_screenshot(
                 mock_page, mock_element, url, selector
             )
         
@@ -170,7 +220,7 @@ class TestEvidenceBuilder:
         assert isinstance(screenshot_path, Path)
         assert screenshot_path.suffix == '.png'
     
-    def test_capture_element_screenshot_failure(self):
+    def test_capture_element_screenshot_failure(self, builder):
         """Test screenshot capture failure handling."""
         mock_page = Mock(spec=Page)
         mock_element = Mock(spec=Locator)
@@ -179,7 +229,7 @@ class TestEvidenceBuilder:
         url = "https://example.com/test"
         selector = "div.test"
         
-        screenshot_path = self.builder._capture_element_screenshot(
+        screenshot_path = builder._capture_element_screenshot(
             mock_page, mock_element, url, selector
         )
         
@@ -192,30 +242,26 @@ class TestEvidenceBuilder:
         content = screenshot_path.read_text()
         assert "Screenshot failed" in content
     
-    def test_validate_evidence_completeness_valid(self):
+    def test_validate_evidence_completeness_valid(self, builder, person_node):
         """Test evidence completeness validation for valid evidence."""
         # Create real evidence with screenshot file
-        html = '<div class="person">Jane Doe</div>'
-        parser = HTMLParser(html)
-        node = parser.css_first("div.person")
-        
-        evidence = self.builder.create_evidence_static(
+        evidence = builder.create_evidence_static(
             source_url="https://example.com/test",
             selector="div.person",
-            node=node,
+            node=person_node,
             verbatim_text="Jane Doe"
         )
         
         # Create screenshot file (static mode creates placeholder)
         screenshot_path = Path(evidence.dom_node_screenshot)
         if not screenshot_path.exists():
-            screenshot_path = self.builder.screenshot_dir / evidence.dom_node_screenshot
+            screenshot_path = builder.screenshot_dir / evidence.dom_node_screenshot
             screenshot_path.touch()
         
         # Should be valid
-        assert self.builder.validate_evidence_completeness(evidence)
+        assert builder.validate_evidence_completeness(evidence)
     
-    def test_validate_evidence_completeness_missing_screenshot(self):
+    def test_validate_evidence_completeness_missing_screenshot(self, builder):
         """Test evidence validation with missing screenshot file."""
         evidence = Evidence(
             source_url="https://example.com/test",
@@ -228,9 +274,9 @@ class TestEvidenceBuilder:
         )
         
         # Should be invalid due to missing screenshot
-        assert not self.builder.validate_evidence_completeness(evidence)
+        assert not builder.validate_evidence_completeness(evidence)
     
-    def test_validate_evidence_completeness_invalid_hash(self):
+    def test_validate_evidence_completeness_invalid_hash(self, builder):
         """Test that Pydantic prevents creation of Evidence with invalid hash."""
         # Pydantic should prevent creating Evidence with invalid hash
         with pytest.raises(Exception):  # ValidationError from pydantic
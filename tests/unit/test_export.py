@@ -8,7 +8,6 @@ evidence package integrity, and file validation.
 import csv
 import json
 import pytest
-import tempfile
 from pathlib import Path
 from datetime import datetime, timezone
 from unittest.mock import patch
@@ -17,90 +16,114 @@ from src.pipeline.export import ContactExporter
 from src.schemas import Contact, ContactType, VerificationStatus, Evidence
 
 
+def read_export(path: Path) -> list:
+    """Load an exported CSV (as dict rows) or JSON file in a single read."""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.suffix == '.csv':
+            return list(csv.DictReader(f))
+        return json.load(f)
+
+
+@pytest.fixture(scope="module")
+def sample_evidence():
+    """Evidence package shared by all contacts (Evidence is frozen, so sharing is safe)."""
+    return Evidence(
+        source_url="https://example.com/team",
+        selector_or_xpath=".team-member",
+        verbatim_quote="John Doe - CEO",
+        dom_node_screenshot="evidence/john_doe.png",
+        timestamp=datetime.now(timezone.utc),
+        parser_version="0.1.0-test",
+        content_hash="a" * 64
+    )
+
+
+@pytest.fixture
+def verified_contact(sample_evidence):
+    """VERIFIED contact with complete evidence."""
+    return Contact(
+        company="Example Inc.",
+        person_name="John Doe",
+        role_title="CEO",
+        contact_type=ContactType.EMAIL,
+        contact_value="john@example.com",
+        evidence=sample_evidence,
+        captured_at=datetime.now(timezone.utc)
+    )
+
+
+@pytest.fixture
+def unverified_contact(sample_evidence):
+    """UNVERIFIED contact for testing: we override status explicitly.
+
+    The data model sets VERIFIED when evidence exists. For testing filtering
+    behavior, we simulate an UNVERIFIED record by overriding the status after
+    creation.
+    """
+    contact = Contact(
+        company="Test Corp",
+        person_name="Jane Smith",
+        role_title="CTO",
+        contact_type=ContactType.EMAIL,
+        contact_value="jane@test.com",
+        evidence=sample_evidence,
+        captured_at=datetime.now(timezone.utc)
+    )
+    contact.verification_status = VerificationStatus.UNVERIFIED
+    return contact
+
+
+@pytest.fixture
+def make_contact(verified_contact):
+    """Factory for contact variants; copies skip re-validating unchanged fields."""
+    def _make(**update):
+        return verified_contact.model_copy(update=update)
+    return _make
+
+
+@pytest.fixture
+def exporter(tmp_path):
+    """Exporter writing into a per-test output directory."""
+    return ContactExporter(output_dir=tmp_path)
+
+
 class TestContactExporter:
     """Test suite for ContactExporter class."""
     
-    def setup_method(self):
-        """Set up test fixtures with temporary output directory."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.exporter = ContactExporter(output_dir=self.temp_dir)
-        
-        # Create sample contacts for testing
-        self.sample_evidence = Evidence(
-            source_url="https://example.com/team",
-            selector_or_xpath=".team-member",
-            verbatim_quote="John Doe - CEO",
-            dom_node_screenshot="evidence/john_doe.png",
-            timestamp=datetime.now(timezone.utc),
-            parser_version="0.1.0-test",
-            content_hash="a" * 64
-        )
-        
-        # VERIFIED contact with complete evidence
-        self.verified_contact = Contact(
-            company="Example Inc.",
-            person_name="John Doe",
-            role_title="CEO",
-            contact_type=ContactType.EMAIL,
-            contact_value="john@example.com",
-            evidence=self.sample_evidence,
-            captured_at=datetime.now(timezone.utc)
-        )
-        
-        # UNVERIFIED contact for testing: we override status explicitly
-        # Note: The data model sets VERIFIED when evidence exists. For testing
-        # filtering behavior, we simulate an UNVERIFIED record by overriding
-        # the status after creation.
-        self.unverified_contact = Contact(
-            company="Test Corp",
-            person_name="Jane Smith",
-            role_title="CTO",
-            contact_type=ContactType.EMAIL,
-            contact_value="jane@test.com",
-            evidence=self.sample_evidence,
-            captured_at=datetime.now(timezone.utc)
-        )
-        # Override verification status to simulate UNVERIFIED record
-        self.unverified_contact.verification_status = VerificationStatus.UNVERIFIED
-    
-    def test_exporter_initialization(self):
+    def test_exporter_initialization(self, exporter):
         """Test ContactExporter initialization creates output directory."""
-        assert self.exporter.output_dir.exists()
-        assert self.exporter.output_dir.is_dir()
+        assert exporter.output_dir.exists()
+        assert exporter.output_dir.is_dir()
     
-    def test_filter_verified_contacts(self):
+    def test_filter_verified_contacts(self, exporter, verified_contact, unverified_contact, capsys):
         """Test filtering to include only VERIFIED contacts."""
-        contacts = [self.verified_contact, self.unverified_contact]
+        contacts = [verified_contact, unverified_contact]
         
-        # Mock print to capture output
-        with patch('builtins.print') as mock_print:
-            verified = self.exporter.filter_verified_contacts(contacts)
+        verified = exporter.filter_verified_contacts(contacts)
         
         # Should only return VERIFIED contact
         assert len(verified) == 1
-        assert verified[0] == self.verified_contact
+        assert verified[0] == verified_contact
         assert verified[0].verification_status == VerificationStatus.VERIFIED
         
-        # Should log filtering stats
-        mock_print.assert_called_once()
-        call_args = mock_print.call_args[0][0]
-        assert "1 VERIFIED" in call_args
-        assert "1 UNVERIFIED" in call_args
+        # Should log filtering stats (a single line)
+        out = capsys.readouterr().out
+        assert out.count("\n") == 1
+        assert "1 VERIFIED" in out
+        assert "1 UNVERIFIED" in out
     
-    def test_csv_export_verified_only(self):
+    def test_csv_export_verified_only(self, exporter, verified_contact, unverified_contact):
         """Test CSV export includes only VERIFIED contacts."""
-        contacts = [self.verified_contact, self.unverified_contact]
+        contacts = [verified_contact, unverified_contact]
         
-        csv_path = self.exporter.to_csv(contacts, "test_contacts.csv")
+        csv_path = exporter.to_csv(contacts, "test_contacts.csv")
         
         # Verify file exists
         assert csv_path.exists()
         assert csv_path.name == "test_contacts.csv"
         
         # Read and validate CSV content
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+        rows = read_export(csv_path)
         
         # Should only have 1 row (VERIFIED contact)
         assert len(rows) == 1
@@ -117,21 +140,20 @@ class TestContactExporter:
         assert row['source_url'] == "https://example.com/team"
         assert row['selector_or_xpath'] == ".team-member"
         assert row['verbatim_quote'] == "John Doe - CEO"
-        assert len(row['content_hash']) == 64
+        assert row['content_hash'] == "a" * 64
     
-    def test_json_export_verified_only(self):
+    def test_json_export_verified_only(self, exporter, verified_contact, unverified_contact):
         """Test JSON export includes only VERIFIED contacts with nested evidence."""
-        contacts = [self.verified_contact, self.unverified_contact]
+        contacts = [verified_contact, unverified_contact]
         
-        json_path = self.exporter.to_json(contacts, "test_contacts.json")
+        json_path = exporter.to_json(contacts, "test_contacts.json")
         
         # Verify file exists
         assert json_path.exists()
         assert json_path.name == "test_contacts.json"
         
         # Read and validate JSON content
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = read_export(json_path)
         
         # Should only have 1 contact (VERIFIED)
         assert len(data) == 1
@@ -149,14 +171,14 @@ class TestContactExporter:
         assert evidence['source_url'] == "https://example.com/team"
         assert evidence['selector_or_xpath'] == ".team-member"
         assert evidence['verbatim_quote'] == "John Doe - CEO"
-        assert len(evidence['content_hash']) == 64
+        assert evidence['content_hash'] == "a" * 64
         assert evidence['parser_version'] == "0.1.0-test"
     
-    def test_export_both_formats(self):
+    def test_export_both_formats(self, exporter, verified_contact):
         """Test exporting to both CSV and JSON formats."""
-        contacts = [self.verified_contact]
+        contacts = [verified_contact]
         
-        csv_path, json_path = self.exporter.to_both(contacts, "test_export")
+        csv_path, json_path = exporter.to_both(contacts, "test_export")
         
         # Both files should exist
         assert csv_path.exists()
@@ -165,44 +187,37 @@ class TestContactExporter:
         assert json_path.name == "test_export.json"
         
         # Both should have same contact count
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            csv_rows = len(list(csv.DictReader(f)))
-        
-        with open(json_path, 'r', encoding='utf-8') as f:
-            json_data = json.load(f)
-        
-        assert csv_rows == len(json_data) == 1
+        assert len(read_export(csv_path)) == len(read_export(json_path)) == 1
     
-    def test_export_empty_contacts_raises_error(self):
+    def test_export_empty_contacts_raises_error(self, exporter):
         """Test that exporting empty contact list raises appropriate error."""
         empty_contacts = []
         
         with pytest.raises(ValueError, match="No VERIFIED contacts to export"):
-            self.exporter.to_csv(empty_contacts)
+            exporter.to_csv(empty_contacts)
         
         with pytest.raises(ValueError, match="No VERIFIED contacts to export"):
-            self.exporter.to_json(empty_contacts)
+            exporter.to_json(empty_contacts)
     
-    def test_export_only_unverified_raises_error(self):
+    def test_export_only_unverified_raises_error(self, exporter, unverified_contact):
         """Test that exporting only UNVERIFIED contacts raises error."""
-        unverified_only = [self.unverified_contact]
+        unverified_only = [unverified_contact]
         
         with pytest.raises(ValueError, match="No VERIFIED contacts to export"):
-            self.exporter.to_csv(unverified_only)
+            exporter.to_csv(unverified_only)
         
         with pytest.raises(ValueError, match="No VERIFIED contacts to export"):
-            self.exporter.to_json(unverified_only)
+            exporter.to_json(unverified_only)
     
-    def test_include_all_flag(self):
+    def test_include_all_flag(self, exporter, verified_contact, unverified_contact):
         """Test include_all flag includes UNVERIFIED contacts."""
-        contacts = [self.verified_contact, self.unverified_contact]
+        contacts = [verified_contact, unverified_contact]
         
         # Export with include_all=True
-        csv_path = self.exporter.to_csv(contacts, "all_contacts.csv", include_all=True)
+        csv_path = exporter.to_csv(contacts, "all_contacts.csv", include_all=True)
         
         # Read CSV content
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            rows = list(csv.DictReader(f))
+        rows = read_export(csv_path)
         
         # Should have both contacts
         assert len(rows) == 2
@@ -212,60 +227,56 @@ class TestContactExporter:
         assert "VERIFIED" in statuses
         assert "UNVERIFIED" in statuses
     
-    def test_auto_filename_generation(self):
+    def test_auto_filename_generation(self, exporter, verified_contact):
         """Test automatic filename generation with timestamp."""
-        contacts = [self.verified_contact]
+        contacts = [verified_contact]
         
         with patch('src.pipeline.export.dt') as mock_datetime:
             mock_datetime.now.return_value.strftime.return_value = "20250909_120000"
             
-            csv_path = self.exporter.to_csv(contacts)  # No filename provided
+            csv_path = exporter.to_csv(contacts)  # No filename provided
             
             assert csv_path.name == "contacts_20250909_120000.csv"
     
-    def test_validate_export_integrity_csv(self):
+    def test_validate_export_integrity_csv(self, exporter, verified_contact, unverified_contact):
         """Test export integrity validation for CSV files."""
-        contacts = [self.verified_contact, self.unverified_contact]
+        contacts = [verified_contact, unverified_contact]
         
-        csv_path = self.exporter.to_csv(contacts, "integrity_test.csv")
+        csv_path = exporter.to_csv(contacts, "integrity_test.csv")
         
         # Validation should pass (1 VERIFIED contact in source = 1 row in CSV)
-        assert self.exporter.validate_export_integrity(contacts, csv_path) is True
+        assert exporter.validate_export_integrity(contacts, csv_path) is True
     
-    def test_validate_export_integrity_json(self):
+    def test_validate_export_integrity_json(self, exporter, verified_contact, unverified_contact):
         """Test export integrity validation for JSON files."""
-        contacts = [self.verified_contact, self.unverified_contact]
+        contacts = [verified_contact, unverified_contact]
         
-        json_path = self.exporter.to_json(contacts, "integrity_test.json")
+        json_path = exporter.to_json(contacts, "integrity_test.json")
         
         # Validation should pass (1 VERIFIED contact = 1 JSON object)
-        assert self.exporter.validate_export_integrity(contacts, json_path) is True
+        assert exporter.validate_export_integrity(contacts, json_path) is True
     
-    def test_validate_export_integrity_nonexistent_file(self):
+    def test_validate_export_integrity_nonexistent_file(self, exporter, verified_contact):
         """Test validation fails for nonexistent file."""
-        contacts = [self.verified_contact]
-        nonexistent_path = Path(self.temp_dir) / "nonexistent.csv"
+        contacts = [verified_contact]
+        nonexistent_path = exporter.output_dir / "nonexistent.csv"
         
-        assert self.exporter.validate_export_integrity(contacts, nonexistent_path) is False
+        assert exporter.validate_export_integrity(contacts, nonexistent_path) is False
     
-    def test_get_export_stats(self):
+    def test_get_export_stats(self, exporter, make_contact, verified_contact, unverified_contact, capsys):
         """Test export statistics generation."""
         # Create additional contacts for better stats
-        phone_contact = Contact(
-            company="Example Inc.",
+        phone_contact = make_contact(
             person_name="Bob Wilson",
-            role_title="Manager", 
+            role_title="Manager",
             contact_type=ContactType.PHONE,
             contact_value="+1-555-123-4567",
-            evidence=self.sample_evidence,
-            captured_at=datetime.now(timezone.utc)
         )
         
-        contacts = [self.verified_contact, phone_contact, self.unverified_contact]
+        contacts = [verified_contact, phone_contact, unverified_contact]
         
-        # Mock print to avoid output during test
-        with patch('builtins.print'):
-            stats = self.exporter.get_export_stats(contacts)
+        stats = exporter.get_export_stats(contacts)
+        assert "2 VERIFIED, 1 UNVERIFIED" in capsys.readouterr().out
         
         # Validate statistics
         assert stats['total_contacts'] == 3
@@ -276,26 +287,22 @@ class TestContactExporter:
         assert stats['evidence_completeness_rate'] == 100.0  # All VERIFIED have evidence
         assert stats['ready_for_export'] is True
     
-    def test_multiple_contact_types_export(self):
+    def test_multiple_contact_types_export(self, exporter, make_contact, verified_contact):
         """Test export with multiple contact types."""
         # Create phone contact
-        phone_contact = Contact(
-            company="Example Inc.",
+        phone_contact = make_contact(
             person_name="Alice Johnson",
             role_title="Developer",
             contact_type=ContactType.PHONE,
             contact_value="+1-555-987-6543",
-            evidence=self.sample_evidence,
-            captured_at=datetime.now(timezone.utc)
         )
         
-        contacts = [self.verified_contact, phone_contact]
+        contacts = [verified_contact, phone_contact]
         
-        json_path = self.exporter.to_json(contacts, "multi_type.json")
+        json_path = exporter.to_json(contacts, "multi_type.json")
         
         # Read and validate
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = read_export(json_path)
         
         assert len(data) == 2
         
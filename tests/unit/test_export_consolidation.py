@@ -6,6 +6,9 @@ from pathlib import Path
 from src.pipeline.export import consolidate_per_person, ContactExporter
 from src.schemas import Contact, ContactType, Evidence
 
+# Shared timestamp; these tests do not depend on distinct capture times
+_NOW = datetime.now(timezone.utc)
+
 
 def make_evidence(source_url: str, selector: str, verb: str) -> Evidence:
     return Evidence(
@@ -13,7 +16,7 @@ def make_evidence(source_url: str, selector: str, verb: str) -> Evidence:
         selector_or_xpath=selector,
         verbatim_quote=verb,
         dom_node_screenshot="evidence/test.png",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=_NOW,
         parser_version="0.1.0-test",
         content_hash=("a" * 64),
     )
@@ -24,7 +27,7 @@ def test_consolidation_picks_best_email_phone_vcard(tmp_path: Path):
     person = "Jane Doe"
     role = "Head of Marketing"
 
-    t0 = datetime.now(timezone.utc)
+    t0 = _NOW
     t1 = t0 + timedelta(seconds=10)
     t2 = t1 + timedelta(seconds=10)
 
@@ -127,12 +130,12 @@ def test_consolidation_prefers_corporate_over_generic_email():
     corp = Contact(
         company=company, person_name=person, role_title=role,
         contact_type=ContactType.EMAIL, contact_value="bob.builder@acme.com",
-        evidence=base_ev, captured_at=datetime.now(timezone.utc),
+        evidence=base_ev, captured_at=_NOW,
     )
     generic = Contact(
         company=company, person_name=person, role_title=role,
         contact_type=ContactType.EMAIL, contact_value="info@acme.com",
-        evidence=base_ev, captured_at=datetime.now(timezone.utc),
+        evidence=base_ev, captured_at=_NOW,
     )
 
     row = consolidate_per_person([generic, corp])[0]
@@ -148,13 +151,13 @@ def test_name_normalization_groups_variants():
     a = Contact(
         company=company, person_name=name1, role_title="Partner",
         contact_type=ContactType.EMAIL, contact_value="jw@lawfirm.com",
-        evidence=ev, captured_at=datetime.now(timezone.utc),
+        evidence=ev, captured_at=_NOW,
     )
     b = Contact(
         company=company, person_name=name2, role_title="Partner",
         contact_type=ContactType.PHONE, contact_value="5551234567",
         evidence=make_evidence("https://lawfirm.com/our-team", "div a[href*='tel:']", "555-123-4567"),
-        captured_at=datetime.now(timezone.utc),
+        captured_at=_NOW,
     )
 
     consolidated = consolidate_per_person([a, b])
@@ -167,12 +170,12 @@ def test_non_person_rows_excluded_from_people():
     a = Contact(
         company=company, person_name="Mailing Address", role_title="Unknown",
         contact_type=ContactType.EMAIL, contact_value="info@bank.com",
-        evidence=ev, captured_at=datetime.now(timezone.utc),
+        evidence=ev, captured_at=_NOW,
     )
     b = Contact(
         company=company, person_name="Click here for support", role_title="Unknown",
         contact_type=ContactType.PHONE, contact_value="8001234567",
-        evidence=ev, captured_at=datetime.now(timezone.utc),
+        evidence=ev, captured_at=_NOW,
     )
     consolidated = consolidate_per_person([a, b])
     assert consolidated == []
@@ -188,12 +191,12 @@ def test_email_matching_local_part_against_name_tokens():
     good = Contact(
         company=company, person_name=person, role_title="Engineer",
         contact_type=ContactType.EMAIL, contact_value="ethan.bevan@acme.com",
-        evidence=ev_team, captured_at=datetime.now(timezone.utc),
+        evidence=ev_team, captured_at=_NOW,
     )
     bad = Contact(
         company=company, person_name=person, role_title="Engineer",
         contact_type=ContactType.EMAIL, contact_value="bchurchill@acme.com",
-        evidence=ev_other, captured_at=datetime.now(timezone.utc),
+        evidence=ev_other, captured_at=_NOW,
     )
 
     row = consolidate_per_person([bad, good])[0]
@@ -209,14 +212,14 @@ def test_phone_prefers_href_and_rejects_date_like_text():
         company=company, person_name=person, role_title="Attorney",
         contact_type=ContactType.PHONE, contact_value="(617) 556-3867",
         evidence=make_evidence("https://richmaylaw.com/our-team", "a[href*='tel:']", "tel:+1 (617) 556-3867"),
-        captured_at=datetime.now(timezone.utc),
+        captured_at=_NOW,
     )
     # Text-only phone (should not be chosen when href exists)
     phone_text = Contact(
         company=company, person_name=person, role_title="Attorney",
         contact_type=ContactType.PHONE, contact_value="617 555 0000",
         evidence=make_evidence("https://richmaylaw.com/our-team", "span.phone", "617 555 0000"),
-        captured_at=datetime.now(timezone.utc),
+        captured_at=_NOW,
     )
 
     row = consolidate_per_person([phone_text, phone_href])[0]
@@ -227,7 +230,25 @@ def test_phone_prefers_href_and_rejects_date_like_text():
         company=company, person_name=person, role_title="Attorney",
         contact_type=ContactType.PHONE, contact_value="2023101000",  # 10 digits starting with 20...
         evidence=make_evidence("https://richmaylaw.com/our-team", "span.phone", "2023-10-10 00"),
-        captured_at=datetime.now(timezone.utc),
+        captured_at=_NOW,
     )
     row2 = consolidate_per_person([only_date_like])[0]
     assert row2["phone"] == ""
+
+
+def test_parallel_consolidation_matches_serial(monkeypatch):
+    from src.pipeline import export
+
+    ev = make_evidence("https://acme.com/our-team", "div a[href*='mailto:']", "x@acme.com")
+    contacts = [
+        Contact(
+            company="Acme", person_name=f"Person {chr(65 + i)}", role_title="Engineer",
+            contact_type=ContactType.EMAIL, contact_value=f"p{i}@acme.com",
+            evidence=ev, captured_at=_NOW,
+        )
+        for i in range(6)
+    ]
+    # Force the pool path for a small input
+    monkeypatch.setattr(export, "_PARALLEL_MIN_GROUPS", 1)
+
+    assert consolidate_per_person(contacts, workers=2) == consolidate_per_person(contacts)
@@ -115,3 +115,20 @@ def test_exporter_writes_decision_people_json_and_csv(tmp_path: Path, sample_peo
     }
     assert req_cols.issubset(set(rows_csv[0].keys()))
 
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_json_array_bytes_same_with_and_without_orjson(monkeypatch, sample_people, pretty: bool):
+    orjson = pytest.importorskip("orjson")
+    import io
+    from src.pipeline import export
+
+    rows = consolidate_per_person_with_evidence(sample_people, min_level=None)
+    rows[0]["person_name"] = "Zoë Łukasz"
+
+    def write(lib):
+        monkeypatch.setattr(export, "orjson", lib)
+        buf = io.BytesIO()
+        export._write_json_array(buf, rows, pretty=pretty, default=str)
+        return buf.getvalue()
+
+    assert write(orjson) == write(None)
@@ -53,3 +53,7 @@ def test_normalize_url_for_report():
     u = "https://www.Example.com/team/?x=1#y"
     assert normalize_url_for_report(u) == "https://example.com/team"
 
+    assert normalize_url_for_report("HTTP://WWW.Example.com:8080/a//#top") == "http://example.com:8080/a"
+    assert normalize_url_for_report("https://example.com/") == "https://example.com/"
+    # Non-http(s) input falls back to urlsplit handling
+    assert normalize_url_for_report("mailto:jane@acme.com?subject=hi") == "mailto:jane@acme.com"
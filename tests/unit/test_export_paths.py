@@ -44,3 +44,15 @@ def test_to_csv_and_json_use_normalized_source_url(tmp_path: Path):
         data = json.load(f)
         assert data[0]['evidence']['source_url'] == "https://example.com/team"
 
+
+def test_people_exports_stream_from_iterables(tmp_path: Path):
+    exporter = ContactExporter(output_dir=tmp_path)
+    rows = [{"company": "Acme", "person_name": f"P{i}", "email": f"p{i}@acme.com"} for i in range(3)]
+
+    json_path = exporter.to_people_json((r for r in rows), filename="people.json")
+    csv_path = exporter.to_people_csv(iter(rows), filename="people.csv")
+
+    # Streamed JSON is byte-identical to a single json.dump of the list
+    assert json_path.read_text(encoding='utf-8') == json.dumps(rows, indent=2, ensure_ascii=False)
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        assert [r['person_name'] for r in csv.DictReader(f)] == ["P0", "P1", "P2"]
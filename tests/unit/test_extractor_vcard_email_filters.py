@@ -7,7 +7,7 @@ from src.evidence.builder import EvidenceBuilder
 from src.schemas import ContactType
 
 
-def test_vcard_requires_name_tokens():
+def test_vcard_requires_name_tokens(tmp_path):
     html = '''<html><body>
     <div class="team-member">
       <h3>Diana Alsabe</h3>
@@ -16,7 +16,7 @@ def test_vcard_requires_name_tokens():
     </div>
     </body></html>'''
 
-    eb = EvidenceBuilder(parser_version="0.1.0-test")
+    eb = EvidenceBuilder(parser_version="0.1.0-test", screenshot_dir=tmp_path)
     extractor = ContactExtractor(evidence_builder=eb, aggressive_static=True)
 
     contacts = extractor.extract_from_static_html(html, "https://example.com/our-team")
@@ -25,7 +25,7 @@ def test_vcard_requires_name_tokens():
     assert all(c.contact_type != ContactType.LINK for c in contacts), "vCard with foreign name should be skipped"
 
 
-def test_no_global_contains_at_email_outside_card():
+def test_no_global_contains_at_email_outside_card(tmp_path):
     # One person card without mailto, with email only in footer outside card; one person with in-card text email
     html = '''<html><body>
     <div class="team-member">
@@ -41,7 +41,7 @@ def test_no_global_contains_at_email_outside_card():
     </footer>
     </body></html>'''
 
-    eb = EvidenceBuilder(parser_version="0.1.0-test")
+    eb = EvidenceBuilder(parser_version="0.1.0-test", screenshot_dir=tmp_path)
     extractor = ContactExtractor(evidence_builder=eb, aggressive_static=True)
 
     contacts = extractor.extract_from_static_html(html, "https://example.com/team")
@@ -53,7 +53,7 @@ def test_no_global_contains_at_email_outside_card():
     assert emails[0].contact_value.endswith("@example.com")
 
 
-def test_non_person_names_filtered():
+def test_non_person_names_filtered(tmp_path):
     html = '''<html><body>
     <div class="team-member">
       <h3>Mailing Address</h3>
@@ -66,7 +66,7 @@ def test_non_person_names_filtered():
     </div>
     </body></html>'''
 
-    eb = EvidenceBuilder(parser_version="0.1.0-test")
+    eb = EvidenceBuilder(parser_version="0.1.0-test", screenshot_dir=tmp_path)
     extractor = ContactExtractor(evidence_builder=eb, aggressive_static=False)
 
     contacts = extractor.extract_from_static_html(html, "https://example.com/team")
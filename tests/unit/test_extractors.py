@@ -119,6 +119,29 @@ class TestContactExtractor:
         assert emails[0][0] == 'jane.smith@example.com'
         assert 'mailto:' in emails[0][1]  # Should include selector info
     
+    def test_extract_emails_static_strips_mailto_params(self):
+        """Test mailto query strings are dropped and broken hrefs skipped."""
+        html = '''<div class="person">
+            <a href="mailto:Jane.Smith@Example.com?subject=Hi">Email Jane</a>
+            <a href="mailto:broken">Email</a>
+        </div>'''
+        
+        person_node = HTMLParser(html).css_first('.person')
+        
+        emails = self.extractor._extract_emails_static(person_node)
+        assert [e for e, _ in emails] == ['jane.smith@example.com']
+    
+    def test_role_after_br_in_name_paragraph(self):
+        """Test role is read from the segment after <br> in the name's paragraph."""
+        html = '''<div class="person">
+            <p><strong>Jane Smith</strong><br>Managing Partner<br>Chicago</p>
+        </div>'''
+        
+        root = HTMLParser(html).css_first('.person')
+        name_node = root.css_first('strong')
+        
+        assert self.extractor._extract_role_near_name_static(root, name_node) == "Managing Partner"
+    
     def test_extract_phones_static_from_tel(self):
         """Test phone extraction from tel links in static HTML."""
         html = '''<div class="person">
@@ -250,6 +273,35 @@ class TestContactExtractor:
                 assert hasattr(contact, 'person_name')
                 assert hasattr(contact, 'contact_type')
     
+    def test_playwright_anchor_pairs_batch_and_fallback(self):
+        """Test anchor href/text come from one page call unless the match count changed."""
+        mock_page = Mock(spec=Page)
+        mock_page.eval_on_selector_all.return_value = [["mailto:a@example.com", " A "], [None, None]]
+        anchors = [Mock(), Mock()]
+
+        pairs = self.extractor._anchor_pairs_playwright(mock_page, "a[href^='mailto']", anchors)
+
+        assert pairs == [("mailto:a@example.com", " A "), ("", "")]
+        assert self.extractor._anchor_pairs_playwright(mock_page, "a[href^='mailto']", anchors[:1]) is None
+        for a in anchors:
+            a.get_attribute.assert_not_called()
+
+    def test_playwright_xdom_context_reads_anchors_in_one_call(self):
+        """Test mailto anchors and footer text are read in bulk, not per element."""
+        mock_page = Mock(spec=Page)
+        mock_page.eval_on_selector_all.return_value = [
+            ["mailto:a@partner.com", "Email A"],
+            ["mailto:broken", "b@partner.com"],
+        ]
+        mock_page.locator.return_value.all_text_contents.return_value = ["Contact: info@partner.com", ""]
+        
+        self.extractor._xdom_prepare_context_playwright(mock_page, 'https://example.com/team')
+        
+        mock_page.eval_on_selector_all.assert_called_once()
+        mock_page.query_selector_all.assert_not_called()
+        assert self.extractor._page_mailto_counts == {"partner.com": 2}
+        assert self.extractor._xdom_domain_in_footer_or_contacts("partner.com")
+    
     def test_no_contacts_when_no_person_name(self):
         """Test that no contacts are extracted when person name is missing."""
         html = '''<div class="team-member">
@@ -261,3 +313,32 @@ class TestContactExtractor:
         
         # Should not extract contacts without person names
         assert len(contacts) == 0
+    
+    def test_deobfuscate_email_with_long_whitespace_runs(self):
+        """Test whitespace padding around obfuscation tokens is handled in linear time."""
+        pad = " " * 100_000
+        text = f"john{pad}(at){pad}example{pad}(dot){pad}com{pad}"
+
+        assert self.extractor._deobfuscate_email(text) == "john@example.com"
+
+    def test_page_without_contact_signals_is_not_parsed(self):
+        """Test challenge pages with no anchors, emails or digits short-circuit."""
+        html = "<title>Just a moment...</title><div>Enable JavaScript and cookies to continue</div>"
+        
+        with patch('src.pipeline.extractors.HTMLParser') as parser_cls:
+            contacts = self.extractor.extract_from_static_html(html, 'https://example.com/team')
+        
+        assert contacts == []
+        parser_cls.assert_not_called()
+        self.mock_evidence_builder.freeze_clock.assert_not_called()
+
+    def test_profile_follow_state_reset_when_extraction_raises(self):
+        """Test the D=1 budget and queue are cleared even if the page body raises."""
+        html = '<html><body><div class="person"><h3>Jane Smith</h3><a href="mailto:jane@example.com">x</a></div></body></html>'
+        
+        with patch.object(self.extractor, '_extract_company_name_static', side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError):
+                self.extractor.extract_from_static_html(html, 'https://example.com/team')
+        
+        assert self.extractor._d1_budget is None
+        assert self.extractor._d1_pending is None
@@ -1,5 +1,4 @@
 import os
-from pathlib import Path
 from typing import List, Union
 
 import pytest
@@ -11,8 +10,7 @@ from src.schemas import ContactType
 
 class DummyEvidenceBuilder(EvidenceBuilder):
     def _capture_element_screenshot(self, page, element, url, selector):  # type: ignore[override]
-        p = Path("evidence/test_fast_sweep.png")
-        p.parent.mkdir(parents=True, exist_ok=True)
+        p = self.screenshot_dir / "test_fast_sweep.png"
         p.write_bytes(b"png")
         return p
 
@@ -82,9 +80,9 @@ class StubPage:
     # The extractor falls back to hostname from URL.
 
 
-def test_playwright_fast_sweep_email_and_phone():
+def test_playwright_fast_sweep_email_and_phone(tmp_path):
     # Arrange
-    builder = DummyEvidenceBuilder()
+    builder = DummyEvidenceBuilder(screenshot_dir=tmp_path)
     extractor = ContactExtractor(evidence_builder=builder)
 
     container = StubContainer(heading_text="John Doe")
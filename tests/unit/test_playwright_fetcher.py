@@ -1,28 +1,94 @@
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from src.pipeline.fetchers.playwright import PlaywrightFetcher, PlaywrightResult
 
-@patch('src.pipeline.fetchers.playwright.sync_playwright')
-def test_playwright_fetcher_success(mock_sync_playwright):
-    # Arrange
-    mock_page = MagicMock()
-    mock_response = MagicMock()
-    mock_response.status = 200
-    mock_page.goto.return_value = mock_response
-    mock_page.content.return_value = "<html><body>Test</body></html>"
-    mock_page.title.return_value = "Test Page"
 
-    mock_context = MagicMock()
-    mock_context.new_page.return_value = mock_page
+class _StubResponse:
+    def __init__(self, status: int):
+        self.status = status
+
+
+class _StubPage:
+    def __init__(self):
+        self.status = 200
+        self.respond = True
+        self.html = "<html></html>"
+        self.title_text = "Title"
+        self.selector_error = None
+        self.goto_calls = []
+        self.wait_for_selector_calls = 0
+
+    def goto(self, url, **kwargs):
+        self.goto_calls.append((url, kwargs))
+        return _StubResponse(self.status) if self.respond else None
+
+    def wait_for_selector(self, selector, **kwargs):
+        self.wait_for_selector_calls += 1
+        if self.selector_error is not None:
+            raise self.selector_error
+
+    def wait_for_timeout(self, ms):
+        pass
+
+    def content(self):
+        return self.html
+
+    def title(self):
+        return self.title_text
+
+
+class _StubBrowser:
+    def __init__(self, page: _StubPage):
+        self.page = page
+        self.close_calls = 0
+
+    def new_context(self, **kwargs):
+        return self
+
+    def new_page(self):
+        return self.page
 
-    mock_browser = MagicMock()
-    mock_browser.new_context.return_value = mock_context
+    def close(self):
+        self.close_calls += 1
 
-    mock_playwright = MagicMock()
-    mock_playwright.chromium.launch.return_value = mock_browser
 
-    mock_sync_playwright.return_value.__enter__.return_value = mock_playwright
+class _StubPlaywright:
+    """Minimal stand-in for the sync_playwright() context manager and its browser chain."""
+
+    def __init__(self):
+        self.page = _StubPage()
+        self.browser = _StubBrowser(self.page)
+        self.launch_error = None
+        self.chromium = self
+
+    def __call__(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def launch(self, **kwargs):
+        if self.launch_error is not None:
+            raise self.launch_error
+        return self.browser
+
+
+@pytest.fixture
+def playwright_stub():
+    stub = _StubPlaywright()
+    with patch('src.pipeline.fetchers.playwright.sync_playwright', stub):
+        yield stub
+
+
+def test_playwright_fetcher_success(playwright_stub):
+    # Arrange
+    page = playwright_stub.page
+    page.html = "<html><body>Test</body></html>"
+    page.title_text = "Test Page"
 
     fetcher = PlaywrightFetcher()
     url = "http://example.com"
@@ -35,24 +101,14 @@ def test_playwright_fetcher_success(mock_sync_playwright):
     assert result.html == "<html><body>Test</body></html>"
     assert result.page_title == "Test Page"
     assert result.error is None
-    mock_page.goto.assert_called_once_with(url, wait_until="load", timeout=20000)
-    mock_page.wait_for_selector.assert_called_once()
-    mock_browser.close.assert_called_once()
+    assert page.goto_calls == [(url, {"wait_until": "load", "timeout": 20000})]
+    assert page.wait_for_selector_calls == 1
+    assert playwright_stub.browser.close_calls == 1
 
 
-@patch('src.pipeline.fetchers.playwright.sync_playwright')
-def test_playwright_fetcher_no_response(mock_sync_playwright):
+def test_playwright_fetcher_no_response(playwright_stub):
     # Arrange
-    mock_page = MagicMock()
-    mock_page.goto.return_value = None  # Simulate no response
-
-    mock_context = MagicMock()
-    mock_context.new_page.return_value = mock_page
-    mock_browser = MagicMock()
-    mock_browser.new_context.return_value = mock_context
-    mock_playwright = MagicMock()
-    mock_playwright.chromium.launch.return_value = mock_browser
-    mock_sync_playwright.return_value.__enter__.return_value = mock_playwright
+    playwright_stub.page.respond = False  # Simulate no response
 
     fetcher = PlaywrightFetcher()
     url = "http://example.com"
@@ -64,28 +120,13 @@ def test_playwright_fetcher_no_response(mock_sync_playwright):
     assert result.status_code == 0
     assert result.html is None
     assert "No response received" in result.error
-    mock_browser.close.assert_called_once()
+    assert playwright_stub.browser.close_calls == 1
 
 
-@patch('src.pipeline.fetchers.playwright.sync_playwright')
-def test_playwright_fetcher_wait_for_selector_timeout(mock_sync_playwright):
+def test_playwright_fetcher_wait_for_selector_timeout(playwright_stub):
     # Arrange
-    mock_page = MagicMock()
-    mock_response = MagicMock()
-    mock_response.status = 200
-    mock_page.goto.return_value = mock_response
-    mock_page.content.return_value = "<html></html>"
-    mock_page.title.return_value = "Title"
     # Simulate a timeout on wait_for_selector
-    mock_page.wait_for_selector.side_effect = Exception("Timeout")
-
-    mock_context = MagicMock()
-    mock_context.new_page.return_value = mock_page
-    mock_browser = MagicMock()
-    mock_browser.new_context.return_value = mock_context
-    mock_playwright = MagicMock()
-    mock_playwright.chromium.launch.return_value = mock_browser
-    mock_sync_playwright.return_value.__enter__.return_value = mock_playwright
+    playwright_stub.page.selector_error = Exception("Timeout")
 
     fetcher = PlaywrightFetcher()
 
@@ -97,16 +138,13 @@ def test_playwright_fetcher_wait_for_selector_timeout(mock_sync_playwright):
     assert result.status_code == 200
     assert result.html == "<html></html>"
     assert result.error is None
-    mock_browser.close.assert_called_once()
+    assert playwright_stub.browser.close_calls == 1
 
 
-@patch('src.pipeline.fetchers.playwright.sync_playwright')
-def test_playwright_fetcher_general_exception(mock_sync_playwright):
+def test_playwright_fetcher_general_exception(playwright_stub):
     # Arrange
     # Simulate an exception during browser launch
-    mock_playwright = MagicMock()
-    mock_playwright.chromium.launch.side_effect = Exception("Launch failed")
-    mock_sync_playwright.return_value.__enter__.return_value = mock_playwright
+    playwright_stub.launch_error = Exception("Launch failed")
 
     fetcher = PlaywrightFetcher()
     url = "http://example.com"
@@ -47,3 +47,23 @@ def test_structural_hint_bumps_director():
     assert level >= DecisionLevel.VP_PLUS
     assert any(r == "struct:leadership" for r in reasons)
 
+
+@pytest.mark.parametrize(
+    "title, expected_reasons",
+    [
+        ("Managing Director & Partner", ["title:managing director", "title:director", "title:partner"]),
+        ("Cochair", ["title:co-chair"]),
+        ("Associate Counsel", ["exclude:counsel"]),
+    ],
+)
+def test_reasons_keep_pattern_order(title: str, expected_reasons: list[str]):
+    _, reasons = classify_role(title)
+    assert reasons == expected_reasons
+
+
+def test_cached_reasons_are_not_shared_between_calls():
+    _, reasons = classify_role("Partner", url_ctx="https://example.com/partners/a")
+    reasons.append("mutated")
+    level, again = classify_role(" partner ", url_ctx="https://example.com/partners/b")
+    assert level == DecisionLevel.VP_PLUS
+    assert again == ["title:partner", "struct:partners"]
@@ -1,32 +1,10 @@
-import os
-import sys
-import time
-import types
-import importlib.util
-from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-SCRIPT_PATH = REPO_ROOT / "scripts" / "smtp_probe.py"
-
-
-def load_module_or_skip() -> types.ModuleType:
-    if not SCRIPT_PATH.exists():
-        pytest.skip("scripts/smtp_probe.py not implemented yet")
-    spec = importlib.util.spec_from_file_location("smtp_probe", str(SCRIPT_PATH))
-    module = importlib.util.module_from_spec(spec)
-    assert spec and spec.loader
-    # Ensure module is visible to dataclasses/type resolution during exec
-    sys.modules[spec.name] = module  # type: ignore[index]
-    spec.loader.exec_module(module)  # type: ignore[attr-defined]
-    return module
-
-
-def test_validate_email_and_parse_domain():
-    sp = load_module_or_skip()
+def test_validate_email_and_parse_domain(smtp_probe_module):
+    sp = smtp_probe_module
 
     assert sp.validate_email("user@example.com") is True
     assert sp.validate_email("bad@") is False
@@ -37,8 +15,8 @@ def test_validate_email_and_parse_domain():
         sp.parse_domain("no-at-symbol")
 
 
-def test_should_skip_domain():
-    sp = load_module_or_skip()
+def test_should_skip_domain(smtp_probe_module):
+    sp = smtp_probe_module
 
     assert sp.should_skip_domain("gmail.com") is True
     assert sp.should_skip_domain("outlook.com") is True
@@ -53,8 +31,8 @@ def _result_get(res: object, key: str):
 
 
 @patch("smtplib.SMTP")
-def test_probe_rcpt_accepts(mock_smtp):
-    sp = load_module_or_skip()
+def test_probe_rcpt_accepts(mock_smtp, smtp_probe_module):
+    sp = smtp_probe_module
 
     smtp = MagicMock()
     mock_smtp.return_value.__enter__.return_value = smtp
@@ -70,8 +48,8 @@ def test_probe_rcpt_accepts(mock_smtp):
 
 
 @patch("smtplib.SMTP")
-def test_probe_rcpt_temp_fail_4xx(mock_smtp):
-    sp = load_module_or_skip()
+def test_probe_rcpt_temp_fail_4xx(mock_smtp, smtp_probe_module):
+    sp = smtp_probe_module
 
     smtp = MagicMock()
     mock_smtp.return_value.__enter__.return_value = smtp
@@ -87,8 +65,8 @@ def test_probe_rcpt_temp_fail_4xx(mock_smtp):
 
 
 @patch("smtplib.SMTP")
-def test_probe_rcpt_perm_fail_5xx(mock_smtp):
-    sp = load_module_or_skip()
+def test_probe_rcpt_perm_fail_5xx(mock_smtp, smtp_probe_module):
+    sp = smtp_probe_module
 
     smtp = MagicMock()
     mock_smtp.return_value.__enter__.return_value = smtp
@@ -101,3 +79,25 @@ def test_probe_rcpt_perm_fail_5xx(mock_smtp):
     assert _result_get(res, "accepts_rcpt") is False
     assert _result_get(res, "smtp_code") == 550
     assert _result_get(res, "error_category") == "perm"
+
+
+@patch("smtplib.SMTP")
+def test_probe_rcpt_session_reuses_connection(mock_smtp, smtp_probe_module):
+    sp = smtp_probe_module
+
+    smtp = mock_smtp.return_value
+    smtp.has_extn.return_value = False
+    smtp.rcpt.return_value = (250, b"Accepted")
+
+    session = sp.SmtpSession()
+    first = sp.probe_rcpt("mx.example.com", "a@example.com", timeout=3, session=session)
+    # A dropped idle connection is replaced transparently
+    smtp.mail.side_effect = [Exception("disconnected"), (250, b"OK")]
+    second = sp.probe_rcpt("mx.example.com", "b@example.com", timeout=3, session=session)
+    session.close()
+
+    assert _result_get(first, "accepts_rcpt") is True
+    assert _result_get(second, "accepts_rcpt") is True
+    assert mock_smtp.call_count == 2
+    assert smtp.rset.call_count == 2
+    assert smtp.quit.call_count == 2
@@ -16,26 +16,39 @@ def run_cli(args, env=None):
     return run([sys.executable, SCRIPT] + args, stdout=PIPE, stderr=PIPE, env=e, text=True)
 
 
+@pytest.mark.serial
 def test_cli_no_input_exit2():
+    # Only subprocess test: covers the __main__ entry point and argparse wiring
     r = run_cli([])
     assert r.returncode == 2
 
 
-def test_cli_email_no_mx_outputs_json(tmp_path):
+def test_cli_email_no_mx_outputs_json(tmp_path, monkeypatch, smtp_probe_module):
+    monkeypatch.setattr(smtp_probe_module, "_cache_path", lambda: str(tmp_path / ".egc_cache.db"))
+    monkeypatch.setattr(smtp_probe_module, "resolve_mx", lambda domain: [])
     out = tmp_path / "probe.json"
-    r = run_cli(["--email", "user@example.com", "--out", str(out)])
-    assert r.returncode == 0
+    rc = smtp_probe_module.main(["--email", "user@example.com", "--out", str(out)])
+    assert rc == 0
     data = json.loads(out.read_text())
     assert isinstance(data, list) and len(data) == 1
     assert data[0]["email"] == "user@example.com"
     assert "mx_found" in data[0]
 
 
-def test_cli_skip_free_default_policy(tmp_path):
+def test_cli_skip_free_default_policy(tmp_path, monkeypatch, smtp_probe_module):
+    monkeypatch.setattr(smtp_probe_module, "_cache_path", lambda: str(tmp_path / ".egc_cache.db"))
+    monkeypatch.delenv("EGC_SKIP_FREE", raising=False)
     out = tmp_path / "probe.json"
-    r = run_cli(["--email", "user@gmail.com", "--out", str(out)])
-    assert r.returncode == 0
+    rc = smtp_probe_module.main(["--email", "user@gmail.com", "--out", str(out)])
+    assert rc == 0
     data = json.loads(out.read_text())
     assert data[0]["error_category"] == "policy"
     assert data[0]["accepts_rcpt"] is False
 
+
+def test_json_output_same_with_and_without_orjson(monkeypatch, smtp_probe_module):
+    orjson = pytest.importorskip("orjson")
+    rows = [{"email": "zoë@example.com", "status": "unknown", "mx": None, "code": 0}]
+    fast = smtp_probe_module._dumps(rows)
+    monkeypatch.setattr(smtp_probe_module, "orjson", None)
+    assert smtp_probe_module._dumps(rows) == fast == orjson.dumps(rows)
@@ -1,30 +1,12 @@
 import json
-from pathlib import Path
+import sqlite3
 from unittest.mock import patch
 
 import pytest
 
-# Paths
-REPO = Path(__file__).resolve().parents[2]
-SCRIPT = REPO / "scripts" / "smtp_probe.py"
 
-smtp_mod = None
-
-
-def _load():
-    global smtp_mod
-    if smtp_mod is None:
-        import importlib.util, sys
-        spec = importlib.util.spec_from_file_location("smtp_probe", str(SCRIPT))
-        mod = importlib.util.module_from_spec(spec)
-        sys.modules[spec.name] = mod  # required for dataclasses on Py3.9
-        spec.loader.exec_module(mod)  # type: ignore
-        smtp_mod = mod
-    return smtp_mod
-
-
-def test_cache_roundtrip_and_main_uses_cached_hosts(tmp_path, monkeypatch):
-    sp = _load()
+def test_cache_roundtrip_and_main_uses_cached_hosts(tmp_path, monkeypatch, smtp_probe_module):
+    sp = smtp_probe_module
 
     cache_file = tmp_path / ".egc_cache.db"
     monkeypatch.setattr(sp, "_cache_path", lambda: str(cache_file))
@@ -44,8 +26,8 @@ def test_cache_roundtrip_and_main_uses_cached_hosts(tmp_path, monkeypatch):
 
 
 @patch("smtp_probe.resolve_mx")
-def test_main_no_mx_found(mock_resolve, tmp_path, monkeypatch):
-    sp = _load()
+def test_main_no_mx_found(mock_resolve, tmp_path, monkeypatch, smtp_probe_module):
+    sp = smtp_probe_module
 
     mock_resolve.return_value = []
     cache_file = tmp_path / ".egc_cache.db"
@@ -57,3 +39,53 @@ def test_main_no_mx_found(mock_resolve, tmp_path, monkeypatch):
     assert data[0]["mx_found"] is False
     assert data[0]["error_category"] == "network"
 
+
+@patch("smtp_probe.resolve_mx")
+def test_empty_mx_answer_is_cached(mock_resolve, tmp_path, monkeypatch, smtp_probe_module):
+    sp = smtp_probe_module
+
+    mock_resolve.return_value = []
+    cache_file = tmp_path / ".egc_cache.db"
+    monkeypatch.setattr(sp, "_cache_path", lambda: str(cache_file))
+    emails_file = tmp_path / "emails.txt"
+    emails_file.write_text("a@example.com\nb@example.com\n")
+
+    for run in range(2):
+        rc = sp.main(["--emails-file", str(emails_file), "--out", str(tmp_path / f"out{run}.json")])
+        assert rc == 0
+        data = json.loads((tmp_path / f"out{run}.json").read_text())
+        assert [r["mx_found"] for r in data] == [False, False]
+
+    # Resolved once for both addresses and both runs
+    assert mock_resolve.call_count == 1
+
+
+@patch("smtp_probe.resolve_mx")
+def test_empty_mx_answer_not_cached_with_zero_ttl(mock_resolve, tmp_path, monkeypatch, smtp_probe_module):
+    sp = smtp_probe_module
+
+    mock_resolve.return_value = []
+    monkeypatch.setattr(sp, "_cache_path", lambda: str(tmp_path / ".egc_cache.db"))
+
+    for run in range(2):
+        rc = sp.main(["--email", "a@example.com", "--mx-ttl-days", "0", "--out", str(tmp_path / f"out{run}.json")])
+        assert rc == 0
+
+    assert mock_resolve.call_count == 2
+
+
+@patch("smtp_probe.resolve_mx")
+def test_main_closes_cache_connections(mock_resolve, tmp_path, monkeypatch, smtp_probe_module):
+    sp = smtp_probe_module
+
+    mock_resolve.return_value = []
+    monkeypatch.setattr(sp, "_cache_path", lambda: str(tmp_path / ".egc_cache.db"))
+    opened = []
+    connect = sp._connect
+    monkeypatch.setattr(sp, "_connect", lambda db_path: opened.append(connect(db_path)) or opened[-1])
+
+    rc = sp.main(["--email", "a@example.com", "--out", str(tmp_path / "out.json")])
+    assert rc == 0
+    assert opened and sp._conns == {}
+    with pytest.raises(sqlite3.ProgrammingError):
+        opened[-1].execute("SELECT 1")
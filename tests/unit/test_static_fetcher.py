@@ -52,3 +52,28 @@ def test_static_fetch_blocks_when_robots_disallow(monkeypatch):
     assert res.blocked_by_robots is True
     assert res.html is None
     assert res.status_code == 0
+
+
+def test_static_fetch_reads_robots_once_per_origin():
+    routes = {
+        "https://example.com/robots.txt": (200, {"Content-Type": "text/plain"}, b"User-agent: *\nDisallow: /secret\n"),
+        "https://example.com/team": (200, {"Content-Type": "text/html"}, b"<html>Team</html>"),
+        "https://example.com/about": (200, {"Content-Type": "text/html"}, b"<html>About</html>"),
+    }
+    transport = _MockTransport(routes)
+    requested: list[str] = []
+    handle = transport.handle_request
+
+    def counting_handle(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        return handle(request)
+
+    transport.handle_request = counting_handle  # type: ignore[method-assign]
+
+    fetcher = StaticFetcher(respect_robots=True)
+    fetcher._client = httpx.Client(transport=transport)
+
+    assert fetcher.fetch("https://example.com/team").status_code == 200
+    assert fetcher.fetch("https://example.com/about").status_code == 200
+    assert fetcher.fetch("https://example.com/secret").blocked_by_robots is True
+    assert requested.count("https://example.com/robots.txt") == 1